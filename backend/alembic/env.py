@@ -17,6 +17,10 @@ load_dotenv()
 # Import our models and database configuration
 from app.db.database import Base
 from app.models.task import Task  # Import all models to ensure they're registered
+from app.models.task_archive import TaskArchive
+from app.models.job import Job
+from app.models.cache_invalidation import CacheInvalidation
+from app.db.sqlite import SEARCH_INDEX_TABLE
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -34,6 +38,14 @@ if config.config_file_name is not None:
 # for 'autogenerate' support
 target_metadata = Base.metadata
 
+
+def include_object(object, name, type_, reflected, compare_to):
+    """Leave the SQLite FTS5 search index and its shadow tables out of autogenerate"""
+    if type_ == "table" and reflected and compare_to is None:
+        return not (name == SEARCH_INDEX_TABLE or name.startswith(f"{SEARCH_INDEX_TABLE}_"))
+    return True
+
+
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
@@ -58,6 +70,7 @@ def run_migrations_offline() -> None:
         target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
+        include_object=include_object,
     )
 
     with context.begin_transaction():
@@ -79,7 +92,7 @@ def run_migrations_online() -> None:
 
     with connectable.connect() as connection:
         context.configure(
-            connection=connection, target_metadata=target_metadata
+            connection=connection, target_metadata=target_metadata, include_object=include_object
         )
 
         with context.begin_transaction():
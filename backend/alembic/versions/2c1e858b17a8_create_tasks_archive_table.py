@@ -0,0 +1,41 @@
+"""Create tasks_archive table
+
+Revision ID: 2c1e858b17a8
+Revises: 88650cdfcb87
+Create Date: 2026-10-19 10:40:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2c1e858b17a8'
+down_revision: Union[str, None] = '88650cdfcb87'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Cold storage for soft-deleted tasks moved out by the archival job
+    op.create_table('tasks_archive',
+        sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column('title', sa.String(length=255), nullable=False),
+        sa.Column('description', sa.Text(), nullable=True),
+        sa.Column('is_deleted', sa.Boolean(), nullable=False, default=True),
+        sa.Column('modification_count', sa.Integer(), nullable=False, default=0),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('archived_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.PrimaryKeyConstraint('id')
+    )
+
+    # Lets the archival job find old soft-deleted tasks without a scan
+    op.create_index('ix_tasks_is_deleted_updated_at', 'tasks', ['is_deleted', 'updated_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_tasks_is_deleted_updated_at', table_name='tasks')
+    op.drop_table('tasks_archive')
@@ -0,0 +1,45 @@
+"""Create jobs table
+
+Revision ID: 5f3a9d2c7e41
+Revises: bdeb02b87f0a
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5f3a9d2c7e41'
+down_revision: Union[str, None] = 'bdeb02b87f0a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Persistent state of background jobs (POST /jobs)
+    op.create_table('jobs',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('operation', sa.String(length=50), nullable=False),
+        sa.Column('status', sa.String(length=20), nullable=False, default='queued'),
+        sa.Column('params', sa.JSON(), nullable=False),
+        sa.Column('result', sa.JSON(), nullable=True),
+        sa.Column('error', sa.Text(), nullable=True),
+        sa.Column('processed', sa.Integer(), nullable=False, default=0),
+        sa.Column('total', sa.Integer(), nullable=True),
+        sa.Column('cancel_requested', sa.Boolean(), nullable=False, default=False),
+        sa.Column('claimed_by', sa.String(length=100), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column('started_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('finished_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_jobs_status_created_at', 'jobs', ['status', 'created_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_jobs_status_created_at', table_name='jobs')
+    op.drop_table('jobs')
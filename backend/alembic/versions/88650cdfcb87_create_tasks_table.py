@@ -27,8 +27,8 @@ def upgrade() -> None:
         sa.Column('is_completed', sa.Boolean(), nullable=False, default=False),
         sa.Column('is_deleted', sa.Boolean(), nullable=False, default=False),
         sa.Column('modification_count', sa.Integer(), nullable=False, default=0),
-        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
-        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
         sa.PrimaryKeyConstraint('id')
     )
     
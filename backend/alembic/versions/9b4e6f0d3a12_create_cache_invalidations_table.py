@@ -0,0 +1,36 @@
+"""Create cache_invalidations table
+
+Revision ID: 9b4e6f0d3a12
+Revises: 5f3a9d2c7e41
+Create Date: 2026-10-19 12:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9b4e6f0d3a12'
+down_revision: Union[str, None] = '5f3a9d2c7e41'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Database-backed cache invalidation bus for multi-worker deployments
+    op.create_table('cache_invalidations',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('channel', sa.String(length=50), nullable=False),
+        sa.Column('keys', sa.JSON(), nullable=True),
+        sa.Column('origin', sa.String(length=100), nullable=False),
+        sa.Column('published_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_cache_invalidations_published_at'), 'cache_invalidations', ['published_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_cache_invalidations_published_at'), table_name='cache_invalidations')
+    op.drop_table('cache_invalidations')
@@ -0,0 +1,47 @@
+"""Add task search indexes and archive the completion flag
+
+Revision ID: a7d9e3c5f281
+Revises: f2a6c8d4b713
+Create Date: 2026-10-19 19:00:00.000000
+
+Every filter/sort combination of /tasks/search that TaskService.plan_search
+accepts without a residual scan is served by one of these indexes (or the
+tenant indexes of e1d3b5a7c902). tasks.is_completed exists since
+88650cdfcb87; archived tasks now keep it too.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7d9e3c5f281'
+down_revision: Union[str, None] = 'f2a6c8d4b713'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Search sort keys, behind the completion flag when it is filtered on
+SEARCH_INDEXES = {
+    'ix_tasks_tenant_deleted_updated': ['tenant_id', 'is_deleted', 'updated_at'],
+    'ix_tasks_tenant_deleted_completed_created': ['tenant_id', 'is_deleted', 'is_completed', 'created_at'],
+    'ix_tasks_tenant_deleted_completed_updated': ['tenant_id', 'is_deleted', 'is_completed', 'updated_at'],
+    'ix_tasks_tenant_deleted_completed_modifications': [
+        'tenant_id', 'is_deleted', 'is_completed', 'modification_count'
+    ],
+}
+
+
+def upgrade() -> None:
+    # Archived tasks keep their completion state for restores
+    op.add_column('tasks_archive', sa.Column('is_completed', sa.Boolean(), server_default=sa.false(), nullable=False))
+
+    for name, columns in SEARCH_INDEXES.items():
+        op.create_index(name, 'tasks', columns, unique=False)
+
+
+def downgrade() -> None:
+    for name in reversed(list(SEARCH_INDEXES)):
+        op.drop_index(name, table_name='tasks')
+    op.drop_column('tasks_archive', 'is_completed')
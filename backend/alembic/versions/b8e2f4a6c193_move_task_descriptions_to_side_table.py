@@ -0,0 +1,133 @@
+"""Move task descriptions into task_descriptions
+
+Revision ID: b8e2f4a6c193
+Revises: a7d9e3c5f281
+Create Date: 2026-10-19 21:00:00.000000
+
+Listing, search and aggregate queries scan tasks without needing the
+description, so it moves to a side table keyed by task ID (compressed
+when large, see app.models.task_description). Archived tasks keep theirs
+there too. Existing descriptions are copied in primary-key chunks, so the
+copy never holds more than one chunk in memory and the source tables are
+read through their primary key only.
+
+The encoding is frozen here (zlib from 256 bytes) rather than taken from
+the app, so the migration writes the same rows whatever the app code or
+TASK_DESCRIPTION_COMPRESS_MIN_BYTES say later; the app decodes either
+form, and ``python -m app.db.backfill run task_descriptions`` re-encodes
+with the current setting.
+
+"""
+import zlib
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b8e2f4a6c193'
+down_revision: Union[str, None] = 'a7d9e3c5f281'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Rows copied per statement
+CHUNK_SIZE = 5000
+
+SOURCE_TABLES = ('tasks', 'tasks_archive')
+
+# Descriptions of at least this many bytes are stored zlib-compressed
+COMPRESS_MIN_BYTES = 256
+
+descriptions = sa.table(
+    'task_descriptions',
+    sa.column('task_id', sa.Integer()),
+    sa.column('is_compressed', sa.Boolean()),
+    sa.column('body', sa.LargeBinary()),
+)
+
+
+def _source(name: str) -> sa.TableClause:
+    return sa.table(name, sa.column('id', sa.Integer()), sa.column('description', sa.Text()))
+
+
+def _description_row(task_id: int, text: str) -> dict:
+    raw = text.encode('utf-8')
+    if len(raw) >= COMPRESS_MIN_BYTES:
+        compressed = zlib.compress(raw, 6)
+        if len(compressed) < len(raw):
+            return {'task_id': task_id, 'is_compressed': True, 'body': compressed}
+    return {'task_id': task_id, 'is_compressed': False, 'body': raw}
+
+
+def _description_text(is_compressed: bool, body: bytes) -> str:
+    return (zlib.decompress(body) if is_compressed else body).decode('utf-8')
+
+
+def _require_online(action: str) -> None:
+    # Descriptions are re-encoded in Python; plain SQL can't do that portably
+    if context.is_offline_mode():
+        raise RuntimeError(f"{action} task descriptions needs a database connection (no --sql mode)")
+
+
+def _copy_out(name: str) -> None:
+    """Copy one table's descriptions into task_descriptions in ID order"""
+    bind = op.get_bind()
+    source = _source(name)
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.select(source.c.id, source.c.description)
+            .where(source.c.id > last_id, source.c.description.isnot(None))
+            .order_by(source.c.id)
+            .limit(CHUNK_SIZE)
+        ).all()
+        if not rows:
+            return
+        last_id = rows[-1][0]
+        bind.execute(sa.insert(descriptions), [_description_row(task_id, text) for task_id, text in rows])
+
+
+def _copy_back(name: str) -> None:
+    """Write task_descriptions back into one table's description column"""
+    bind = op.get_bind()
+    source = _source(name)
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.select(descriptions.c.task_id, descriptions.c.is_compressed, descriptions.c.body)
+            .where(descriptions.c.task_id > last_id, descriptions.c.task_id.in_(sa.select(source.c.id)))
+            .order_by(descriptions.c.task_id)
+            .limit(CHUNK_SIZE)
+        ).all()
+        if not rows:
+            return
+        last_id = rows[-1][0]
+        bind.execute(
+            sa.update(source).where(source.c.id == sa.bindparam('task_id')).values(description=sa.bindparam('text')),
+            [
+                {'task_id': task_id, 'text': _description_text(is_compressed, body)}
+                for task_id, is_compressed, body in rows
+            ]
+        )
+
+
+def upgrade() -> None:
+    _require_online('Moving')
+    op.create_table('task_descriptions',
+        sa.Column('task_id', sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column('is_compressed', sa.Boolean(), nullable=False),
+        sa.Column('body', sa.LargeBinary(), nullable=False),
+        sa.PrimaryKeyConstraint('task_id')
+    )
+    for name in SOURCE_TABLES:
+        _copy_out(name)
+        op.drop_column(name, 'description')
+
+
+def downgrade() -> None:
+    _require_online('Moving back')
+    for name in SOURCE_TABLES:
+        op.add_column(name, sa.Column('description', sa.Text(), nullable=True))
+        _copy_back(name)
+    op.drop_table('task_descriptions')
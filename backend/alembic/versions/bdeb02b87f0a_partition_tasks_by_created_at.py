@@ -0,0 +1,64 @@
+"""Partition tasks by created_at month
+
+Revision ID: bdeb02b87f0a
+Revises: 2c1e858b17a8
+Create Date: 2026-10-19 11:00:00.000000
+
+Opt-in: the table is only partitioned on MySQL/MariaDB and when
+TASKS_PARTITIONING=true is set while running the migration. The
+created_at index is added everywhere.
+
+"""
+from datetime import datetime, timezone
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+from app.db.partitions import (
+    TASKS_PARTITIONING, PARTITION_MONTHS_AHEAD, add_months, build_partition_clause, is_partitioned,
+    month_start
+)
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'bdeb02b87f0a'
+down_revision: Union[str, None] = '2c1e858b17a8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _partitioning_enabled() -> bool:
+    return TASKS_PARTITIONING and op.get_bind().dialect.name in ("mysql", "mariadb")
+
+
+def upgrade() -> None:
+    # Time-filtered list/search/trends queries
+    op.create_index('ix_tasks_created_at', 'tasks', ['created_at'], unique=False)
+
+    if not _partitioning_enabled():
+        return
+
+    # First partition starts at the oldest existing row (offline: this month)
+    this_month = month_start(datetime.now(timezone.utc).date())
+    first_month = this_month
+    if not context.is_offline_mode():
+        oldest = op.get_bind().execute(sa.text("SELECT MIN(created_at) FROM tasks")).scalar()
+        if oldest is not None:
+            first_month = month_start(oldest.date() if isinstance(oldest, datetime) else oldest)
+
+    # The partitioning column must be part of every unique key
+    op.execute("ALTER TABLE tasks DROP PRIMARY KEY, ADD PRIMARY KEY (id, created_at)")
+    op.execute(
+        "ALTER TABLE tasks "
+        + build_partition_clause(first_month, add_months(this_month, PARTITION_MONTHS_AHEAD))
+    )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name in ("mysql", "mariadb") and not context.is_offline_mode() and is_partitioned(bind):
+        op.execute("ALTER TABLE tasks REMOVE PARTITIONING")
+        op.execute("ALTER TABLE tasks DROP PRIMARY KEY, ADD PRIMARY KEY (id)")
+
+    op.drop_index('ix_tasks_created_at', table_name='tasks')
@@ -0,0 +1,39 @@
+"""Create backfill_checkpoints table
+
+Revision ID: c3f5a7e9b214
+Revises: b8e2f4a6c193
+Create Date: 2026-10-19 22:00:00.000000
+
+Progress of resumable backfills run by later migrations or
+``python -m app.db.backfill`` (see app.db.backfill).
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3f5a7e9b214'
+down_revision: Union[str, None] = 'b8e2f4a6c193'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('backfill_checkpoints',
+        sa.Column('name', sa.String(length=100), nullable=False),
+        sa.Column('table_name', sa.String(length=100), nullable=False),
+        sa.Column('last_key', sa.BigInteger(), nullable=True),
+        sa.Column('rows_written', sa.BigInteger(), nullable=False),
+        sa.Column('chunks', sa.Integer(), nullable=False),
+        sa.Column('started_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column('finished_at', sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint('name')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('backfill_checkpoints')
@@ -0,0 +1,35 @@
+"""Add FTS5 title search index (SQLite)
+
+Revision ID: c4a7e2f19b05
+Revises: 9b4e6f0d3a12
+Create Date: 2026-10-19 15:00:00.000000
+
+Only applies to SQLite (3.34+ for the trigram tokenizer); a no-op on
+MySQL, which keeps using the title LIKE search.
+
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+
+from app.db.sqlite import create_search_index, drop_search_index
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4a7e2f19b05'
+down_revision: Union[str, None] = '9b4e6f0d3a12'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    if context.is_offline_mode():
+        return
+    # Virtual table, sync triggers and an initial rebuild from tasks
+    create_search_index(op.get_bind())
+
+
+def downgrade() -> None:
+    if context.is_offline_mode():
+        return
+    drop_search_index(op.get_bind())
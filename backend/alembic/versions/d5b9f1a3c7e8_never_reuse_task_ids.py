@@ -0,0 +1,68 @@
+"""Never reuse task IDs (SQLite)
+
+Revision ID: d5b9f1a3c7e8
+Revises: c3f5a7e9b214
+Create Date: 2026-10-19 23:00:00.000000
+
+Archival hard-deletes tasks while their description and revision rows
+(and the archived copy) keep the ID. A plain SQLite INTEGER PRIMARY KEY
+hands the highest ID out again once its row is gone, so tasks is rebuilt
+with AUTOINCREMENT and its counter starts above every ID still referenced
+anywhere. A no-op on MySQL, whose counter survives restarts from 8.0 on.
+
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+from app.db.sqlite import create_search_index, drop_search_index, has_search_index
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5b9f1a3c7e8'
+down_revision: Union[str, None] = 'c3f5a7e9b214'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Tables holding task IDs that must never be handed out again
+_TASK_ID_COLUMNS = (
+    ("tasks", "id"),
+    ("tasks_archive", "id"),
+    ("task_descriptions", "task_id"),
+    ("task_revisions", "task_id"),
+)
+
+
+def _rebuild_tasks(autoincrement: bool) -> None:
+    bind = op.get_bind()
+    # Dropping the old table drops the search triggers with it
+    search_index = has_search_index(bind)
+    if search_index:
+        drop_search_index(bind)
+    with op.batch_alter_table(
+        'tasks', recreate='always', table_kwargs={'sqlite_autoincrement': autoincrement}
+    ):
+        pass
+    if search_index:
+        create_search_index(bind)
+
+
+def upgrade() -> None:
+    if context.is_offline_mode() or op.get_bind().dialect.name != 'sqlite':
+        return
+    _rebuild_tasks(autoincrement=True)
+
+    high_water = " UNION ALL ".join(
+        f"SELECT MAX({column}) AS id FROM {table}" for table, column in _TASK_ID_COLUMNS
+    )
+    op.execute(sa.text("DELETE FROM sqlite_sequence WHERE name = 'tasks'"))
+    op.execute(sa.text(
+        f"INSERT INTO sqlite_sequence (name, seq) SELECT 'tasks', COALESCE(MAX(id), 0) FROM ({high_water})"
+    ))
+
+
+def downgrade() -> None:
+    if context.is_offline_mode() or op.get_bind().dialect.name != 'sqlite':
+        return
+    _rebuild_tasks(autoincrement=False)
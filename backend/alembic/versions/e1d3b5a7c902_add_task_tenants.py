@@ -0,0 +1,96 @@
+"""Add tenant ownership of tasks and per-tenant counters
+
+Revision ID: e1d3b5a7c902
+Revises: c4a7e2f19b05
+Create Date: 2026-10-19 16:00:00.000000
+
+Existing tasks, archived tasks and jobs belong to the default tenant.
+The tenant_counters table is filled from the current rows (offline --sql
+runs skip that; queue a reconcile_counters job afterwards).
+
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+from app.db.tenancy import DEFAULT_TENANT_ID
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e1d3b5a7c902'
+down_revision: Union[str, None] = 'c4a7e2f19b05'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _backfill_counters() -> None:
+    bind = op.get_bind()
+    counters = {}
+    for tenant_id, active, deleted, modified, modifications in bind.execute(sa.text(
+        "SELECT tenant_id, "
+        "SUM(CASE WHEN is_deleted = 0 THEN 1 ELSE 0 END), "
+        "SUM(CASE WHEN is_deleted = 1 THEN 1 ELSE 0 END), "
+        "SUM(CASE WHEN is_deleted = 0 AND modification_count > 0 THEN 1 ELSE 0 END), "
+        "COALESCE(SUM(modification_count), 0) "
+        "FROM tasks GROUP BY tenant_id"
+    )):
+        counters[tenant_id] = [active + deleted, active, deleted, modified, modifications]
+    for tenant_id, archived, modifications in bind.execute(sa.text(
+        "SELECT tenant_id, COUNT(*), COALESCE(SUM(modification_count), 0) FROM tasks_archive GROUP BY tenant_id"
+    )):
+        row = counters.setdefault(tenant_id, [0, 0, 0, 0, 0])
+        row[0] += archived
+        row[2] += archived
+        row[4] += modifications
+
+    tenant_counters = sa.table(
+        'tenant_counters',
+        sa.column('tenant_id'), sa.column('created_count'), sa.column('active_count'),
+        sa.column('deleted_count'), sa.column('modified_count'), sa.column('modifications')
+    )
+    if counters:
+        op.bulk_insert(tenant_counters, [
+            dict(zip(('tenant_id', 'created_count', 'active_count', 'deleted_count', 'modified_count',
+                      'modifications'), [tenant_id, *(int(value) for value in values)]))
+            for tenant_id, values in counters.items()
+        ])
+
+
+def upgrade() -> None:
+    # Owner of every task; existing rows belong to the default tenant
+    for table in ('tasks', 'tasks_archive', 'jobs'):
+        op.add_column(table, sa.Column(
+            'tenant_id', sa.String(length=64), server_default=DEFAULT_TENANT_ID, nullable=False
+        ))
+
+    # Tenant-leading indexes: each tenant's queries read only its own slice
+    op.create_index('ix_tasks_tenant_deleted_created', 'tasks', ['tenant_id', 'is_deleted', 'created_at'], unique=False)
+    op.create_index(
+        'ix_tasks_tenant_deleted_modifications', 'tasks', ['tenant_id', 'is_deleted', 'modification_count'],
+        unique=False
+    )
+    op.create_index(op.f('ix_tasks_archive_tenant_id'), 'tasks_archive', ['tenant_id'], unique=False)
+
+    # Running totals read by /metrics instead of counting rows
+    op.create_table('tenant_counters',
+        sa.Column('tenant_id', sa.String(length=64), nullable=False),
+        sa.Column('created_count', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('active_count', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('deleted_count', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('modified_count', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('modifications', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.PrimaryKeyConstraint('tenant_id')
+    )
+    if not context.is_offline_mode():
+        _backfill_counters()
+
+
+def downgrade() -> None:
+    op.drop_table('tenant_counters')
+    op.drop_index(op.f('ix_tasks_archive_tenant_id'), table_name='tasks_archive')
+    op.drop_index('ix_tasks_tenant_deleted_modifications', table_name='tasks')
+    op.drop_index('ix_tasks_tenant_deleted_created', table_name='tasks')
+    for table in ('jobs', 'tasks_archive', 'tasks'):
+        op.drop_column(table, 'tenant_id')
@@ -0,0 +1,78 @@
+"""Add server defaults to task flags
+
+Revision ID: e7c1a9b3d5f2
+Revises: d5b9f1a3c7e8
+Create Date: 2026-10-20 09:00:00.000000
+
+The tasks table was created with Python-side defaults only, so inserts
+that leave is_completed, is_deleted or modification_count out (raw SQL,
+bulk inserts) failed on NOT NULL. SQLite can't alter a column default in
+place: there the table is rebuilt, keeping AUTOINCREMENT, its counter and
+the FTS triggers (see d5b9f1a3c7e8).
+
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+from app.db.sqlite import create_search_index, drop_search_index, has_search_index
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7c1a9b3d5f2'
+down_revision: Union[str, None] = 'd5b9f1a3c7e8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Column, type and server default added by this revision
+_DEFAULTS = (
+    ('is_completed', sa.Boolean(), sa.false()),
+    ('is_deleted', sa.Boolean(), sa.false()),
+    ('modification_count', sa.Integer(), '0'),
+)
+
+
+def _set_defaults(restore: bool) -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != 'sqlite':
+        for name, type_, default in _DEFAULTS:
+            op.alter_column(
+                'tasks', name, existing_type=type_, existing_nullable=False,
+                server_default=None if restore else default
+            )
+        return
+    if context.is_offline_mode():
+        return
+
+    # The rebuild drops the search triggers and the AUTOINCREMENT counter
+    search_index = has_search_index(bind)
+    if search_index:
+        drop_search_index(bind)
+    sequence = bind.execute(sa.text("SELECT seq FROM sqlite_sequence WHERE name = 'tasks'")).scalar()
+    with op.batch_alter_table(
+        'tasks', recreate='always', table_kwargs={'sqlite_autoincrement': True}
+    ) as batch_op:
+        for name, type_, default in _DEFAULTS:
+            batch_op.alter_column(
+                name, existing_type=type_, existing_nullable=False,
+                server_default=None if restore else default
+            )
+    if sequence is not None:
+        op.execute(sa.text(
+            "UPDATE sqlite_sequence SET seq = MAX(seq, :seq) WHERE name = 'tasks'"
+        ).bindparams(seq=sequence))
+        op.execute(sa.text(
+            "INSERT INTO sqlite_sequence (name, seq) SELECT 'tasks', :seq "
+            "WHERE NOT EXISTS (SELECT 1 FROM sqlite_sequence WHERE name = 'tasks')"
+        ).bindparams(seq=sequence))
+    if search_index:
+        create_search_index(bind)
+
+
+def upgrade() -> None:
+    _set_defaults(restore=False)
+
+
+def downgrade() -> None:
+    _set_defaults(restore=True)
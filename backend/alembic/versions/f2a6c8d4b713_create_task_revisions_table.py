@@ -0,0 +1,41 @@
+"""Create task_revisions table
+
+Revision ID: f2a6c8d4b713
+Revises: e1d3b5a7c902
+Create Date: 2026-10-19 18:00:00.000000
+
+Edits made before this revision have no history; their versions are
+reported as not recorded.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2a6c8d4b713'
+down_revision: Union[str, None] = 'e1d3b5a7c902'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Reverse deltas of task edits, with a full snapshot every few revisions
+    op.create_table('task_revisions',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('task_id', sa.Integer(), nullable=False),
+        sa.Column('revision', sa.Integer(), nullable=False),
+        sa.Column('is_snapshot', sa.Boolean(), nullable=False),
+        sa.Column('is_compressed', sa.Boolean(), nullable=False),
+        sa.Column('payload', sa.LargeBinary(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_task_revisions_task_revision', 'task_revisions', ['task_id', 'revision'], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_task_revisions_task_revision', table_name='task_revisions')
+    op.drop_table('task_revisions')
@@ -1 +1,5 @@
 # Backend application package
+from dotenv import load_dotenv
+
+# Load .env before any module reads its settings from the environment
+load_dotenv()
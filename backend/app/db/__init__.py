@@ -1,4 +1,14 @@
 # Database package
-from .database import engine, SessionLocal, Base, get_db, create_tables, drop_tables
+from .database import get_engine, get_read_engine, SessionLocal, Base, get_db, create_tables, drop_tables
+from .tenancy import DEFAULT_TENANT_ID, get_tenant_id, get_tenant_db, tenant_session
 
-__all__ = ["engine", "SessionLocal", "Base", "get_db", "create_tables", "drop_tables"]
+
+def __getattr__(name: str):
+    # The engine is created on first access (see get_engine)
+    if name == "engine":
+        return get_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = ["engine", "get_engine", "get_read_engine", "SessionLocal", "Base", "get_db", "create_tables", "drop_tables",
+           "DEFAULT_TENANT_ID", "get_tenant_id", "get_tenant_db", "tenant_session"]
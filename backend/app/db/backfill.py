@@ -0,0 +1,539 @@
+"""
+Online, resumable backfills and index builds for schema migrations
+
+A backfill walks a table in primary-key order and changes one chunk of
+rows per transaction, recording the last key it finished in
+``backfill_checkpoints`` in that same transaction. An interrupted run
+resumes after the last committed chunk, and a finished backfill is skipped
+unless restarted. Between chunks it sleeps (BACKFILL_PAUSE_MS). With a
+target chunk duration it also resizes the chunks, so each one holds its
+row locks for about that long, however busy the database is.
+
+Chunk changes must be idempotent: on databases where the chunk and its
+checkpoint cannot share a transaction (autocommit), a crash between the
+two repeats the chunk.
+
+From a migration (each chunk commits, so leave the migration's own
+transaction first):
+
+    from app.db.backfill import Backfill, create_index_online
+
+    def upgrade():
+        op.add_column('tasks', sa.Column('priority', sa.Integer(), nullable=True))
+        with op.get_context().autocommit_block():
+            tasks = sa.table('tasks', sa.column('id'), sa.column('priority'))
+            Backfill.update('tasks_priority', tasks, {'priority': 0}).run(op.get_bind())
+            create_index_online(op.get_bind(), 'ix_tasks_priority', 'tasks', ['priority'])
+
+From the command line:
+
+    python -m app.db.backfill status
+    python -m app.db.backfill run task_descriptions
+    python -m app.db.backfill create-index ix_tasks_tenant_deleted_updated
+"""
+
+import argparse
+import logging
+import os
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, List, Optional, Union
+
+from sqlalchemy import bindparam, delete, func, insert, inspect, select, table as table_clause, text, update
+from sqlalchemy import column as column_clause
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.schema import Column, CreateIndex, Index, MetaData, Table
+from sqlalchemy.sql.expression import ColumnElement, TableClause
+
+from app.db.locks import advisory_lock
+from app.models.backfill_checkpoint import BackfillCheckpoint
+
+logger = logging.getLogger(__name__)
+
+# Rows per chunk (the starting size when BACKFILL_TARGET_CHUNK_MS adapts it)
+BACKFILL_CHUNK_SIZE = int(os.getenv("BACKFILL_CHUNK_SIZE", "1000"))
+# Pause between chunks so replicas and other writers keep up
+BACKFILL_PAUSE_MS = float(os.getenv("BACKFILL_PAUSE_MS", "50"))
+# Resize chunks to take about this long each (0 keeps BACKFILL_CHUNK_SIZE)
+BACKFILL_TARGET_CHUNK_MS = float(os.getenv("BACKFILL_TARGET_CHUNK_MS", "0"))
+# Seconds between progress log lines
+BACKFILL_PROGRESS_SECONDS = float(os.getenv("BACKFILL_PROGRESS_SECONDS", "10"))
+
+checkpoints = BackfillCheckpoint.__table__
+
+# Changes the rows with lower < key <= upper; returns the number of rows written
+ChunkProcessor = Callable[[Connection, int, int], int]
+
+
+class BackfillError(RuntimeError):
+    """A backfill or online index build cannot run as requested"""
+
+
+@dataclass
+class BackfillProgress:
+    """
+    State of a running (or finished) backfill
+
+    Attributes:
+        name: Backfill name
+        last_key: Highest primary key processed (None before the first chunk)
+        rows_written: Rows changed so far, including earlier runs
+        chunks: Chunks committed so far, including earlier runs
+        elapsed_seconds: Time spent by this run
+        fraction: Share of the key range done (None when unknown)
+        finished: The whole table is done
+    """
+    name: str
+    last_key: Optional[int]
+    rows_written: int
+    chunks: int
+    elapsed_seconds: float
+    fraction: Optional[float]
+    finished: bool = False
+
+    @property
+    def eta_seconds(self) -> Optional[float]:
+        """Estimated seconds left for this run, from its rate so far"""
+        if self.finished:
+            return 0.0
+        if not self.fraction or self.elapsed_seconds <= 0:
+            return None
+        return self.elapsed_seconds * (1 - self.fraction) / self.fraction
+
+
+ProgressCallback = Callable[[BackfillProgress], None]
+
+
+def _is_autocommit(conn: Connection) -> bool:
+    return conn.get_execution_options().get("isolation_level") == "AUTOCOMMIT"
+
+
+def _key_range_fraction(low: Optional[int], high: Optional[int], last: Optional[int]) -> Optional[float]:
+    if low is None or high is None or last is None:
+        return None
+    if high <= low:
+        return 1.0
+    return min(1.0, max(0.0, (last - low) / (high - low)))
+
+
+class Backfill:
+    """
+    A named, resumable pass over a table in primary-key chunks
+    """
+
+    def __init__(
+        self,
+        name: str,
+        table: Union[str, TableClause],
+        process: ChunkProcessor,
+        key: str = "id",
+        chunk_size: int = BACKFILL_CHUNK_SIZE,
+        pause_ms: float = BACKFILL_PAUSE_MS,
+        target_chunk_ms: float = BACKFILL_TARGET_CHUNK_MS
+    ):
+        """
+        Initialize a Backfill
+
+        Args:
+            name: Checkpoint name, unique per backfill
+            table: Table (or its name) to walk
+            process: Callable changing the rows with lower < key <= upper
+            key: Integer primary key column
+            chunk_size: Rows per chunk (initial size when adapting)
+            pause_ms: Sleep between chunks
+            target_chunk_ms: Resize chunks to take about this long (0: fixed size)
+        """
+        self.name = name
+        self.table = table_clause(table, column_clause(key)) if isinstance(table, str) else table
+        self.key = key
+        self.process = process
+        self.chunk_size = max(1, chunk_size)
+        self.pause_ms = pause_ms
+        self.target_chunk_ms = target_chunk_ms
+
+    @classmethod
+    def update(
+        cls,
+        name: str,
+        table: TableClause,
+        values: Dict[str, Any],
+        where: Optional[ColumnElement] = None,
+        key: str = "id",
+        **options
+    ) -> "Backfill":
+        """
+        Backfill running ``UPDATE table SET values`` one key range at a time
+
+        Args:
+            name: Checkpoint name
+            table: Table with the key and updated columns
+            values: Column values (literals or SQL expressions over the row)
+            where: Extra criterion, e.g. only rows still NULL
+            key: Integer primary key column
+            **options: chunk_size, pause_ms or target_chunk_ms
+
+        Returns:
+            Backfill
+        """
+        column = table.c[key]
+
+        def process(conn: Connection, lower: int, upper: int) -> int:
+            statement = update(table).where(column > lower, column <= upper)
+            if where is not None:
+                statement = statement.where(where)
+            return conn.execute(statement.values(values)).rowcount
+
+        return cls(name, table, process, key=key, **options)
+
+    def run(
+        self,
+        bind: Union[Engine, Connection],
+        restart: bool = False,
+        progress: Optional[ProgressCallback] = None
+    ) -> BackfillProgress:
+        """
+        Run (or resume) the backfill to the end of the table
+
+        With an Engine, or a connection in autocommit mode (as in Alembic's
+        ``autocommit_block``), every chunk commits on its own. A connection
+        inside a transaction runs all chunks in that transaction; the work
+        is still chunked, but nothing is committed until the caller does.
+
+        Args:
+            bind: Engine or connection of the database
+            restart: Start over even if a checkpoint exists or it finished
+            progress: Callback receiving a BackfillProgress after each chunk
+
+        Returns:
+            Final BackfillProgress
+
+        Raises:
+            BackfillError: The backfill is already running elsewhere
+        """
+        engine = bind if isinstance(bind, Engine) else bind.engine
+        with advisory_lock(engine, f"backfill:{self.name}") as acquired:
+            if not acquired:
+                raise BackfillError(f"Backfill {self.name} is already running")
+            if isinstance(bind, Engine):
+                with bind.connect() as conn:
+                    return self._run(conn, True, restart, progress)
+            # In autocommit mode every statement commits by itself
+            if not _is_autocommit(bind):
+                logger.warning("Backfill %s runs inside the caller's transaction: chunks are not committed "
+                               "separately (use an autocommit connection for an online backfill)", self.name)
+            return self._run(bind, False, restart, progress)
+
+    def _run(self, conn: Connection, commit: bool, restart: bool,
+             progress: Optional[ProgressCallback]) -> BackfillProgress:
+        column = self.table.c[self.key]
+        state = self._checkpoint(conn, restart)
+        if commit:
+            conn.commit()
+        if state["finished_at"] is not None:
+            logger.info("Backfill %s already finished, skipping", self.name)
+            return BackfillProgress(self.name, state["last_key"], state["rows_written"], state["chunks"], 0.0, 1.0, True)
+
+        last_key = state["last_key"]
+        rows_written = state["rows_written"]
+        chunks = state["chunks"]
+        low = last_key if last_key is not None else conn.scalar(select(func.min(column)))
+        high = conn.scalar(select(func.max(column)))
+        size = self.chunk_size
+        started = time.monotonic()
+        logged = started
+
+        while True:
+            after = last_key if last_key is not None else (low - 1 if low is not None else None)
+            upper = self._chunk_end(conn, column, after, size) if after is not None else None
+            if upper is None:
+                break
+            chunk_started = time.monotonic()
+            written = self.process(conn, after, upper) or 0
+            rows_written += max(0, written)
+            chunks += 1
+            last_key = upper
+            conn.execute(
+                update(checkpoints).where(checkpoints.c.name == self.name)
+                .values(last_key=last_key, rows_written=rows_written, chunks=chunks, updated_at=func.now())
+            )
+            if commit:
+                conn.commit()
+            size = self._next_size(size, (time.monotonic() - chunk_started) * 1000)
+
+            now = time.monotonic()
+            report = BackfillProgress(
+                self.name, last_key, rows_written, chunks, now - started,
+                _key_range_fraction(low, high, last_key)
+            )
+            if progress:
+                progress(report)
+            if now - logged >= BACKFILL_PROGRESS_SECONDS:
+                logged = now
+                logger.info("Backfill %s: %d chunk(s), %d row(s) written, up to key %s (%.0f%%)",
+                            self.name, chunks, rows_written, last_key, 100 * (report.fraction or 0))
+            if self.pause_ms > 0:
+                time.sleep(self.pause_ms / 1000)
+
+        conn.execute(
+            update(checkpoints).where(checkpoints.c.name == self.name)
+            .values(finished_at=func.now(), updated_at=func.now())
+        )
+        if commit:
+            conn.commit()
+        report = BackfillProgress(
+            self.name, last_key, rows_written, chunks, time.monotonic() - started, 1.0, True
+        )
+        logger.info("Backfill %s finished: %d chunk(s), %d row(s) written in %.1fs",
+                    self.name, chunks, rows_written, report.elapsed_seconds)
+        if progress:
+            progress(report)
+        return report
+
+    def _checkpoint(self, conn: Connection, restart: bool) -> Dict[str, Any]:
+        """Load the checkpoint row, creating or resetting it as needed"""
+        if restart:
+            conn.execute(delete(checkpoints).where(checkpoints.c.name == self.name))
+        row = conn.execute(select(checkpoints).where(checkpoints.c.name == self.name)).mappings().first()
+        if row is None:
+            conn.execute(insert(checkpoints).values(
+                name=self.name, table_name=self.table.name, last_key=None, rows_written=0, chunks=0
+            ))
+            return {"last_key": None, "rows_written": 0, "chunks": 0, "finished_at": None}
+        return dict(row)
+
+    @staticmethod
+    def _chunk_end(conn: Connection, column, after: int, size: int) -> Optional[int]:
+        """Key ending the chunk of ``size`` rows after ``after``, None past the end"""
+        upper = conn.scalar(select(column).where(column > after).order_by(column).offset(size - 1).limit(1))
+        if upper is None:
+            # Fewer than ``size`` rows left
+            upper = conn.scalar(select(func.max(column)).where(column > after))
+        return upper
+
+    def _next_size(self, size: int, elapsed_ms: float) -> int:
+        """Grow or shrink the chunk towards target_chunk_ms"""
+        if self.target_chunk_ms <= 0:
+            return size
+        if elapsed_ms > self.target_chunk_ms * 1.5:
+            size //= 2
+        elif elapsed_ms < self.target_chunk_ms / 2:
+            size *= 2
+        return max(max(1, self.chunk_size // 16), min(self.chunk_size * 16, size))
+
+
+def get_checkpoints(bind: Union[Engine, Connection]) -> List[Dict[str, Any]]:
+    """
+    Get every backfill checkpoint
+
+    Returns:
+        Checkpoint rows as dictionaries, by name
+    """
+    with _connection(bind) as conn:
+        return [dict(row) for row in conn.execute(select(checkpoints).order_by(checkpoints.c.name)).mappings()]
+
+
+@contextmanager
+def _connection(bind: Union[Engine, Connection], autocommit: bool = False) -> Iterator[Connection]:
+    if isinstance(bind, Connection):
+        yield bind
+        return
+    with bind.connect() as conn:
+        if autocommit:
+            conn = conn.execution_options(isolation_level="AUTOCOMMIT")
+        yield conn
+        conn.commit()
+
+
+def _index_table(name: str, columns: List[str]) -> Table:
+    return Table(name, MetaData(), *[Column(column) for column in columns])
+
+
+def _pg_index_valid(conn: Connection, name: str) -> Optional[bool]:
+    """Whether a PostgreSQL index is valid (False after a failed CONCURRENTLY build), None if missing"""
+    return conn.scalar(text(
+        "SELECT i.indisvalid FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid "
+        "WHERE c.relname = :name AND pg_table_is_visible(c.oid)"
+    ), {"name": name})
+
+
+def create_index_online(bind: Union[Engine, Connection], name: str, table: str, columns: List[str],
+                        unique: bool = False) -> bool:
+    """
+    Build an index without blocking writes where the database allows it
+
+    - PostgreSQL: ``CREATE INDEX CONCURRENTLY``, which must run outside a
+      transaction. An invalid index left by an interrupted concurrent build
+      is dropped and rebuilt.
+    - MySQL/MariaDB: ``ALTER TABLE ... ADD INDEX`` with ``ALGORITHM=INPLACE,
+      LOCK=NONE``. MySQL refuses rather than silently locking the table.
+    - Others (SQLite): plain ``CREATE INDEX``.
+
+    Args:
+        bind: Engine, or a connection (in autocommit mode on PostgreSQL)
+        name: Index name
+        table: Table name
+        columns: Indexed column names
+        unique: Build a unique index
+
+    Returns:
+        True if the index was built, False if it already existed
+
+    Raises:
+        BackfillError: A PostgreSQL connection is inside a transaction
+    """
+    with _connection(bind, autocommit=True) as conn:
+        dialect = conn.dialect.name
+        if dialect == "postgresql":
+            if not _is_autocommit(conn):
+                raise BackfillError(
+                    "CREATE INDEX CONCURRENTLY needs an autocommit connection "
+                    "(in a migration: with op.get_context().autocommit_block())"
+                )
+            valid = _pg_index_valid(conn, name)
+            if valid:
+                return False
+            if valid is False:
+                logger.warning("Dropping invalid index %s left by an interrupted build", name)
+                conn.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {conn.dialect.identifier_preparer.quote(name)}"))
+        elif name in {index["name"] for index in inspect(conn).get_indexes(table)}:
+            return False
+
+        started = time.monotonic()
+        if dialect in ("mysql", "mariadb"):
+            quote = conn.dialect.identifier_preparer.quote
+            conn.execute(text(
+                f"ALTER TABLE {quote(table)} ADD {'UNIQUE ' if unique else ''}INDEX {quote(name)} "
+                f"({', '.join(quote(column) for column in columns)}), ALGORITHM=INPLACE, LOCK=NONE"
+            ))
+        else:
+            index_table = _index_table(table, columns)
+            conn.execute(CreateIndex(Index(
+                name, *[index_table.c[column] for column in columns], unique=unique,
+                postgresql_concurrently=dialect == "postgresql"
+            )))
+        logger.info("Built index %s on %s in %.1fs", name, table, time.monotonic() - started)
+        return True
+
+
+def drop_index_online(bind: Union[Engine, Connection], name: str, table: str) -> bool:
+    """
+    Drop an index without blocking writes where the database allows it
+
+    Counterpart of create_index_online (``DROP INDEX CONCURRENTLY`` on
+    PostgreSQL, ``ALGORITHM=INPLACE, LOCK=NONE`` on MySQL/MariaDB).
+
+    Returns:
+        True if the index was dropped, False if it didn't exist
+    """
+    with _connection(bind, autocommit=True) as conn:
+        dialect = conn.dialect.name
+        quote = conn.dialect.identifier_preparer.quote
+        if dialect == "postgresql":
+            if not _is_autocommit(conn):
+                raise BackfillError("DROP INDEX CONCURRENTLY needs an autocommit connection")
+            if _pg_index_valid(conn, name) is None:
+                return False
+            conn.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {quote(name)}"))
+            return True
+        if name not in {index["name"] for index in inspect(conn).get_indexes(table)}:
+            return False
+        if dialect in ("mysql", "mariadb"):
+            conn.execute(text(f"ALTER TABLE {quote(table)} DROP INDEX {quote(name)}, ALGORITHM=INPLACE, LOCK=NONE"))
+        else:
+            conn.execute(text(f"DROP INDEX {quote(name)}"))
+        return True
+
+
+def _recompress_task_descriptions() -> Backfill:
+    """Re-encode task descriptions after TASK_DESCRIPTION_COMPRESS_MIN_BYTES changed"""
+    from app.models.task_description import TaskDescription, decode_description, encode_description
+
+    descriptions = TaskDescription.__table__
+    column = descriptions.c.task_id
+
+    def process(conn: Connection, lower: int, upper: int) -> int:
+        changes = []
+        for task_id, is_compressed, body in conn.execute(
+            select(column, descriptions.c.is_compressed, descriptions.c.body).where(column > lower, column <= upper)
+        ):
+            new_body, new_compressed = encode_description(decode_description(body, is_compressed))
+            if new_compressed != is_compressed:
+                changes.append({"row_id": task_id, "new_body": new_body, "new_compressed": new_compressed})
+        if changes:
+            conn.execute(
+                update(descriptions).where(column == bindparam("row_id"))
+                .values(body=bindparam("new_body"), is_compressed=bindparam("new_compressed")),
+                changes
+            )
+        return len(changes)
+
+    return Backfill("task_descriptions", descriptions, process, key="task_id")
+
+
+# Backfills runnable from the command line, by name
+BACKFILLS: Dict[str, Callable[[], Backfill]] = {
+    "task_descriptions": _recompress_task_descriptions,
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run resumable backfills and online index builds")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("status", help="Show backfill checkpoints")
+    run = commands.add_parser("run", help="Run or resume a backfill")
+    run.add_argument("name", choices=sorted(BACKFILLS))
+    run.add_argument("--restart", action="store_true", help="Ignore the checkpoint and start over")
+    run.add_argument("--chunk-size", type=int, default=BACKFILL_CHUNK_SIZE)
+    run.add_argument("--pause-ms", type=float, default=BACKFILL_PAUSE_MS)
+    run.add_argument("--target-chunk-ms", type=float, default=BACKFILL_TARGET_CHUNK_MS)
+    reset = commands.add_parser("reset", help="Forget a backfill's checkpoint")
+    reset.add_argument("name")
+    create_index = commands.add_parser("create-index", help="Build an index declared on the models online")
+    create_index.add_argument("name")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    import app.models  # noqa: F401 (registers every table on Base.metadata)
+    from app.db.database import Base, get_engine
+    engine = get_engine()
+
+    if args.command == "status":
+        for row in get_checkpoints(engine):
+            state = f"finished {row['finished_at']}" if row["finished_at"] else f"updated {row['updated_at']}"
+            print(f"{row['name']:24s} {row['table_name']:20s} last_key={row['last_key']} "
+                  f"rows={row['rows_written']} chunks={row['chunks']} {state}")
+    elif args.command == "run":
+        backfill = BACKFILLS[args.name]()
+        backfill.chunk_size = max(1, args.chunk_size)
+        backfill.pause_ms = args.pause_ms
+        backfill.target_chunk_ms = args.target_chunk_ms
+
+        def report(state: BackfillProgress) -> None:
+            eta = state.eta_seconds
+            print(f"\r{state.name}: {state.chunks} chunk(s), {state.rows_written} row(s) written, "
+                  f"{100 * (state.fraction or 0):.1f}%" + (f", ETA {eta:.0f}s" if eta is not None else ""),
+                  end="", flush=True)
+
+        result = backfill.run(engine, restart=args.restart, progress=report)
+        print(f"\n{result.name}: done in {result.elapsed_seconds:.1f}s")
+    elif args.command == "reset":
+        with engine.begin() as conn:
+            deleted = conn.execute(delete(checkpoints).where(checkpoints.c.name == args.name)).rowcount
+        print(f"Removed {deleted} checkpoint(s)")
+    else:
+        index = next(
+            (index for model_table in Base.metadata.tables.values() for index in model_table.indexes
+             if index.name == args.name),
+            None
+        )
+        if index is None:
+            parser.error(f"No index named {args.name} on the models")
+        built = create_index_online(
+            engine, index.name, index.table.name, [column.name for column in index.columns], unique=index.unique
+        )
+        print(f"{'Built' if built else 'Already exists:'} {index.name}")
+
+
+if __name__ == "__main__":
+    main()
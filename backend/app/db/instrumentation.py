@@ -0,0 +1,79 @@
+"""
+Per-request query instrumentation based on SQLAlchemy engine events
+"""
+
+import threading
+import time
+from contextvars import ContextVar
+from typing import Optional, Set
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+class RequestStats:
+    """
+    Mutable counters for a single request
+
+    The same object is shared with threadpool workers through the context
+    variable, so statements executed from sync endpoints and dependencies are
+    counted too. ``thread_ids`` collects the threads that ran statements
+    for the request (the request profiler samples only those).
+    """
+
+    __slots__ = ("started", "statements", "db_time", "serialization_time", "thread_ids")
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.statements = 0
+        self.db_time = 0.0
+        self.serialization_time = 0.0
+        self.thread_ids: Set[int] = set()
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds since the request started"""
+        return time.perf_counter() - self.started
+
+
+# Stats of the request currently being handled (None outside requests)
+current_request_stats: ContextVar[Optional[RequestStats]] = ContextVar("current_request_stats", default=None)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+    stats = current_request_stats.get()
+    if stats is not None:
+        stats.thread_ids.add(threading.get_ident())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info["query_start_time"].pop()
+    stats = current_request_stats.get()
+    if stats is not None:
+        stats.statements += 1
+        stats.db_time += time.perf_counter() - started
+
+
+def _handle_error(exception_context):
+    # Failed statements never reach after_cursor_execute
+    conn = exception_context.connection
+    if conn is not None and conn.info.get("query_start_time"):
+        started = conn.info["query_start_time"].pop()
+        stats = current_request_stats.get()
+        if stats is not None:
+            stats.statements += 1
+            stats.db_time += time.perf_counter() - started
+
+
+def instrument_engine(engine: Engine) -> None:
+    """
+    Attach statement counting and timing hooks to an engine
+
+    Args:
+        engine: SQLAlchemy engine to instrument
+    """
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+        event.listen(engine, "handle_error", _handle_error)
@@ -0,0 +1,44 @@
+"""
+Cross-process advisory locks for work that must run in one worker at a time
+"""
+
+from contextlib import contextmanager
+from typing import Iterator
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+
+@contextmanager
+def advisory_lock(engine: Engine, name: str) -> Iterator[bool]:
+    """
+    Try to take a named database lock without waiting
+
+    Uses GET_LOCK on MySQL/MariaDB and pg_try_advisory_lock on PostgreSQL,
+    held on a dedicated connection for the duration of the block. Other
+    databases (SQLite) have no such lock and always report success.
+
+    Args:
+        engine: Engine of the database holding the lock
+        name: Lock name shared by every worker process
+
+    Yields:
+        True if the lock was acquired
+    """
+    dialect = engine.dialect.name
+    if dialect not in ("mysql", "mariadb", "postgresql"):
+        yield True
+        return
+
+    with engine.connect() as conn:
+        if dialect == "postgresql":
+            acquired = conn.execute(text("SELECT pg_try_advisory_lock(hashtext(:name))"), {"name": name}).scalar()
+            release = text("SELECT pg_advisory_unlock(hashtext(:name))")
+        else:
+            acquired = conn.execute(text("SELECT GET_LOCK(:name, 0)"), {"name": name}).scalar() == 1
+            release = text("SELECT RELEASE_LOCK(:name)")
+        try:
+            yield bool(acquired)
+        finally:
+            if acquired:
+                conn.execute(release, {"name": name})
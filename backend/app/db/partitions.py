@@ -0,0 +1,124 @@
+"""
+Monthly range partitioning of the tasks table by created_at (MySQL)
+
+The partitioned layout is opt-in (TASKS_PARTITIONING=true when running the
+migration). MySQL requires the partitioning column in every unique key, so
+the table's primary key becomes (id, created_at); the ORM keeps mapping
+``id`` alone as the identity.
+"""
+
+import os
+from datetime import date, datetime, timezone
+from typing import List, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+# Partition tasks when the partitioning migration runs (MySQL/MariaDB only)
+TASKS_PARTITIONING = os.getenv("TASKS_PARTITIONING", "false").lower() in ("1", "true", "yes")
+# Number of future monthly partitions kept ready ahead of time
+PARTITION_MONTHS_AHEAD = int(os.getenv("PARTITION_MONTHS_AHEAD", "3"))
+
+PARTITIONED_TABLE = "tasks"
+CATCH_ALL_PARTITION = "pmax"
+
+
+def supports_partitioning(conn: Connection) -> bool:
+    """Whether the connected database supports the partitioned layout"""
+    return conn.dialect.name in ("mysql", "mariadb")
+
+
+def month_start(value: date) -> date:
+    """First day of the month containing ``value``"""
+    return date(value.year, value.month, 1)
+
+
+def add_months(month: date, count: int) -> date:
+    """Shift a first-of-month date by ``count`` months"""
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    """Partition name for a month, e.g. p202501"""
+    return f"p{month:%Y%m}"
+
+
+def partition_month(name: str) -> Optional[date]:
+    """Month covered by a partition name, None for the catch-all partition"""
+    try:
+        return datetime.strptime(name, "p%Y%m").date()
+    except ValueError:
+        return None
+
+
+def partition_definition(month: date) -> str:
+    """DDL fragment for the partition holding rows created in ``month``"""
+    return f"PARTITION {partition_name(month)} VALUES LESS THAN ('{add_months(month, 1):%Y-%m-%d}')"
+
+
+def build_partition_clause(first_month: date, last_month: date) -> str:
+    """
+    Build the PARTITION BY clause covering ``first_month`` to ``last_month``
+    plus a catch-all partition
+    """
+    definitions = []
+    month = month_start(first_month)
+    while month <= last_month:
+        definitions.append(partition_definition(month))
+        month = add_months(month, 1)
+    definitions.append(f"PARTITION {CATCH_ALL_PARTITION} VALUES LESS THAN (MAXVALUE)")
+    return "PARTITION BY RANGE COLUMNS(created_at) (\n    " + ",\n    ".join(definitions) + "\n)"
+
+
+def list_partitions(conn: Connection, table: str = PARTITIONED_TABLE) -> List[Tuple[str, Optional[date]]]:
+    """
+    List partitions of a table in range order
+
+    Returns:
+        List of (partition name, month) tuples; month is None for pmax.
+        Empty when the table is not partitioned.
+    """
+    if not supports_partitioning(conn):
+        return []
+    rows = conn.execute(text(
+        "SELECT PARTITION_NAME FROM information_schema.PARTITIONS "
+        "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table AND PARTITION_NAME IS NOT NULL "
+        "ORDER BY PARTITION_ORDINAL_POSITION"
+    ), {"table": table}).scalars().all()
+    return [(name, partition_month(name)) for name in rows]
+
+
+def is_partitioned(conn: Connection, table: str = PARTITIONED_TABLE) -> bool:
+    """Whether the table currently uses range partitioning"""
+    return bool(list_partitions(conn, table))
+
+
+def ensure_future_partitions(conn: Connection, months_ahead: int = PARTITION_MONTHS_AHEAD) -> List[str]:
+    """
+    Split the catch-all partition so monthly partitions exist ahead of time
+
+    Reorganizing pmax is cheap while it is still empty, which is why this
+    should run regularly (the archival job does).
+
+    Returns:
+        Names of the partitions that were created
+    """
+    months = [month for _, month in list_partitions(conn) if month is not None]
+    if not months:
+        return []
+    target = add_months(month_start(datetime.now(timezone.utc).date()), months_ahead)
+    new_months = []
+    month = add_months(max(months), 1)
+    while month <= target:
+        new_months.append(month)
+        month = add_months(month, 1)
+    if not new_months:
+        return []
+    definitions = [partition_definition(month) for month in new_months]
+    definitions.append(f"PARTITION {CATCH_ALL_PARTITION} VALUES LESS THAN (MAXVALUE)")
+    conn.execute(text(
+        f"ALTER TABLE {PARTITIONED_TABLE} REORGANIZE PARTITION {CATCH_ALL_PARTITION} INTO ("
+        + ", ".join(definitions) + ")"
+    ))
+    return [partition_name(month) for month in new_months]
@@ -0,0 +1,164 @@
+"""
+Slow-query log with automatic EXPLAIN capture
+"""
+
+import json
+import logging
+import os
+import sys
+import time
+from datetime import datetime, timezone
+from logging.handlers import RotatingFileHandler
+from typing import Any, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# Statements slower than this are logged (0 disables the slow-query log)
+SLOW_QUERY_THRESHOLD_MS = float(os.getenv("SLOW_QUERY_THRESHOLD_MS", "0"))
+SLOW_QUERY_LOG_FILE = os.getenv("SLOW_QUERY_LOG_FILE", "logs/slow_queries.log")
+SLOW_QUERY_LOG_MAX_BYTES = int(os.getenv("SLOW_QUERY_LOG_MAX_BYTES", str(10 * 1024 * 1024)))
+SLOW_QUERY_LOG_BACKUP_COUNT = int(os.getenv("SLOW_QUERY_LOG_BACKUP_COUNT", "5"))
+SLOW_QUERY_EXPLAIN = os.getenv("SLOW_QUERY_EXPLAIN", "true").lower() in ("1", "true", "yes")
+
+# Statement types that can be explained without executing them
+_EXPLAINABLE = ("select", "with", "update", "delete")
+_EXPLAIN_PREFIX = {
+    "sqlite": "EXPLAIN QUERY PLAN ",
+    "mysql": "EXPLAIN ",
+    "mariadb": "EXPLAIN ",
+    "postgresql": "EXPLAIN ",
+}
+# Dialects where a failed statement aborts the whole transaction, so the
+# EXPLAIN runs inside a savepoint that is rolled back on failure
+_SAVEPOINT_DIALECTS = ("postgresql",)
+_EXPLAIN_SAVEPOINT = "slow_query_explain"
+_MAX_PARAMETERS_LENGTH = 2000
+
+slow_query_logger = logging.getLogger("app.slow_query")
+
+
+def _configure_logger() -> None:
+    if slow_query_logger.handlers:
+        return
+    directory = os.path.dirname(SLOW_QUERY_LOG_FILE)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    handler = RotatingFileHandler(
+        SLOW_QUERY_LOG_FILE,
+        maxBytes=SLOW_QUERY_LOG_MAX_BYTES,
+        backupCount=SLOW_QUERY_LOG_BACKUP_COUNT,
+        encoding="utf-8"
+    )
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    slow_query_logger.addHandler(handler)
+    slow_query_logger.setLevel(logging.INFO)
+    slow_query_logger.propagate = False
+
+
+def find_caller() -> str:
+    """
+    Name the service method that issued the current statement
+
+    Walks up the stack to the first frame in ``app.services`` (e.g.
+    ``TaskService.search_tasks``), falling back to the first frame
+    anywhere in the ``app`` package.
+
+    Returns:
+        Qualified caller name, or "unknown"
+    """
+    frame = sys._getframe(1)
+    fallback = None
+    while frame is not None:
+        module = frame.f_globals.get("__name__", "")
+        if module.startswith("app.") and not module.startswith("app.db."):
+            owner = frame.f_locals.get("self")
+            name = f"{type(owner).__name__}.{frame.f_code.co_name}" if owner is not None else (
+                f"{module}.{frame.f_code.co_name}"
+            )
+            if module.startswith("app.services."):
+                return name
+            fallback = fallback or name
+        frame = frame.f_back
+    return fallback or "unknown"
+
+
+def explain(conn, statement: str, parameters: Any) -> Optional[List[List[Any]]]:
+    """
+    Capture the query plan of a statement on the same connection
+
+    The EXPLAIN runs on a raw DBAPI cursor, so it neither fires engine
+    events nor affects the ORM session. Where a failing statement would
+    abort the caller's transaction (PostgreSQL) it runs in a savepoint that
+    is rolled back if the EXPLAIN fails. It stays on the caller's connection
+    because another one may not be available (the SQLite writer pool holds
+    a single connection) and would not see the caller's uncommitted rows.
+
+    Returns:
+        Plan rows, or None when the statement can't be explained
+    """
+    prefix = _EXPLAIN_PREFIX.get(conn.dialect.name)
+    if prefix is None or not statement.lstrip().lower().startswith(_EXPLAINABLE):
+        return None
+    dbapi_connection = conn.connection.dbapi_connection
+    savepoint = conn.dialect.name in _SAVEPOINT_DIALECTS and getattr(dbapi_connection, "autocommit", False) is not True
+    cursor = dbapi_connection.cursor()
+    try:
+        if savepoint:
+            cursor.execute(f"SAVEPOINT {_EXPLAIN_SAVEPOINT}")
+        try:
+            cursor.execute(prefix + statement, parameters)
+            plan = [list(row) for row in cursor.fetchall()]
+        except Exception as exc:
+            if savepoint:
+                cursor.execute(f"ROLLBACK TO SAVEPOINT {_EXPLAIN_SAVEPOINT}")
+                cursor.execute(f"RELEASE SAVEPOINT {_EXPLAIN_SAVEPOINT}")
+            return [[f"EXPLAIN failed: {exc}"]]
+        if savepoint:
+            cursor.execute(f"RELEASE SAVEPOINT {_EXPLAIN_SAVEPOINT}")
+        return plan
+    except Exception as exc:
+        return [[f"EXPLAIN failed: {exc}"]]
+    finally:
+        cursor.close()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("slow_query_start_time", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    duration_ms = (time.perf_counter() - conn.info["slow_query_start_time"].pop()) * 1000
+    if duration_ms < SLOW_QUERY_THRESHOLD_MS:
+        return
+    plan = explain(conn, statement, parameters) if SLOW_QUERY_EXPLAIN and not executemany else None
+    slow_query_logger.info(json.dumps({
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "duration_ms": round(duration_ms, 3),
+        "caller": find_caller(),
+        "statement": statement,
+        "parameters": repr(parameters)[:_MAX_PARAMETERS_LENGTH],
+        "executemany": executemany,
+        "plan": plan
+    }, default=str))
+
+
+def _handle_error(exception_context):
+    conn = exception_context.connection
+    if conn is not None and conn.info.get("slow_query_start_time"):
+        conn.info["slow_query_start_time"].pop()
+
+
+def install_slow_query_log(engine: Engine) -> None:
+    """
+    Attach the slow-query log to an engine when a threshold is configured
+
+    Args:
+        engine: SQLAlchemy engine to watch
+    """
+    if SLOW_QUERY_THRESHOLD_MS <= 0 or event.contains(engine, "after_cursor_execute", _after_cursor_execute):
+        return
+    _configure_logger()
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
@@ -0,0 +1,175 @@
+"""
+Embedded SQLite deployment mode for single-node installs
+
+A file database gets:
+
+- WAL journaling and tuned pragmas applied on every new connection, so
+  readers never block the writer (and vice versa);
+- one writer connection plus a pool of read-only reader connections (the
+  routing lives in ``app.db.database``), since SQLite allows a single writer
+  at a time anyway and queueing writers in the pool is cheaper than
+  retrying on "database is locked";
+- an FTS5 trigram index on task titles that turns the substring search
+  (``title LIKE '%...%'``) into an index lookup.
+"""
+
+import os
+import time
+import weakref
+from typing import Tuple
+
+from sqlalchemy import column, event, select, table, text
+from sqlalchemy.engine import Connection, Engine
+
+# Journal mode set on every connection (WAL lets readers run during writes)
+SQLITE_JOURNAL_MODE = os.getenv("SQLITE_JOURNAL_MODE", "WAL")
+# NORMAL is durable in WAL mode except for the last commits on power loss
+SQLITE_SYNCHRONOUS = os.getenv("SQLITE_SYNCHRONOUS", "NORMAL")
+# Bytes of the database file memory-mapped for reads (0 disables mmap)
+SQLITE_MMAP_SIZE = int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)))
+# Page cache per connection; negative values are KiB (-32768 = 32 MiB)
+SQLITE_CACHE_SIZE = int(os.getenv("SQLITE_CACHE_SIZE", "-32768"))
+# How long a connection waits for a lock held by another process
+SQLITE_BUSY_TIMEOUT_MS = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+# Read-only connections next to the single writer (0 shares one engine)
+SQLITE_READER_POOL_SIZE = int(os.getenv("SQLITE_READER_POOL_SIZE", "4"))
+# Use the FTS5 index for title search when the migration has created it
+SQLITE_FTS_SEARCH = os.getenv("SQLITE_FTS_SEARCH", "true").lower() in ("1", "true", "yes")
+# Look again whether the index exists after this long (a migration may add or drop it)
+SQLITE_FTS_RECHECK_SECONDS = float(os.getenv("SQLITE_FTS_RECHECK_SECONDS", "60"))
+
+SEARCH_INDEX_TABLE = "tasks_fts"
+# The trigram tokenizer only matches substrings of at least three characters
+SEARCH_INDEX_MIN_LENGTH = 3
+
+# Lightweight handle for querying the index from the ORM
+tasks_fts = table(SEARCH_INDEX_TABLE, column("rowid"), column("title"))
+
+_SEARCH_INDEX_DDL = (
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_INDEX_TABLE} "
+    "USING fts5(title, content='tasks', content_rowid='id', tokenize='trigram')",
+    f"CREATE TRIGGER IF NOT EXISTS tasks_fts_insert AFTER INSERT ON tasks BEGIN "
+    f"INSERT INTO {SEARCH_INDEX_TABLE}(rowid, title) VALUES (new.id, new.title); END",
+    f"CREATE TRIGGER IF NOT EXISTS tasks_fts_delete AFTER DELETE ON tasks BEGIN "
+    f"INSERT INTO {SEARCH_INDEX_TABLE}({SEARCH_INDEX_TABLE}, rowid, title) VALUES ('delete', old.id, old.title); END",
+    f"CREATE TRIGGER IF NOT EXISTS tasks_fts_update AFTER UPDATE OF title ON tasks BEGIN "
+    f"INSERT INTO {SEARCH_INDEX_TABLE}({SEARCH_INDEX_TABLE}, rowid, title) VALUES ('delete', old.id, old.title); "
+    f"INSERT INTO {SEARCH_INDEX_TABLE}(rowid, title) VALUES (new.id, new.title); END",
+    # Index the rows that already exist
+    f"INSERT INTO {SEARCH_INDEX_TABLE}({SEARCH_INDEX_TABLE}) VALUES ('rebuild')",
+)
+
+# Engine -> (index exists, monotonic time checked); entries go with their engine
+_search_index_present: "weakref.WeakKeyDictionary[Engine, Tuple[bool, float]]" = weakref.WeakKeyDictionary()
+
+
+def is_file_database(url: str) -> bool:
+    """Whether a database URL points at an SQLite file (not in-memory)"""
+    return url.startswith("sqlite") and url not in ("sqlite://", "sqlite:///:memory:") and ":memory:" not in url
+
+
+def install_pragmas(engine: Engine, read_only: bool = False) -> None:
+    """
+    Apply the tuned pragmas to every connection the engine opens
+
+    Args:
+        engine: Engine of an SQLite file database
+        read_only: Also set ``query_only`` so the connection can't write
+    """
+    @event.listens_for(engine, "connect")
+    def _apply_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            cursor.execute(f"PRAGMA busy_timeout = {SQLITE_BUSY_TIMEOUT_MS}")
+            cursor.execute(f"PRAGMA journal_mode = {SQLITE_JOURNAL_MODE}")
+            cursor.execute(f"PRAGMA synchronous = {SQLITE_SYNCHRONOUS}")
+            cursor.execute(f"PRAGMA mmap_size = {SQLITE_MMAP_SIZE}")
+            cursor.execute(f"PRAGMA cache_size = {SQLITE_CACHE_SIZE}")
+            cursor.execute("PRAGMA temp_store = MEMORY")
+            if read_only:
+                cursor.execute("PRAGMA query_only = ON")
+        finally:
+            cursor.close()
+
+
+def supports_search_index(conn: Connection) -> bool:
+    """Whether the connected database can hold the FTS5 trigram index"""
+    if conn.dialect.name != "sqlite":
+        return False
+    # trigram tokenizer: SQLite 3.34+
+    return conn.dialect.dbapi.sqlite_version_info >= (3, 34, 0)
+
+
+def has_search_index(conn: Connection) -> bool:
+    """Whether the FTS5 index on task titles exists"""
+    return conn.execute(
+        text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+        {"name": SEARCH_INDEX_TABLE}
+    ).first() is not None
+
+
+def create_search_index(conn: Connection) -> bool:
+    """
+    Create (and fill) the FTS5 index on task titles plus its sync triggers
+
+    Args:
+        conn: Connection to the SQLite database
+
+    Returns:
+        True if the index was created, False if unsupported or already there
+    """
+    if not supports_search_index(conn) or has_search_index(conn):
+        return False
+    for statement in _SEARCH_INDEX_DDL:
+        conn.execute(text(statement))
+    _search_index_present.clear()
+    return True
+
+
+def drop_search_index(conn: Connection) -> None:
+    """Drop the FTS5 index and its triggers (SQLite only)"""
+    if conn.dialect.name != "sqlite":
+        return
+    for trigger in ("tasks_fts_insert", "tasks_fts_delete", "tasks_fts_update"):
+        conn.execute(text(f"DROP TRIGGER IF EXISTS {trigger}"))
+    conn.execute(text(f"DROP TABLE IF EXISTS {SEARCH_INDEX_TABLE}"))
+    _search_index_present.clear()
+
+
+def search_index_available(engine: Engine) -> bool:
+    """
+    Whether title search should use the FTS5 index
+
+    The answer is cached per engine for SQLITE_FTS_RECHECK_SECONDS, and
+    dropped at once when this process creates or drops the index.
+
+    Args:
+        engine: Engine the search runs on
+
+    Returns:
+        True on SQLite when SQLITE_FTS_SEARCH is on and the index exists
+    """
+    if not SQLITE_FTS_SEARCH or engine.dialect.name != "sqlite":
+        return False
+    now = time.monotonic()
+    cached = _search_index_present.get(engine)
+    if cached is None or now - cached[1] >= SQLITE_FTS_RECHECK_SECONDS:
+        with engine.connect() as conn:
+            cached = (has_search_index(conn), now)
+        _search_index_present[engine] = cached
+    return cached[0]
+
+
+def title_match(title: str):
+    """
+    Subquery of task IDs whose title contains ``title`` (case-insensitive)
+
+    Args:
+        title: Substring of at least SEARCH_INDEX_MIN_LENGTH characters
+
+    Returns:
+        SELECT of matching rowids for use with ``Task.id.in_()``
+    """
+    # A quoted FTS5 string matches the literal substring; quotes are doubled
+    phrase = '"' + title.replace('"', '""') + '"'
+    return select(tasks_fts.c.rowid).where(tasks_fts.c.title.op("MATCH")(phrase))
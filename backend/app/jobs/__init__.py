@@ -0,0 +1,10 @@
+# Background jobs package
+from .archival import ArchivalWorker, archival_worker
+from .snapshot import AnalyticsSnapshotWorker, analytics_snapshot_worker
+from .runner import JobRunner, job_runner, OPERATIONS
+from . import operations
+
+__all__ = [
+    "ArchivalWorker", "archival_worker", "AnalyticsSnapshotWorker", "analytics_snapshot_worker",
+    "JobRunner", "job_runner", "OPERATIONS"
+]
@@ -0,0 +1,126 @@
+"""
+Periodic archival of old soft-deleted tasks
+
+Runs inside the API process when ARCHIVE_INTERVAL_SECONDS is set, or once
+from the command line:
+
+    python -m app.jobs.archival --older-than-days 30 --batch-size 1000
+"""
+
+import argparse
+import logging
+import os
+import threading
+from typing import Callable, Optional
+
+from sqlalchemy.orm import Session
+
+from app.db.database import SessionLocal, get_engine
+from app.db.tenancy import routed_engines
+from app.db.locks import advisory_lock
+from app.db.partitions import ensure_future_partitions
+from app.services.archive_service import (
+    ArchiveService, ARCHIVE_AFTER_DAYS, ARCHIVE_BATCH_SIZE, ARCHIVE_BATCH_PAUSE_MS
+)
+
+logger = logging.getLogger(__name__)
+
+# How often the in-process archival job runs (0 disables it)
+ARCHIVE_INTERVAL_SECONDS = float(os.getenv("ARCHIVE_INTERVAL_SECONDS", "0"))
+
+
+def run_archival(older_than_days: int = ARCHIVE_AFTER_DAYS, batch_size: int = ARCHIVE_BATCH_SIZE,
+                 pause_ms: float = ARCHIVE_BATCH_PAUSE_MS) -> int:
+    """
+    Archive old soft-deleted tasks using a fresh session
+
+    Covers the main database and every database tenants are routed to
+    (TENANT_DATABASE_URLS), one after the other.
+
+    Returns:
+        Number of tasks archived
+    """
+    archived = 0
+    databases = [(get_engine(), SessionLocal)]
+    databases += [(engine, lambda engine=engine: SessionLocal(bind=engine)) for engine in routed_engines()]
+    for engine, session_factory in databases:
+        # Only one worker process archives a database at a time
+        with advisory_lock(engine, "task_archival") as acquired:
+            if acquired:
+                archived += _archive(session_factory, older_than_days, batch_size, pause_ms)
+    return archived
+
+
+def _archive(session_factory: Callable[[], Session], older_than_days: int, batch_size: int,
+             pause_ms: float) -> int:
+    db = session_factory()
+    try:
+        archive_service = ArchiveService(db)
+        # Whole partitions first (instant on a partitioned table), then rows
+        archived = archive_service.archive_deleted_partitions(older_than_days=older_than_days)
+        archived += archive_service.archive_deleted_tasks(
+            older_than_days=older_than_days, batch_size=batch_size, pause_ms=pause_ms
+        )
+        created = ensure_future_partitions(db.connection())
+        if created:
+            logger.info("Created task partitions %s", ", ".join(created))
+        db.commit()
+    finally:
+        db.close()
+    if archived:
+        logger.info("Archived %d soft-deleted task(s)", archived)
+    return archived
+
+
+class ArchivalWorker:
+    """
+    Daemon thread running the archival job every ``interval`` seconds
+    """
+
+    def __init__(self, interval: float = ARCHIVE_INTERVAL_SECONDS):
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start the worker if an interval is configured"""
+        if self.interval <= 0 or self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="task-archival", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the worker after the current batch"""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                run_archival()
+            except Exception:
+                logger.exception("Task archival run failed")
+
+
+# Shared instance started by the application lifespan
+archival_worker = ArchivalWorker()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Archive old soft-deleted tasks")
+    parser.add_argument("--older-than-days", type=int, default=ARCHIVE_AFTER_DAYS)
+    parser.add_argument("--batch-size", type=int, default=ARCHIVE_BATCH_SIZE)
+    parser.add_argument("--pause-ms", type=float, default=ARCHIVE_BATCH_PAUSE_MS)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    archived = run_archival(args.older_than_days, args.batch_size, args.pause_ms)
+    print(f"Archived {archived} task(s)")
+
+
+if __name__ == "__main__":
+    main()
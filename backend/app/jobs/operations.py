@@ -0,0 +1,96 @@
+"""
+Job operations available through POST /jobs
+
+Each handler receives its own session (on the job tenant's database), the
+validated parameters and a JobContext, and returns a JSON-serializable
+result stored on the job.
+"""
+
+import os
+from typing import Any, Dict
+
+from sqlalchemy.orm import Session
+
+from app.jobs.runner import JobContext, operation
+from app.schemas.job import ArchiveJobParams, ExportJobParams, ImportJobParams, ReconcileCountersJobParams
+from app.schemas.task import BulkDeleteRequest, BulkRestoreRequest, TaskResponse
+from app.services.archive_service import ArchiveService, ARCHIVE_AFTER_DAYS
+from app.services.task_service import TaskService
+from app.services.tenant_counter_service import TenantCounterService
+
+# Directory export jobs write their JSON Lines files to
+JOB_EXPORT_DIR = os.getenv("JOB_EXPORT_DIR", "exports")
+
+
+def export_path(job_id: int) -> str:
+    """Path of the file written by an export job"""
+    return os.path.join(JOB_EXPORT_DIR, f"tasks-export-{job_id}.jsonl")
+
+
+@operation(
+    "bulk_delete",
+    BulkDeleteRequest,
+    total=lambda params: len(set(params.task_ids)) if params.task_ids is not None else None
+)
+def bulk_delete(db: Session, params: BulkDeleteRequest, context: JobContext) -> Dict[str, Any]:
+    task_service = TaskService(db, context.tenant_id)
+    report = lambda processed, deleted: context.progress(processed)
+    if params.filter is not None:
+        deleted_count = task_service.bulk_delete_matching(params.filter, progress=report)
+    else:
+        deleted_count = task_service.bulk_delete_tasks(params.task_ids, progress=report)
+    return {"deleted_count": deleted_count}
+
+
+@operation("bulk_restore", BulkRestoreRequest, total=lambda params: len(set(params.task_ids)))
+def bulk_restore(db: Session, params: BulkRestoreRequest, context: JobContext) -> Dict[str, Any]:
+    restored_count = TaskService(db, context.tenant_id).bulk_restore_tasks(
+        params.task_ids, progress=lambda processed, restored: context.progress(processed)
+    )
+    return {"restored_count": restored_count}
+
+
+@operation("archive", ArchiveJobParams)
+def archive(db: Session, params: ArchiveJobParams, context: JobContext) -> Dict[str, Any]:
+    older_than_days = params.older_than_days if params.older_than_days is not None else ARCHIVE_AFTER_DAYS
+    archive_service = ArchiveService(db, context.tenant_id)
+    archived = archive_service.archive_deleted_partitions(older_than_days=older_than_days)
+    archived += archive_service.archive_deleted_tasks(
+        older_than_days=older_than_days,
+        progress=lambda moved: context.progress(archived + moved)
+    )
+    return {"archived_count": archived}
+
+
+@operation("import", ImportJobParams, total=lambda params: len(params.tasks))
+def import_tasks(db: Session, params: ImportJobParams, context: JobContext) -> Dict[str, Any]:
+    created_count = TaskService(db, context.tenant_id).import_tasks(
+        params.tasks, progress=lambda processed, created: context.progress(processed)
+    )
+    return {"created_count": created_count}
+
+
+@operation("export", ExportJobParams)
+def export_tasks(db: Session, params: ExportJobParams, context: JobContext) -> Dict[str, Any]:
+    path = export_path(context.job_id)
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    exported = 0
+    # Write to a temporary name so a partial file is never served
+    partial_path = path + ".part"
+    try:
+        with open(partial_path, "w", encoding="utf-8") as export_file:
+            for chunk in TaskService(db, context.tenant_id).iter_tasks(params.filter, include_deleted=params.include_deleted):
+                export_file.writelines(TaskResponse.model_validate(task).model_dump_json() + "\n" for task in chunk)
+                exported += len(chunk)
+                context.progress(exported)
+    except BaseException:
+        os.remove(partial_path)
+        raise
+    os.replace(partial_path, path)
+    return {"exported_count": exported, "file": path}
+
+
+@operation("reconcile_counters", ReconcileCountersJobParams)
+def reconcile_counters(db: Session, params: ReconcileCountersJobParams, context: JobContext) -> Dict[str, Any]:
+    corrections = TenantCounterService(db).reconcile(context.tenant_id)
+    return {"corrections": corrections}
@@ -0,0 +1,288 @@
+"""
+In-process runner for background jobs queued through POST /jobs
+
+Jobs are persisted in the ``jobs`` table and executed on a small thread
+pool, one fresh database session per job (on the database of the tenant
+that queued it). Operations report progress
+between chunks; that is also where cancellation takes effect, so work
+already committed by earlier chunks stays done.
+"""
+
+import logging
+import os
+import socket
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Type
+
+from pydantic import BaseModel
+from sqlalchemy.orm import Session
+
+from app.db.database import SessionLocal
+from app.db.tenancy import DEFAULT_TENANT_ID, tenant_session
+from app.services.job_service import (
+    JobService, JOB_CANCELLED, JOB_FAILED, JOB_SUCCEEDED
+)
+
+logger = logging.getLogger(__name__)
+
+# Number of jobs executed concurrently per process
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", "2"))
+
+
+def worker_id() -> str:
+    """Identify this process in jobs.claimed_by ("host:pid")"""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class JobCancelled(Exception):
+    """Raised at a progress checkpoint when the job was cancelled"""
+
+
+class JobInterrupted(Exception):
+    """Raised at a progress checkpoint when the runner is shutting down"""
+
+
+@dataclass
+class Operation:
+    """
+    A registered job operation
+
+    Attributes:
+        params: Pydantic model validating the job parameters
+        handler: Callable(db, params, context) returning the job result
+        total: Callable(params) returning the item count known up front (optional)
+    """
+    params: Type[BaseModel]
+    handler: Callable[[Session, Any, "JobContext"], Dict[str, Any]]
+    total: Optional[Callable[[Any], Optional[int]]] = None
+
+
+# Operation name -> Operation, filled by @operation in app.jobs.operations
+OPERATIONS: Dict[str, Operation] = {}
+
+
+def operation(name: str, params: Type[BaseModel], total: Optional[Callable[[Any], Optional[int]]] = None):
+    """
+    Register a function as the handler of a job operation
+
+    Args:
+        name: Operation name used in POST /jobs
+        params: Pydantic model validating the job parameters
+        total: Callable(params) returning the item count known up front (optional)
+    """
+    def register(handler):
+        OPERATIONS[name] = Operation(params=params, handler=handler, total=total)
+        return handler
+    return register
+
+
+class JobContext:
+    """
+    Progress reporting and cancellation checks for a running job
+
+    Attributes:
+        job_id: The ID of the job
+        tenant_id: Tenant that queued the job; operations only touch its tasks
+    """
+
+    def __init__(self, job_id: int, stopping: threading.Event, tenant_id: str = DEFAULT_TENANT_ID):
+        self.job_id = job_id
+        self.tenant_id = tenant_id
+        self._stopping = stopping
+
+    def progress(self, processed: int, total: Optional[int] = None) -> None:
+        """
+        Record progress and stop the job if it was cancelled
+
+        Raises:
+            JobCancelled: Cancellation was requested through the API
+            JobInterrupted: The runner is shutting down
+        """
+        db = SessionLocal()
+        try:
+            cancel_requested = JobService(db).report_progress(self.job_id, processed, total)
+        finally:
+            db.close()
+        if cancel_requested:
+            raise JobCancelled()
+        if self._stopping.is_set():
+            raise JobInterrupted()
+
+
+class JobRunner:
+    """
+    Thread pool executing queued jobs
+    """
+
+    def __init__(self, workers: int = JOB_WORKERS):
+        self.workers = workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._stopping = threading.Event()
+        self._lock = threading.Lock()
+        # Jobs this process has scheduled but not started, and is running
+        self.queued = 0
+        self.running = 0
+
+    def validate(self, operation_name: str, params: Dict[str, Any]) -> BaseModel:
+        """
+        Validate job parameters against the operation's schema
+
+        Raises:
+            KeyError: Unknown operation
+            pydantic.ValidationError: Invalid parameters
+        """
+        return OPERATIONS[operation_name].params.model_validate(params)
+
+    def enqueue(self, db: Session, operation_name: str, params: Dict[str, Any], tenant_id: str = DEFAULT_TENANT_ID):
+        """
+        Validate, persist and schedule a job
+
+        Args:
+            db: Session used to persist the job
+            operation_name: Registered operation name
+            params: Raw operation parameters
+            tenant_id: Tenant whose tasks the job works on
+
+        Returns:
+            The queued Job object
+
+        Raises:
+            KeyError: Unknown operation
+            pydantic.ValidationError: Invalid parameters
+        """
+        spec = OPERATIONS[operation_name]
+        validated = self.validate(operation_name, params)
+        total = spec.total(validated) if spec.total else None
+        job = JobService(db).create_job(operation_name, validated.model_dump(mode="json"), total, tenant_id)
+        self.submit(job.id)
+        return job
+
+    def submit(self, job_id: int) -> None:
+        """Schedule an already persisted job"""
+        with self._lock:
+            if self._executor is None:
+                self._stopping.clear()
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="job")
+            self.queued += 1
+            self._executor.submit(self._run, job_id)
+
+    def start(self) -> None:
+        """
+        Recover jobs after a restart
+
+        Jobs left running by a process that no longer exists are failed;
+        queued jobs are scheduled again.
+        """
+        db = SessionLocal()
+        try:
+            job_service = JobService(db)
+            gone = [worker for worker in job_service.get_running_workers() if not _worker_alive(worker)]
+            failed = job_service.fail_interrupted_jobs(gone)
+            if failed:
+                logger.warning("Marked %d interrupted job(s) as failed", failed)
+            queued = job_service.get_queued_job_ids()
+        finally:
+            db.close()
+        for job_id in queued:
+            self.submit(job_id)
+
+    def stop(self) -> None:
+        """
+        Stop the runner
+
+        Queued jobs stay queued for the next start; running jobs stop at
+        their next progress checkpoint and are marked as failed.
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is None:
+            return
+        self._stopping.set()
+        executor.shutdown(wait=True, cancel_futures=True)
+        with self._lock:
+            # Cancelled futures never reach _run
+            self.queued = 0
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get the in-memory job backlog of this process
+
+        Returns:
+            Dictionary with worker, queued and running counts
+        """
+        with self._lock:
+            return {"workers": self.workers, "queued": self.queued, "running": self.running}
+
+    def _run(self, job_id: int) -> None:
+        with self._lock:
+            self.queued -= 1
+            self.running += 1
+        try:
+            self._execute(job_id)
+        finally:
+            with self._lock:
+                self.running -= 1
+
+    def _execute(self, job_id: int) -> None:
+        db = SessionLocal()
+        try:
+            job_service = JobService(db)
+            if self._stopping.is_set() or not job_service.claim_job(job_id, worker_id()):
+                # Cancelled while queued, or claimed by another process
+                return
+            job = job_service.get_job(job_id)
+            spec = OPERATIONS.get(job.operation)
+            if spec is None:
+                job_service.finish_job(job_id, JOB_FAILED, error=f"Unknown operation '{job.operation}'")
+                return
+
+            context = JobContext(job_id, self._stopping, job.tenant_id)
+            work_db = tenant_session(job.tenant_id)
+            try:
+                result = spec.handler(work_db, spec.params.model_validate(job.params), context)
+            except JobCancelled:
+                work_db.rollback()
+                job_service.finish_job(job_id, JOB_CANCELLED)
+                return
+            except JobInterrupted:
+                work_db.rollback()
+                job_service.finish_job(job_id, JOB_FAILED, error="Interrupted by shutdown")
+                return
+            except Exception as exc:
+                work_db.rollback()
+                logger.exception("Job %d (%s) failed", job_id, job.operation)
+                job_service.finish_job(job_id, JOB_FAILED, error=str(exc) or type(exc).__name__)
+                return
+            finally:
+                work_db.close()
+            job_service.finish_job(job_id, JOB_SUCCEEDED, result=result)
+        except Exception:
+            logger.exception("Could not run job %d", job_id)
+        finally:
+            db.close()
+
+
+def _worker_alive(worker: Optional[str]) -> bool:
+    """Whether the process named by a "host:pid" identifier is still running"""
+    if not worker:
+        return False
+    host, _, pid = worker.rpartition(":")
+    if host != socket.gethostname():
+        # Processes on other hosts recover their own jobs
+        return True
+    if worker == worker_id():
+        # Left over from a previous process that had the same PID
+        return False
+    try:
+        os.kill(int(pid), 0)
+    except (ValueError, ProcessLookupError):
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+# Shared instance started by the application lifespan
+job_runner = JobRunner()
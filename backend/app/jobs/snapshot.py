@@ -0,0 +1,113 @@
+"""
+Periodic rebuild of the columnar analytics snapshot
+
+Runs inside the API process when ANALYTICS_SNAPSHOT_INTERVAL_SECONDS is
+set, or once from the command line:
+
+    python -m app.jobs.snapshot
+"""
+
+import argparse
+import logging
+import os
+import threading
+from typing import Optional
+
+from app.db.database import get_engine
+from app.db.locks import advisory_lock
+from app.services.task_snapshot import (
+    ANALYTICS_SNAPSHOT_CHUNK_SIZE, ANALYTICS_SNAPSHOT_DIR, SnapshotStore, build_snapshot, snapshot_store
+)
+
+logger = logging.getLogger(__name__)
+
+# How often the in-process worker rebuilds the snapshot (0 disables it)
+ANALYTICS_SNAPSHOT_INTERVAL_SECONDS = float(os.getenv("ANALYTICS_SNAPSHOT_INTERVAL_SECONDS", "0"))
+
+
+def refresh_snapshot(store: SnapshotStore = snapshot_store, max_age: float = 0,
+                     chunk_size: int = ANALYTICS_SNAPSHOT_CHUNK_SIZE) -> bool:
+    """
+    Rebuild the snapshot unless the current one is younger than ``max_age``
+
+    Worker processes sharing a snapshot directory skip a rebuild another
+    one just finished; the database lock keeps two from building at once.
+
+    Args:
+        store: Store of the snapshot directory
+        max_age: Keep a current snapshot younger than this many seconds
+        chunk_size: Rows read per query
+
+    Returns:
+        True if a new snapshot was built
+    """
+    age = store.age_seconds()
+    if age is not None and age < max_age:
+        return False
+    with advisory_lock(get_engine(), "analytics_snapshot") as acquired:
+        if not acquired:
+            return False
+        snapshot = build_snapshot(store.directory, chunk_size)
+    logger.info("Built analytics snapshot %s (%d rows)", snapshot.name, snapshot.rows)
+    return True
+
+
+class AnalyticsSnapshotWorker:
+    """
+    Daemon thread rebuilding the analytics snapshot every ``interval`` seconds
+    """
+
+    def __init__(self, interval: float = ANALYTICS_SNAPSHOT_INTERVAL_SECONDS):
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start the worker if an interval is configured"""
+        if self.interval <= 0 or self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="analytics-snapshot", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the worker after the current build"""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+    def _run(self) -> None:
+        # First pass right away, so a fresh install gets a snapshot at start-up
+        while True:
+            try:
+                refresh_snapshot(max_age=self.interval / 2)
+            except Exception:
+                logger.exception("Analytics snapshot build failed")
+            if self._stop.wait(self.interval):
+                return
+
+
+# Shared instance started by the application lifespan
+analytics_snapshot_worker = AnalyticsSnapshotWorker()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Build the columnar analytics snapshot")
+    parser.add_argument("--directory", default=ANALYTICS_SNAPSHOT_DIR)
+    parser.add_argument("--chunk-size", type=int, default=ANALYTICS_SNAPSHOT_CHUNK_SIZE)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    # Same lock as the API workers: never two builds at once
+    store = SnapshotStore(args.directory)
+    if not refresh_snapshot(store, chunk_size=args.chunk_size):
+        print("Another process is building the snapshot; nothing done")
+        raise SystemExit(1)
+    snapshot = store.get()
+    print(f"Built {snapshot.name}: {snapshot.rows} row(s), {len(snapshot.tenants)} tenant(s)")
+
+
+if __name__ == "__main__":
+    main()
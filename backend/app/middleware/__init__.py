@@ -0,0 +1,6 @@
+# Middleware package
+from .profiling import ProfilingMiddleware, InstrumentedJSONResponse
+from .compression import CompressionMiddleware
+from .rate_limit import RateLimitMiddleware
+
+__all__ = ["ProfilingMiddleware", "InstrumentedJSONResponse", "CompressionMiddleware", "RateLimitMiddleware"]
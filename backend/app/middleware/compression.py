@@ -0,0 +1,246 @@
+"""
+Response compression middleware (gzip, plus brotli and zstd when installed)
+"""
+
+import os
+import zlib
+from typing import Dict, List, Optional, Tuple
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # optional dependency
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # optional dependency
+    zstandard = None
+
+# Compress responses at all
+COMPRESSION_ENABLED = os.getenv("COMPRESSION_ENABLED", "true").lower() in ("1", "true", "yes")
+# Bodies smaller than this are sent as-is (compression would not pay off)
+COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", "1024"))
+# Server preference order; encodings whose library isn't installed are skipped
+COMPRESSION_ALGORITHMS = [
+    name.strip() for name in os.getenv("COMPRESSION_ALGORITHMS", "zstd,br,gzip").split(",") if name.strip()
+]
+COMPRESSION_GZIP_LEVEL = int(os.getenv("COMPRESSION_GZIP_LEVEL", "6"))
+COMPRESSION_BROTLI_QUALITY = int(os.getenv("COMPRESSION_BROTLI_QUALITY", "4"))
+COMPRESSION_ZSTD_LEVEL = int(os.getenv("COMPRESSION_ZSTD_LEVEL", "3"))
+
+# Content types worth compressing (prefix match)
+_COMPRESSIBLE_TYPES = (
+    "text/", "application/json", "application/x-ndjson", "application/javascript",
+    "application/xml", "application/problem+json"
+)
+
+
+class StreamCompressor:
+    """
+    Incremental compressor with a uniform compress/flush/finish interface
+    """
+
+    def __init__(self, encoding: str):
+        self.encoding = encoding
+        if encoding == "gzip":
+            # wbits 16 + MAX_WBITS writes a gzip header and trailer
+            self._compressor = zlib.compressobj(COMPRESSION_GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+            self._flush = lambda: self._compressor.flush(zlib.Z_SYNC_FLUSH)
+            self._finish = self._compressor.flush
+        elif encoding == "br":
+            self._compressor = brotli.Compressor(quality=COMPRESSION_BROTLI_QUALITY)
+            self._flush = self._compressor.flush
+            self._finish = self._compressor.finish
+        elif encoding == "zstd":
+            self._compressor = zstandard.ZstdCompressor(level=COMPRESSION_ZSTD_LEVEL).compressobj()
+            self._flush = lambda: self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+            self._finish = self._compressor.flush
+        else:
+            raise ValueError(f"Unsupported encoding '{encoding}'")
+
+    def compress(self, data: bytes) -> bytes:
+        """Feed data; returns whatever compressed output is ready"""
+        if self.encoding == "br":
+            return self._compressor.process(data)
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        """Emit everything fed so far as a decodable block; the stream stays open"""
+        return self._flush()
+
+    def finish(self) -> bytes:
+        """Flush the remaining output and end the stream"""
+        return self._finish()
+
+
+def available_encodings() -> List[str]:
+    """
+    Encodings from COMPRESSION_ALGORITHMS whose library is installed
+
+    Returns:
+        Encoding names in server preference order
+    """
+    installed = {"gzip": True, "br": brotli is not None, "zstd": zstandard is not None}
+    return [name for name in COMPRESSION_ALGORITHMS if installed.get(name)]
+
+
+def parse_accept_encoding(header: str) -> Dict[str, float]:
+    """
+    Parse an Accept-Encoding header into {encoding: q-value}
+
+    Args:
+        header: Raw header value, e.g. "gzip, br;q=0.9"
+
+    Returns:
+        Mapping of lower-cased encodings to their quality
+    """
+    accepted: Dict[str, float] = {}
+    for part in header.split(","):
+        name, _, params = part.strip().partition(";")
+        if not name:
+            continue
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[name.strip().lower()] = quality
+    return accepted
+
+
+def choose_encoding(header: str, encodings: List[str]) -> Optional[str]:
+    """
+    Pick the encoding to use for a request
+
+    Args:
+        header: Accept-Encoding header value
+        encodings: Encodings the server offers, in preference order
+
+    Returns:
+        The encoding with the highest client quality (server order breaks
+        ties), or None when nothing acceptable is available
+    """
+    accepted = parse_accept_encoding(header)
+    wildcard = accepted.get("*", 0.0)
+    best: Optional[Tuple[float, str]] = None
+    for encoding in encodings:
+        quality = accepted.get(encoding, wildcard)
+        if quality > 0 and (best is None or quality > best[0]):
+            best = (quality, encoding)
+    return best[1] if best else None
+
+
+class CompressionMiddleware:
+    """
+    Pure ASGI middleware compressing response bodies
+
+    Single-message responses are compressed in one go when they reach
+    ``minimum_size`` and get an exact Content-Length. Streaming responses
+    (``more_body``) are compressed incrementally, and every chunk is
+    flushed (a sync flush for gzip, the brotli/zstd block equivalent) so
+    the client can decode it as soon as it arrives; otherwise the
+    compressor would hold small chunks (progress lines, NDJSON rows) back
+    until its buffer fills. Responses that are already encoded, not
+    textual, or smaller than the threshold pass through untouched.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = COMPRESSION_MIN_SIZE,
+        encodings: Optional[List[str]] = None
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.encodings = available_encodings() if encodings is None else encodings
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not COMPRESSION_ENABLED:
+            await self.app(scope, receive, send)
+            return
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding", ""), self.encodings)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        await _CompressedResponder(self.app, encoding, self.minimum_size)(scope, receive, send)
+
+
+class _CompressedResponder:
+    """Per-request state of CompressionMiddleware"""
+
+    def __init__(self, app: ASGIApp, encoding: str, minimum_size: int):
+        self.app = app
+        self.encoding = encoding
+        self.minimum_size = minimum_size
+        self.send: Send = None
+        self.start_message: Optional[Message] = None
+        self.compressor: Optional[StreamCompressor] = None
+        self.passthrough = False
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        self.send = send
+        await self.app(scope, receive, self.send_compressed)
+
+    async def send_compressed(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            headers = Headers(raw=message["headers"])
+            self.passthrough = (
+                "content-encoding" in headers
+                or message["status"] in (204, 304)
+                or not headers.get("content-type", "").startswith(_COMPRESSIBLE_TYPES)
+            )
+            if self.passthrough:
+                await self.send(message)
+            else:
+                # Held back until the first body chunk decides the encoding
+                self.start_message = message
+            return
+
+        if message["type"] != "http.response.body" or self.passthrough:
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.start_message is not None:
+            start, self.start_message = self.start_message, None
+            if not more_body:
+                # Whole body in one message
+                if len(body) < self.minimum_size:
+                    self.passthrough = True
+                    await self.send(start)
+                    await self.send(message)
+                    return
+                compressor = StreamCompressor(self.encoding)
+                compressed = compressor.compress(body) + compressor.finish()
+                self._set_encoding_headers(start, len(compressed))
+                await self.send(start)
+                await self.send({"type": "http.response.body", "body": compressed})
+                return
+            # Streaming: total size unknown, drop Content-Length
+            self.compressor = StreamCompressor(self.encoding)
+            self._set_encoding_headers(start, None)
+            await self.send(start)
+
+        data = self.compressor.compress(body) if body else b""
+        if not more_body:
+            data += self.compressor.finish()
+        elif body:
+            data += self.compressor.flush()
+        if data or not more_body:
+            await self.send({"type": "http.response.body", "body": data, "more_body": more_body})
+
+    def _set_encoding_headers(self, start: Message, length: Optional[int]) -> None:
+        headers = MutableHeaders(raw=start["headers"])
+        headers["Content-Encoding"] = self.encoding
+        headers.add_vary_header("Accept-Encoding")
+        if length is None:
+            del headers["Content-Length"]
+        else:
+            headers["Content-Length"] = str(length)
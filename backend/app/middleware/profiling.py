@@ -0,0 +1,197 @@
+"""
+Request profiling middleware: Server-Timing headers, Prometheus metrics and
+optional stack-sampling dumps for slow requests
+"""
+
+import asyncio
+import logging
+import os
+import random
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from fastapi.responses import JSONResponse
+
+from app.db.instrumentation import RequestStats, current_request_stats
+from app.middleware.request_metrics import request_metrics
+
+logger = logging.getLogger(__name__)
+
+# Add a Server-Timing header to every response
+SERVER_TIMING_HEADER = os.getenv("SERVER_TIMING_HEADER", "true").lower() in ("1", "true", "yes")
+# Dump a stack-sampling profile for sampled requests slower than this (0 disables)
+PROFILE_SLOW_REQUEST_MS = float(os.getenv("PROFILE_SLOW_REQUEST_MS", "0"))
+# Fraction of requests that run under the sampler when profiling is enabled
+PROFILE_SAMPLE_RATE = float(os.getenv("PROFILE_SAMPLE_RATE", "0.1"))
+PROFILE_INTERVAL_MS = float(os.getenv("PROFILE_INTERVAL_MS", "5"))
+PROFILE_DUMP_DIR = os.getenv("PROFILE_DUMP_DIR", "profiles")
+
+# Innermost frames that mean a thread is idle rather than doing work
+_IDLE_MODULES = ("threading.py", "queue.py", "selectors.py", "concurrent/futures/thread.py")
+
+
+class InstrumentedJSONResponse(JSONResponse):
+    """
+    JSONResponse that records how long rendering the body took
+    """
+
+    def render(self, content: Any) -> bytes:
+        stats = current_request_stats.get()
+        if stats is None:
+            return super().render(content)
+        started = time.perf_counter()
+        body = super().render(content)
+        stats.serialization_time += time.perf_counter() - started
+        return body
+
+
+class StackSampler:
+    """
+    Samples the stacks of the threads working on one request at a fixed interval
+
+    Samples are aggregated as collapsed stacks ("frame;frame;frame count"),
+    the input format of flamegraph.pl and speedscope. The event loop thread
+    is sampled only while the request's own task is running on it (async
+    endpoints, serialization); threadpool workers are sampled once they have
+    run a statement for the request (sync endpoints), see RequestStats.
+    Other requests served meanwhile stay out of the profile.
+    """
+
+    def __init__(self, interval: float, stats: RequestStats):
+        self.interval = interval
+        self.stats = stats
+        self.samples: Counter = Counter()
+        self._loop = asyncio.get_running_loop()
+        self._task = asyncio.current_task()
+        self._loop_thread_id = threading.get_ident()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="request-sampler", daemon=True)
+
+    def start(self) -> "StackSampler":
+        self._thread.start()
+        return self
+
+    def stop(self) -> Counter:
+        self._stop.set()
+        self._thread.join()
+        return self.samples
+
+    def _is_request_thread(self, thread_id: int) -> bool:
+        if thread_id == self._loop_thread_id:
+            return asyncio.current_task(self._loop) is self._task
+        return thread_id in self.stats.thread_ids
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            for thread_id, frame in sys._current_frames().items():
+                if not self._is_request_thread(thread_id) or frame.f_code.co_filename.endswith(_IDLE_MODULES):
+                    continue
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(f"{os.path.basename(code.co_filename)}:{code.co_name}:{frame.f_lineno}")
+                    frame = frame.f_back
+                self.samples[";".join(reversed(stack))] += 1
+
+
+def _route_label(scope: Dict[str, Any]) -> str:
+    """
+    Resolve the route template (e.g. /tasks/{task_id}) a request matched
+    """
+    endpoint = scope.get("endpoint")
+    app = scope.get("app")
+    if endpoint is None or app is None:
+        return "unmatched"
+    routes = getattr(app, "_route_labels", None)
+    if routes is None:
+        routes = {getattr(route, "endpoint", None): route.path for route in app.routes}
+        app._route_labels = routes
+    return routes.get(endpoint, "unmatched")
+
+
+class ProfilingMiddleware:
+    """
+    ASGI middleware recording statement count, database time, serialization
+    time and total handler time for each request
+
+    Results are exported as a Server-Timing header and collected into the
+    Prometheus registry served at /internal/metrics.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats()
+        token = current_request_stats.set(stats)
+        sampler: Optional[StackSampler] = None
+        if PROFILE_SLOW_REQUEST_MS > 0 and random.random() < PROFILE_SAMPLE_RATE:
+            sampler = StackSampler(PROFILE_INTERVAL_MS / 1000.0, stats).start()
+
+        status_code = 500
+        total = None
+
+        async def send_wrapper(message):
+            nonlocal status_code, total
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                total = stats.elapsed
+                if SERVER_TIMING_HEADER:
+                    headers = list(message.get("headers", []))
+                    headers.append((b"server-timing", _server_timing(stats, total).encode("latin-1")))
+                    message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            current_request_stats.reset(token)
+            if total is None:
+                total = stats.elapsed
+            route = _route_label(scope)
+            request_metrics.observe(
+                scope["method"], route, status_code, total,
+                stats.db_time, stats.statements, stats.serialization_time
+            )
+            if sampler is not None:
+                samples = sampler.stop()
+                if total * 1000 >= PROFILE_SLOW_REQUEST_MS:
+                    _dump_profile(scope["method"], route, total, stats, samples)
+
+
+def _server_timing(stats: RequestStats, total: float) -> str:
+    app_time = max(0.0, total - stats.db_time - stats.serialization_time)
+    return (
+        f'db;dur={stats.db_time * 1000:.2f};desc="{stats.statements} queries", '
+        f"serialize;dur={stats.serialization_time * 1000:.2f}, "
+        f"app;dur={app_time * 1000:.2f}, "
+        f"total;dur={total * 1000:.2f}"
+    )
+
+
+def _dump_profile(method: str, route: str, total: float, stats: RequestStats, samples: Counter) -> None:
+    """
+    Write collapsed stacks of a slow request to PROFILE_DUMP_DIR
+    """
+    try:
+        os.makedirs(PROFILE_DUMP_DIR, exist_ok=True)
+        slug = re.sub(r"[^A-Za-z0-9]+", "_", route).strip("_") or "root"
+        name = f"{datetime.now():%Y%m%d-%H%M%S-%f}-{method}-{slug}-{total * 1000:.0f}ms.folded"
+        path = os.path.join(PROFILE_DUMP_DIR, name)
+        with open(path, "w", encoding="utf-8") as handle:
+            handle.write(f"# {method} {route} total={total * 1000:.1f}ms db={stats.db_time * 1000:.1f}ms "
+                         f"statements={stats.statements}\n")
+            for stack, count in samples.most_common():
+                handle.write(f"{stack} {count}\n")
+        logger.warning("Slow request %s %s took %.1fms, profile written to %s", method, route, total * 1000, path)
+    except OSError:
+        logger.exception("Could not write request profile")
@@ -0,0 +1,248 @@
+"""
+Rate limiting and admission control protecting the database under overload
+
+Two independent checks run before a request reaches its handler:
+
+- a per-client token bucket (429 Too Many Requests when it runs dry);
+- a concurrency limit per endpoint class, so a burst of expensive search or
+  metrics queries can't take the connection pool away from cheap reads and
+  writes (503 Service Unavailable when no slot frees up quickly).
+
+Both responses carry Retry-After. Limits apply per worker process.
+"""
+
+import asyncio
+import math
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from starlette.datastructures import Headers
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.middleware.request_metrics import request_metrics
+
+# Enable both checks
+RATE_LIMIT_ENABLED = os.getenv("RATE_LIMIT_ENABLED", "true").lower() in ("1", "true", "yes")
+# Sustained requests per second per client, and the burst allowed on top
+RATE_LIMIT_PER_SECOND = float(os.getenv("RATE_LIMIT_PER_SECOND", "50"))
+RATE_LIMIT_BURST = float(os.getenv("RATE_LIMIT_BURST", "100"))
+# Number of client buckets kept (least recently seen clients are dropped)
+RATE_LIMIT_MAX_CLIENTS = int(os.getenv("RATE_LIMIT_MAX_CLIENTS", "10000"))
+# Identify clients by the first X-Forwarded-For address (only behind a trusted proxy)
+RATE_LIMIT_TRUST_FORWARDED = os.getenv("RATE_LIMIT_TRUST_FORWARDED", "false").lower() in ("1", "true", "yes")
+
+# Concurrent requests per endpoint class (0 disables the limit for that class);
+# the defaults add up to less than DB_POOL_SIZE + DB_MAX_OVERFLOW, so
+# writes always find a free connection
+CONCURRENCY_LIMIT_READ = int(os.getenv("CONCURRENCY_LIMIT_READ", "16"))
+CONCURRENCY_LIMIT_EXPENSIVE = int(os.getenv("CONCURRENCY_LIMIT_EXPENSIVE", "4"))
+CONCURRENCY_LIMIT_WRITE = int(os.getenv("CONCURRENCY_LIMIT_WRITE", "8"))
+# How long a request may wait for a free slot before it is shed
+ADMISSION_QUEUE_TIMEOUT_MS = float(os.getenv("ADMISSION_QUEUE_TIMEOUT_MS", "50"))
+
+READ = "read"
+EXPENSIVE = "expensive"
+WRITE = "write"
+
+# Paths never limited: health checks, docs and internal endpoints
+_EXEMPT_PATHS = ("/", "/health", "/livez", "/readyz", "/metrics/health", "/docs", "/redoc", "/openapi.json")
+_EXEMPT_PREFIXES = ("/internal/", "/docs/")
+# Read paths that run scans, aggregations or large lookups
+_EXPENSIVE_PREFIXES = ("/tasks/search", "/tasks/batch", "/metrics")
+# POST endpoints that only read (ID lists too long for a query string)
+_READ_ONLY_POSTS = ("/tasks/batch",)
+
+
+def classify(method: str, path: str) -> Optional[str]:
+    """
+    Endpoint class of a request
+
+    Args:
+        method: HTTP method
+        path: Request path
+
+    Returns:
+        "read", "expensive" or "write", or None for exempt requests
+    """
+    if path in _EXEMPT_PATHS or path.startswith(_EXEMPT_PREFIXES) or method == "OPTIONS":
+        return None
+    if method not in ("GET", "HEAD") and path not in _READ_ONLY_POSTS:
+        return WRITE
+    if path.startswith(_EXPENSIVE_PREFIXES):
+        return EXPENSIVE
+    return READ
+
+
+class TokenBucketLimiter:
+    """
+    Token buckets keyed by client, refilled continuously at ``rate`` per second
+    """
+
+    def __init__(self, rate: float = RATE_LIMIT_PER_SECOND, burst: float = RATE_LIMIT_BURST,
+                 max_clients: int = RATE_LIMIT_MAX_CLIENTS):
+        self.rate = rate
+        self.burst = burst
+        self.max_clients = max_clients
+        self._lock = threading.Lock()
+        # client -> (tokens, last refill time)
+        self._buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+
+    def acquire(self, client: str) -> float:
+        """
+        Take one token for a client
+
+        Args:
+            client: Client identifier
+
+        Returns:
+            0.0 if the request is allowed, otherwise seconds until a token is available
+        """
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated = self._buckets.pop(client, (self.burst, now))
+            tokens = min(self.burst, tokens + (now - updated) * self.rate)
+            if tokens >= 1.0:
+                tokens -= 1.0
+                wait = 0.0
+            else:
+                wait = (1.0 - tokens) / self.rate
+            self._buckets[client] = (tokens, now)
+            while len(self._buckets) > self.max_clients:
+                self._buckets.popitem(last=False)
+            return wait
+
+
+class ConcurrencyLimiter:
+    """
+    Bounded number of in-flight requests with a short admission queue
+    """
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.in_flight = 0
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    async def acquire(self, timeout: float) -> bool:
+        """
+        Wait up to ``timeout`` seconds for a slot
+
+        Returns:
+            True if a slot was taken (call ``release`` afterwards)
+        """
+        if self._semaphore is None:
+            # Created lazily so it binds to the server's event loop
+            self._semaphore = asyncio.Semaphore(self.limit)
+        if self._semaphore.locked():
+            if timeout <= 0:
+                return False
+            try:
+                await asyncio.wait_for(self._semaphore.acquire(), timeout)
+            except asyncio.TimeoutError:
+                return False
+        else:
+            await self._semaphore.acquire()
+        self.in_flight += 1
+        return True
+
+    def release(self) -> None:
+        """Free a slot taken by ``acquire``"""
+        self.in_flight -= 1
+        self._semaphore.release()
+
+
+def admission_stats(limiters: Dict[str, ConcurrencyLimiter]) -> Dict[str, Dict[str, int]]:
+    """
+    In-flight requests per endpoint class
+
+    Args:
+        limiters: Concurrency limiters keyed by endpoint class
+
+    Returns:
+        Mapping of endpoint class to its limit and current in-flight count
+    """
+    return {name: {"limit": limiter.limit, "in_flight": limiter.in_flight} for name, limiter in limiters.items()}
+
+
+def client_key(scope: Scope) -> str:
+    """
+    Identify the client a request is charged to
+
+    Returns:
+        Client address (first X-Forwarded-For hop when trusted)
+    """
+    if RATE_LIMIT_TRUST_FORWARDED:
+        forwarded = Headers(scope=scope).get("x-forwarded-for")
+        if forwarded:
+            return forwarded.split(",")[0].strip()
+    client = scope.get("client")
+    return client[0] if client else "unknown"
+
+
+class RateLimitMiddleware:
+    """
+    Pure ASGI middleware applying the token bucket and concurrency limits
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        limiter: Optional[TokenBucketLimiter] = None,
+        limits: Optional[Dict[str, int]] = None,
+        queue_timeout_ms: float = ADMISSION_QUEUE_TIMEOUT_MS
+    ):
+        self.app = app
+        self.limiter = limiter or TokenBucketLimiter()
+        if limits is None:
+            # Shared so health checks can report the in-flight counts
+            self.limiters = concurrency_limiters
+        else:
+            self.limiters = {name: ConcurrencyLimiter(limit) for name, limit in limits.items() if limit > 0}
+        self.queue_timeout = queue_timeout_ms / 1000.0
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        endpoint_class = classify(scope.get("method", ""), scope.get("path", "")) if scope["type"] == "http" else None
+        if not RATE_LIMIT_ENABLED or endpoint_class is None:
+            await self.app(scope, receive, send)
+            return
+
+        wait = self.limiter.acquire(client_key(scope)) if self.limiter.rate > 0 else 0.0
+        if wait > 0:
+            request_metrics.record_shed(endpoint_class, "rate_limited")
+            await _reject(429, "Too many requests", "Client request rate exceeded", wait)(scope, receive, send)
+            return
+
+        limiter = self.limiters.get(endpoint_class)
+        if limiter is None:
+            await self.app(scope, receive, send)
+            return
+        if not await limiter.acquire(self.queue_timeout):
+            request_metrics.record_shed(endpoint_class, "overloaded")
+            await _reject(
+                503, "Server overloaded", f"Too many concurrent {endpoint_class} requests", 1.0
+            )(scope, receive, send)
+            return
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            limiter.release()
+
+
+# Limiters used by the application's middleware (configured by CONCURRENCY_LIMIT_*)
+concurrency_limiters: Dict[str, ConcurrencyLimiter] = {
+    name: ConcurrencyLimiter(limit)
+    for name, limit in ((READ, CONCURRENCY_LIMIT_READ), (EXPENSIVE, CONCURRENCY_LIMIT_EXPENSIVE),
+                        (WRITE, CONCURRENCY_LIMIT_WRITE))
+    if limit > 0
+}
+
+
+def _reject(status_code: int, error: str, detail: str, retry_after: float) -> JSONResponse:
+    return JSONResponse(
+        {"error": error, "detail": detail, "status_code": status_code},
+        status_code=status_code,
+        headers={"Retry-After": str(max(1, math.ceil(retry_after)))}
+    )
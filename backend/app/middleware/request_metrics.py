@@ -0,0 +1,141 @@
+"""
+In-process request metrics rendered in the Prometheus text format
+"""
+
+import threading
+from bisect import bisect_left
+from typing import Dict, List, Sequence, Tuple
+
+LabelValues = Tuple[str, ...]
+
+DURATION_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+STATEMENT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+
+class Histogram:
+    """
+    Cumulative histogram with fixed buckets, one series per label set
+    """
+
+    def __init__(self, name: str, help_text: str, label_names: Sequence[str], buckets: Sequence[float]):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = tuple(label_names)
+        self.buckets = tuple(buckets)
+        # label values -> ([count per bucket..., +Inf], sum)
+        self.series: Dict[LabelValues, Tuple[List[int], List[float]]] = {}
+
+    def observe(self, labels: LabelValues, value: float) -> None:
+        counts, total = self.series.setdefault(labels, ([0] * (len(self.buckets) + 1), [0.0]))
+        counts[bisect_left(self.buckets, value)] += 1
+        total[0] += value
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        for labels, (counts, total) in sorted(self.series.items()):
+            base = _format_labels(self.label_names, labels)
+            cumulative = 0
+            for bound, count in zip(self.buckets, counts):
+                cumulative += count
+                lines.append(f'{self.name}_bucket{{{base},le="{bound:g}"}} {cumulative}')
+            cumulative += counts[-1]
+            lines.append(f'{self.name}_bucket{{{base},le="+Inf"}} {cumulative}')
+            lines.append(f"{self.name}_sum{{{base}}} {total[0]:.6f}")
+            lines.append(f"{self.name}_count{{{base}}} {cumulative}")
+        return lines
+
+
+class Counter:
+    """
+    Monotonic counter, one series per label set
+    """
+
+    def __init__(self, name: str, help_text: str, label_names: Sequence[str]):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = tuple(label_names)
+        self.series: Dict[LabelValues, float] = {}
+
+    def inc(self, labels: LabelValues, amount: float = 1.0) -> None:
+        self.series[labels] = self.series.get(labels, 0.0) + amount
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} counter"]
+        for labels, value in sorted(self.series.items()):
+            lines.append(f"{self.name}{{{_format_labels(self.label_names, labels)}}} {value:g}")
+        return lines
+
+
+def _format_labels(names: Sequence[str], values: LabelValues) -> str:
+    escaped = (value.replace("\\", "\\\\").replace('"', '\\"') for value in values)
+    return ",".join(f'{name}="{value}"' for name, value in zip(names, escaped))
+
+
+class RequestMetrics:
+    """
+    Registry of per-route request metrics
+
+    Statement-count histograms make N+1 patterns visible: a route whose
+    requests land in the high buckets issues one query per row.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = Counter(
+            "http_requests_total", "Total HTTP requests", ("method", "route", "status")
+        )
+        self.duration = Histogram(
+            "http_request_duration_seconds", "Total handler time until the response starts",
+            ("method", "route"), DURATION_BUCKETS
+        )
+        self.db_duration = Histogram(
+            "http_request_db_duration_seconds", "Time spent executing SQL per request",
+            ("method", "route"), DURATION_BUCKETS
+        )
+        self.statements = Histogram(
+            "http_request_db_statements", "SQL statements executed per request",
+            ("method", "route"), STATEMENT_BUCKETS
+        )
+        self.serialization = Histogram(
+            "http_request_serialization_seconds", "Time spent rendering the response body",
+            ("method", "route"), DURATION_BUCKETS
+        )
+        self.shed = Counter(
+            "http_requests_shed_total", "Requests rejected by rate limiting or admission control",
+            ("class", "reason")
+        )
+
+    def observe(self, method: str, route: str, status: int, total: float,
+                db_time: float, statements: int, serialization_time: float) -> None:
+        """
+        Record one finished request
+        """
+        labels = (method, route)
+        with self._lock:
+            self.requests.inc((method, route, str(status)))
+            self.duration.observe(labels, total)
+            self.db_duration.observe(labels, db_time)
+            self.statements.observe(labels, statements)
+            self.serialization.observe(labels, serialization_time)
+
+    def record_shed(self, endpoint_class: str, reason: str) -> None:
+        """
+        Record one request rejected before reaching its handler
+        """
+        with self._lock:
+            self.shed.inc((endpoint_class, reason))
+
+    def render(self) -> str:
+        """
+        Render all metrics in the Prometheus text exposition format
+        """
+        with self._lock:
+            lines: List[str] = []
+            for metric in (self.requests, self.duration, self.db_duration, self.statements, self.serialization,
+                           self.shed):
+                lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+# Shared registry used by ProfilingMiddleware and /internal/metrics
+request_metrics = RequestMetrics()
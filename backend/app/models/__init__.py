@@ -1,4 +1,14 @@
 # Models package
 from .task import Task
+from .task_archive import TaskArchive
+from .job import Job
+from .cache_invalidation import CacheInvalidation
+from .tenant_counters import TenantCounters
+from .task_revision import TaskRevision
+from .task_description import TaskDescription
+from .backfill_checkpoint import BackfillCheckpoint
 
-__all__ = ["Task"]
+__all__ = [
+    "Task", "TaskArchive", "Job", "CacheInvalidation", "TenantCounters", "TaskRevision", "TaskDescription",
+    "BackfillCheckpoint"
+]
@@ -0,0 +1,38 @@
+"""
+Progress of resumable backfills (see app.db.backfill)
+"""
+
+from sqlalchemy import Column, Integer, BigInteger, String, DateTime
+from sqlalchemy.sql import func
+from app.db.database import Base
+
+
+class BackfillCheckpoint(Base):
+    """
+    Checkpoint of one named backfill, updated in each chunk's transaction
+
+    Attributes:
+        name: Backfill name (primary key)
+        table_name: Table the backfill walks
+        last_key: Highest primary key processed so far (NULL before the first chunk)
+        rows_written: Rows changed so far
+        chunks: Chunks committed so far
+        started_at: Timestamp of the first chunk (or the last restart)
+        updated_at: Timestamp of the last committed chunk
+        finished_at: Timestamp when the whole table was done (NULL while running)
+    """
+
+    __tablename__ = "backfill_checkpoints"
+
+    name = Column(String(100), primary_key=True)
+    table_name = Column(String(100), nullable=False)
+    last_key = Column(BigInteger, nullable=True)
+    rows_written = Column(BigInteger, default=0, nullable=False)
+    chunks = Column(Integer, default=0, nullable=False)
+    started_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+
+    def __repr__(self):
+        """String representation of the BackfillCheckpoint model"""
+        return f"<BackfillCheckpoint(name='{self.name}', last_key={self.last_key}, finished={self.finished_at is not None})>"
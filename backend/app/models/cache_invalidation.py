@@ -0,0 +1,32 @@
+"""
+Cache invalidation messages shared between worker processes
+"""
+
+from sqlalchemy import Column, Integer, String, DateTime, JSON
+from sqlalchemy.sql import func
+from app.db.database import Base
+
+
+class CacheInvalidation(Base):
+    """
+    Invalidation published on the database-backed cache bus
+
+    Attributes:
+        id: Primary key, auto-incrementing integer (poll cursor)
+        channel: Cache channel, e.g. "tasks"
+        keys: Invalidated keys, NULL when the whole cache was cleared
+        origin: "host:pid" of the publishing process
+        published_at: Timestamp when the message was published
+    """
+
+    __tablename__ = "cache_invalidations"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    channel = Column(String(50), nullable=False)
+    keys = Column(JSON, nullable=True)
+    origin = Column(String(100), nullable=False)
+    published_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False, index=True)
+
+    def __repr__(self):
+        """String representation of the CacheInvalidation model"""
+        return f"<CacheInvalidation(id={self.id}, channel='{self.channel}')>"
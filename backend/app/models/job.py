@@ -0,0 +1,58 @@
+"""
+Background job model tracking long-running bulk operations
+"""
+
+from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, JSON, Index
+from sqlalchemy.sql import func
+from app.db.database import Base
+from app.db.tenancy import DEFAULT_TENANT_ID
+
+
+class Job(Base):
+    """
+    Background job queued through POST /jobs and executed by the job runner
+
+    Attributes:
+        id: Primary key, auto-incrementing integer
+        tenant_id: Tenant that queued the job (its tasks are the ones touched)
+        operation: Registered operation name (e.g. bulk_delete, export)
+        status: queued, running, succeeded, failed or cancelled
+        params: Validated operation parameters
+        result: Operation result once the job finished (optional)
+        error: Error message of a failed job (optional)
+        processed: Number of items processed so far
+        total: Number of items to process, when known up front
+        cancel_requested: Set by the cancel endpoint; checked between chunks
+        claimed_by: "host:pid" of the process running the job
+        created_at: Timestamp when the job was queued
+        started_at: Timestamp when a worker picked the job up
+        finished_at: Timestamp when the job reached a final status
+        updated_at: Timestamp of the last progress update
+    """
+
+    __tablename__ = "jobs"
+
+    __table_args__ = (
+        # Lets the runner find queued/interrupted jobs on startup
+        Index("ix_jobs_status_created_at", "status", "created_at"),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    tenant_id = Column(String(64), default=DEFAULT_TENANT_ID, server_default=DEFAULT_TENANT_ID, nullable=False)
+    operation = Column(String(50), nullable=False)
+    status = Column(String(20), default="queued", nullable=False)
+    params = Column(JSON, nullable=False)
+    result = Column(JSON, nullable=True)
+    error = Column(Text, nullable=True)
+    processed = Column(Integer, default=0, nullable=False)
+    total = Column(Integer, nullable=True)
+    cancel_requested = Column(Boolean, default=False, nullable=False)
+    claimed_by = Column(String(100), nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    started_at = Column(DateTime(timezone=True), nullable=True)
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+
+    def __repr__(self):
+        """String representation of the Job model"""
+        return f"<Job(id={self.id}, operation='{self.operation}', status='{self.status}')>"
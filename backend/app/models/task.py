@@ -2,43 +2,111 @@
 Task model with soft delete and modification tracking
 """
 
-from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, func
+from typing import Iterable, Optional
+
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Index, false, func
+from sqlalchemy.orm import relationship
+from sqlalchemy.orm.attributes import set_committed_value
 from sqlalchemy.sql import func
 from app.db.database import Base
+from app.db.tenancy import DEFAULT_TENANT_ID
+from app.models.task_description import TaskDescription
 
 class Task(Base):
     """
     Task model representing a TODO item
     
     Attributes:
-        id: Primary key, auto-incrementing integer
+        id: Primary key, auto-incrementing integer (never reused)
+        tenant_id: Tenant owning the task (see app.db.tenancy)
         title: Task title (required, max 255 characters)
-        description: Task description (optional, text field)
+        description: Task description (optional; stored in task_descriptions
+            and loaded on first access, see TaskDescription)
         is_deleted: Boolean flag for soft delete functionality
+        is_completed: Boolean flag marking the task as done
         modification_count: Integer tracking number of times task was modified
         created_at: Timestamp when task was created
         updated_at: Timestamp when task was last updated
+    
+    On MySQL the table can be range-partitioned by created_at month (see
+    app.db.partitions); the database primary key is then (id, created_at)
+    while the ORM identity stays ``id``.
     """
     
     __tablename__ = "tasks"
     
+    # Fetch server-generated timestamps as part of the flush
+    __mapper_args__ = {"eager_defaults": True}
+    
+    __table_args__ = (
+        # Lets the archival job find old soft-deleted tasks without a scan
+        Index("ix_tasks_is_deleted_updated_at", "is_deleted", "updated_at"),
+        # Every tenant-facing query filters on the tenant first, so each
+        # tenant only ever reads its own slice of these indexes
+        Index("ix_tasks_tenant_deleted_created", "tenant_id", "is_deleted", "created_at"),
+        Index("ix_tasks_tenant_deleted_modifications", "tenant_id", "is_deleted", "modification_count"),
+        Index("ix_tasks_tenant_deleted_updated", "tenant_id", "is_deleted", "updated_at"),
+        # Same sort keys behind the completion flag, for searches filtering on it
+        # (see TaskService.plan_search for the combinations these serve)
+        Index("ix_tasks_tenant_deleted_completed_created", "tenant_id", "is_deleted", "is_completed", "created_at"),
+        Index("ix_tasks_tenant_deleted_completed_updated", "tenant_id", "is_deleted", "is_completed", "updated_at"),
+        Index(
+            "ix_tasks_tenant_deleted_completed_modifications",
+            "tenant_id", "is_deleted", "is_completed", "modification_count"
+        ),
+        # Never hand out an ID again once its row is gone (archived tasks keep
+        # theirs, as do their description and revision rows); without it
+        # SQLite reuses the highest ID after that row is deleted. MySQL 8.0+
+        # keeps the auto-increment counter across restarts on its own.
+        {"sqlite_autoincrement": True},
+    )
+    
     # Primary key
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     
+    # Owner
+    tenant_id = Column(String(64), default=DEFAULT_TENANT_ID, server_default=DEFAULT_TENANT_ID, nullable=False)
+    
     # Task content
     title = Column(String(255), nullable=False, index=True)
-    description = Column(Text, nullable=True)
+    # Kept out of the row so scans read narrow rows; pages of tasks load
+    # it with joinedload(Task.description_row) (a primary-key LEFT JOIN)
+    description_row = relationship(
+        TaskDescription,
+        primaryjoin=lambda: Task.id == TaskDescription.task_id,
+        foreign_keys=lambda: TaskDescription.task_id,
+        uselist=False,
+        lazy="select",
+        cascade="all, delete-orphan"
+    )
     
     # Status flags
-    is_deleted = Column(Boolean, default=False, nullable=False, index=True)
+    is_deleted = Column(Boolean, default=False, server_default=false(), nullable=False, index=True)
+    is_completed = Column(Boolean, default=False, server_default=false(), nullable=False)
     
     # Tracking fields
-    modification_count = Column(Integer, default=0, nullable=False)
+    modification_count = Column(Integer, default=0, server_default="0", nullable=False)
     
     # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False, index=True)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
     
+    @property
+    def description(self) -> Optional[str]:
+        """Task description (loads the task_descriptions row if needed)"""
+        row = self.description_row
+        return row.text if row is not None else None
+
+    @description.setter
+    def description(self, value: Optional[str]) -> None:
+        row = self.description_row
+        if value is None:
+            self.description_row = None
+        elif row is None:
+            self.description_row = TaskDescription.from_text(value)
+        else:
+            row.text = value
+
     def __repr__(self):
         """String representation of the Task model"""
         return f"<Task(id={self.id}, title='{self.title}', is_deleted={self.is_deleted})>"
@@ -47,10 +115,30 @@ class Task(Base):
         """Convert task instance to dictionary"""
         return {
             "id": self.id,
+            "tenant_id": self.tenant_id,
             "title": self.title,
             "description": self.description,
             "is_deleted": self.is_deleted,
+            "is_completed": self.is_completed,
             "modification_count": self.modification_count,
             "created_at": self.created_at,
             "updated_at": self.updated_at
         }
+
+
+def set_new_descriptions(tasks: Iterable[Task], descriptions: Iterable[Optional[str]]) -> None:
+    """
+    Set the descriptions of tasks just inserted with bulk statements
+
+    Such tasks cannot have a description row yet, so this skips the lazy
+    load the description setter would otherwise do for each of them. The
+    rows are inserted on the next flush.
+
+    Args:
+        tasks: Persistent tasks without a description row
+        descriptions: Description of each task (None for none)
+    """
+    for task, text in zip(tasks, descriptions):
+        set_committed_value(task, "description_row", None)
+        if text is not None:
+            task.description_row = TaskDescription.from_text(text)
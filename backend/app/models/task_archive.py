@@ -0,0 +1,44 @@
+"""
+Archive of soft-deleted tasks moved out of the hot tasks table
+"""
+
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, false
+from sqlalchemy.sql import func
+from app.db.database import Base
+from app.db.tenancy import DEFAULT_TENANT_ID
+
+
+class TaskArchive(Base):
+    """
+    Soft-deleted task moved out of ``tasks`` by the archival job
+    
+    Rows keep their original ID and timestamps so a task can be restored
+    into ``tasks`` unchanged. The description stays in task_descriptions.
+    
+    Attributes:
+        id: Original task ID (not auto-generated)
+        tenant_id: Tenant owning the task
+        title: Task title
+        is_deleted: Always True for archived tasks
+        is_completed: Whether the task was done
+        modification_count: Number of times the task was modified
+        created_at: Timestamp when task was created
+        updated_at: Timestamp of the last change (the soft delete)
+        archived_at: Timestamp when the task was archived
+    """
+    
+    __tablename__ = "tasks_archive"
+    
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    tenant_id = Column(String(64), default=DEFAULT_TENANT_ID, server_default=DEFAULT_TENANT_ID, nullable=False, index=True)
+    title = Column(String(255), nullable=False)
+    is_deleted = Column(Boolean, default=True, nullable=False)
+    is_completed = Column(Boolean, default=False, server_default=false(), nullable=False)
+    modification_count = Column(Integer, default=0, nullable=False)
+    created_at = Column(DateTime(timezone=True), nullable=False)
+    updated_at = Column(DateTime(timezone=True), nullable=False)
+    archived_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    
+    def __repr__(self):
+        """String representation of the TaskArchive model"""
+        return f"<TaskArchive(id={self.id}, title='{self.title}')>"
@@ -0,0 +1,85 @@
+"""
+Task descriptions, stored apart from the hot tasks table
+"""
+
+import os
+import zlib
+from typing import Optional, Tuple
+
+from sqlalchemy import Column, Integer, Boolean, LargeBinary
+from app.db.database import Base
+
+# Compress descriptions of at least this many bytes with zlib (0 disables compression)
+TASK_DESCRIPTION_COMPRESS_MIN_BYTES = int(os.getenv("TASK_DESCRIPTION_COMPRESS_MIN_BYTES", "256"))
+
+
+def encode_description(text: str) -> Tuple[bytes, bool]:
+    """
+    Encode a description, compressing it when that pays off
+
+    Returns:
+        Tuple of (body bytes, whether they are compressed)
+    """
+    raw = text.encode("utf-8")
+    if 0 < TASK_DESCRIPTION_COMPRESS_MIN_BYTES <= len(raw):
+        compressed = zlib.compress(raw, 6)
+        if len(compressed) < len(raw):
+            return compressed, True
+    return raw, False
+
+
+def decode_description(body: bytes, is_compressed: bool) -> str:
+    """Decode a stored description body"""
+    return (zlib.decompress(body) if is_compressed else body).decode("utf-8")
+
+
+def description_row(task_id: int, text: str) -> dict:
+    """Column values of the task_descriptions row holding ``text`` (for bulk inserts)"""
+    body, is_compressed = encode_description(text)
+    return {"task_id": task_id, "body": body, "is_compressed": is_compressed}
+
+
+class TaskDescription(Base):
+    """
+    Description of one task
+
+    Listing, search and aggregate queries scan ``tasks`` constantly but
+    rarely need the description, so it lives in this side table and is
+    loaded only when a task is serialized (see Task.description). Tasks
+    without a description have no row here.
+
+    Rows stay while a task is soft-deleted or archived, keyed by the task
+    ID, so restoring a task brings its description back. Task IDs are
+    never handed out again (see Task), so a row can't outlive its task and
+    turn up on another one.
+
+    Attributes:
+        task_id: ID of the task (not a foreign key: tasks may be partitioned or archived)
+        is_compressed: Body is zlib-compressed
+        body: UTF-8 encoded description
+    """
+
+    __tablename__ = "task_descriptions"
+
+    task_id = Column(Integer, primary_key=True, autoincrement=False)
+    is_compressed = Column(Boolean, default=False, nullable=False)
+    body = Column(LargeBinary, nullable=False)
+
+    @property
+    def text(self) -> str:
+        """Decoded description"""
+        return decode_description(self.body, self.is_compressed)
+
+    @text.setter
+    def text(self, value: str) -> None:
+        self.body, self.is_compressed = encode_description(value)
+
+    @classmethod
+    def from_text(cls, text: str, task_id: Optional[int] = None) -> "TaskDescription":
+        """Build a row holding ``text``"""
+        body, is_compressed = encode_description(text)
+        return cls(task_id=task_id, body=body, is_compressed=is_compressed)
+
+    def __repr__(self):
+        """String representation of the TaskDescription model"""
+        return f"<TaskDescription(task_id={self.task_id}, bytes={len(self.body or b'')})>"
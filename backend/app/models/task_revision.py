@@ -0,0 +1,47 @@
+"""
+Revision history of task edits, stored as compact reverse deltas
+"""
+
+from sqlalchemy import Column, Integer, Boolean, DateTime, LargeBinary, Index
+from sqlalchemy.sql import func
+from app.db.database import Base
+
+
+class TaskRevision(Base):
+    """
+    One edit of a task, recorded by TaskService.update_task
+
+    Revision ``r`` is the edit that moved the task from version ``r - 1`` to
+    version ``r`` (versions are modification_count values). Its payload is
+    what it takes to get back to version ``r - 1``: a reverse delta of the
+    changed fields, or on every TASK_HISTORY_SNAPSHOT_INTERVAL-th revision a
+    full snapshot of version ``r - 1`` (see app.services.history_service).
+
+    Attributes:
+        id: Primary key, auto-incrementing integer
+        task_id: ID of the edited task
+        revision: Task version produced by the edit (modification_count after it)
+        is_snapshot: Payload is a full copy of the previous version
+        is_compressed: Payload is zlib-compressed
+        payload: Encoded delta or snapshot
+        created_at: Timestamp of the edit
+    """
+
+    __tablename__ = "task_revisions"
+
+    __table_args__ = (
+        # Range reads of one task's revisions; also rejects duplicate revisions
+        Index("ix_task_revisions_task_revision", "task_id", "revision", unique=True),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    task_id = Column(Integer, nullable=False)
+    revision = Column(Integer, nullable=False)
+    is_snapshot = Column(Boolean, default=False, nullable=False)
+    is_compressed = Column(Boolean, default=False, nullable=False)
+    payload = Column(LargeBinary, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    def __repr__(self):
+        """String representation of the TaskRevision model"""
+        return f"<TaskRevision(task_id={self.task_id}, revision={self.revision}, is_snapshot={self.is_snapshot})>"
@@ -0,0 +1,39 @@
+"""
+Per-tenant task counters backing the dashboard metrics
+"""
+
+from sqlalchemy import Column, Integer, String, DateTime
+from sqlalchemy.sql import func
+from app.db.database import Base
+
+
+class TenantCounters(Base):
+    """
+    Running task totals of one tenant, kept in step with every task write
+
+    Updated in the same transaction as the task rows they count, so
+    ``/metrics`` reads one row instead of counting the tenant's tasks.
+
+    Attributes:
+        tenant_id: Tenant ID (primary key)
+        created_count: Tasks ever created (active + deleted, archived included)
+        active_count: Tasks that are not deleted
+        deleted_count: Soft-deleted tasks, archived included
+        modified_count: Active tasks modified at least once
+        modifications: Sum of modification_count over all tasks
+        updated_at: Timestamp of the last change
+    """
+
+    __tablename__ = "tenant_counters"
+
+    tenant_id = Column(String(64), primary_key=True)
+    created_count = Column(Integer, default=0, server_default="0", nullable=False)
+    active_count = Column(Integer, default=0, server_default="0", nullable=False)
+    deleted_count = Column(Integer, default=0, server_default="0", nullable=False)
+    modified_count = Column(Integer, default=0, server_default="0", nullable=False)
+    modifications = Column(Integer, default=0, server_default="0", nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+
+    def __repr__(self):
+        """String representation of the TenantCounters model"""
+        return f"<TenantCounters(tenant_id='{self.tenant_id}', active_count={self.active_count})>"
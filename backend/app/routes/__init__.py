@@ -1,4 +1,4 @@
 # Routes package
-from . import tasks, metrics
+from . import tasks, metrics, internal, jobs, health
 
-__all__ = ["tasks", "metrics"]
+__all__ = ["tasks", "metrics", "internal", "jobs", "health"]
@@ -0,0 +1,38 @@
+"""
+Liveness and readiness probes
+
+Both answer from in-memory state; readiness adds one pooled ``SELECT 1``.
+"""
+
+from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+from app.services import health
+
+# Create router instance
+router = APIRouter(tags=["health"])
+
+
+@router.get("/livez", summary="Liveness probe")
+async def livez():
+    """
+    Report that the process is running; never touches the database
+    """
+    return health.liveness()
+
+
+@router.get("/readyz", summary="Readiness probe")
+def readyz():
+    """
+    Report whether this worker should receive traffic (503 otherwise)
+
+    - **warmup**: Startup warm-up state
+    - **database**: Result of a pooled SELECT 1 (cached briefly)
+    - **pool**: Connection pool usage
+    - **cache** / **coalescing**: Task cache and request coalescing statistics
+    - **jobs**: Background jobs queued and running in this process
+    - **admission**: In-flight requests per endpoint class
+    """
+    ready, report = health.readiness()
+    if not ready:
+        return JSONResponse(report, status_code=503)
+    return report
@@ -0,0 +1,57 @@
+"""
+Internal operational endpoints (not part of the public API)
+"""
+
+import hmac
+import os
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, status
+from fastapi.responses import PlainTextResponse
+from app.middleware.request_metrics import request_metrics
+
+# Bearer token scrapers must send to read /internal/metrics (unset: endpoint disabled)
+INTERNAL_METRICS_TOKEN = os.getenv("INTERNAL_METRICS_TOKEN", "")
+
+
+def require_metrics_token(authorization: Optional[str] = Header(None)) -> None:
+    """
+    Dependency admitting only requests carrying INTERNAL_METRICS_TOKEN
+
+    Raises:
+        HTTPException: 404 when no token is configured, 401 for a missing or wrong token
+    """
+    if not INTERNAL_METRICS_TOKEN:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+    expected = f"Bearer {INTERNAL_METRICS_TOKEN}".encode("utf-8")
+    if authorization is None or not hmac.compare_digest(authorization.encode("utf-8"), expected):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or missing metrics token",
+            headers={"WWW-Authenticate": "Bearer"}
+        )
+
+
+# Create router instance
+router = APIRouter(
+    prefix="/internal", tags=["internal"], include_in_schema=False, dependencies=[Depends(require_metrics_token)]
+)
+
+
+@router.get("/metrics", response_class=PlainTextResponse, summary="Prometheus metrics")
+async def get_prometheus_metrics():
+    """
+    Expose per-route request metrics in the Prometheus text format
+    
+    Requires `Authorization: Bearer <INTERNAL_METRICS_TOKEN>`; without a
+    configured token the endpoint does not exist.
+    
+    - **http_request_db_statements**: SQL statements per request (N+1 detection)
+    - **http_request_db_duration_seconds**: Database time per request
+    - **http_request_serialization_seconds**: Response rendering time
+    - **http_request_duration_seconds**: Total handler time
+    """
+    return PlainTextResponse(
+        request_metrics.render(),
+        media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
@@ -0,0 +1,142 @@
+"""
+API routes for background jobs
+"""
+
+import os
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import FileResponse
+from pydantic import ValidationError
+from sqlalchemy.orm import Session
+from app.db.database import get_db
+from app.db.tenancy import get_tenant_id
+from app.jobs import job_runner
+from app.jobs.operations import export_path
+from app.services.job_service import JobService, JOB_SUCCEEDED
+from app.schemas.job import JobCreate, JobResponse, JobStatus
+
+# Create router instance
+router = APIRouter(prefix="/jobs", tags=["jobs"])
+
+
+@router.post("/", response_model=JobResponse, status_code=status.HTTP_202_ACCEPTED, summary="Queue a job")
+def create_job(
+    job_data: JobCreate,
+    tenant_id: str = Depends(get_tenant_id),
+    db: Session = Depends(get_db)
+):
+    """
+    Queue a long-running operation and return immediately
+
+    - **operation**: bulk_delete, bulk_restore, archive, import, export or
+      reconcile_counters
+    - **params**: Operation parameters (same body as POST /tasks/bulk for
+      bulk_delete, POST /tasks/bulk/restore for bulk_restore; `tasks` for
+      import; `filter` / `include_deleted` for export; `older_than_days`
+      for archive; none for reconcile_counters)
+
+    The job works on the tasks of the requesting tenant. Poll
+    GET /jobs/{job_id} for progress
+    """
+    try:
+        return job_runner.enqueue(db, job_data.operation, job_data.params, tenant_id)
+    except ValidationError as exc:
+        raise RequestValidationError(
+            [{**error, "loc": ("body", "params", *error["loc"])} for error in exc.errors(include_url=False)]
+        )
+
+
+@router.get("/", response_model=List[JobResponse], summary="List jobs")
+async def list_jobs(
+    status_filter: Optional[JobStatus] = Query(None, alias="status", description="Only jobs with this status"),
+    limit: int = Query(50, ge=1, le=500, description="Maximum number of jobs to return"),
+    tenant_id: str = Depends(get_tenant_id),
+    db: Session = Depends(get_db)
+):
+    """
+    List the requesting tenant's most recent jobs, newest first
+
+    - **status**: Only jobs with this status (optional)
+    - **limit**: Maximum number of jobs to return
+    """
+    job_service = JobService(db)
+    return job_service.list_jobs(status=status_filter, limit=limit, tenant_id=tenant_id)
+
+
+@router.get("/{job_id}", response_model=JobResponse, summary="Get job status")
+async def get_job(
+    job_id: int,
+    tenant_id: str = Depends(get_tenant_id),
+    db: Session = Depends(get_db)
+):
+    """
+    Get the status and progress of a job
+
+    - **job_id**: The ID of the job
+    """
+    job_service = JobService(db)
+    job = job_service.get_job(job_id, tenant_id)
+
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Job with ID {job_id} not found"
+        )
+
+    return job
+
+
+@router.post("/{job_id}/cancel", response_model=JobResponse, summary="Cancel job")
+async def cancel_job(
+    job_id: int,
+    tenant_id: str = Depends(get_tenant_id),
+    db: Session = Depends(get_db)
+):
+    """
+    Cancel a queued or running job
+
+    - **job_id**: The ID of the job to cancel
+
+    A running job stops after its current chunk; chunks already
+    committed are not rolled back.
+    """
+    job_service = JobService(db)
+    job = job_service.request_cancel(job_id, tenant_id)
+
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Job with ID {job_id} not found"
+        )
+    if not job.cancel_requested:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Job with ID {job_id} already {job.status}"
+        )
+
+    return job
+
+
+@router.get("/{job_id}/download", summary="Download export")
+async def download_export(
+    job_id: int,
+    tenant_id: str = Depends(get_tenant_id),
+    db: Session = Depends(get_db)
+):
+    """
+    Download the JSON Lines file written by a finished export job
+
+    - **job_id**: The ID of the export job
+    """
+    job_service = JobService(db)
+    job = job_service.get_job(job_id, tenant_id)
+    path = export_path(job_id)
+
+    if not job or job.operation != "export" or job.status != JOB_SUCCEEDED or not os.path.exists(path):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"No export available for job with ID {job_id}"
+        )
+
+    return FileResponse(path, media_type="application/x-ndjson", filename=os.path.basename(path))
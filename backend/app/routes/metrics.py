@@ -2,11 +2,19 @@
 API routes for metrics and analytics
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import Literal
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
-from app.db.database import get_db
+from app.db.tenancy import get_tenant_db, get_tenant_id
 from app.services.metrics_service import MetricsService
-from app.schemas.metrics import MetricsResponse, TaskStatsResponse
+from app.services.analytics_service import AnalyticsService
+from app.services.task_snapshot import SnapshotUnavailable, snapshot_store
+from app.services.single_flight import read_flights
+from app.services import health
+from app.schemas.metrics import (
+    MetricsResponse, TaskStatsResponse, ModificationHistogramResponse, LifetimePercentilesResponse,
+    RollupResponse, AnalyticsSnapshotResponse
+)
 from app.schemas.common import ErrorResponse
 
 # Create router instance
@@ -14,21 +22,30 @@ router = APIRouter(prefix="/metrics", tags=["metrics"])
 
 
 @router.get("/", response_model=MetricsResponse, summary="Get dashboard metrics")
-async def get_metrics(db: Session = Depends(get_db)):
+def get_metrics(
+    tenant_id: str = Depends(get_tenant_id),
+    db: Session = Depends(get_tenant_db)
+):
     """
     Get comprehensive dashboard metrics including:
     
     - **total_tasks**: Total number of active tasks
     - **modified_tasks**: Number of tasks that have been modified
     - **deleted_tasks**: Number of soft-deleted tasks
+    
+    Counts are for the tenant named in the X-Tenant-ID header and come
+    from its counters row, so no task rows are scanned. Identical
+    concurrent requests share one query
     """
-    metrics_service = MetricsService(db)
-    metrics = metrics_service.get_metrics()
-    return metrics
+    metrics_service = MetricsService(db, tenant_id)
+    return read_flights.json_response(("metrics", tenant_id), metrics_service.get_metrics)
 
 
 @router.get("/stats", response_model=TaskStatsResponse, summary="Get detailed task statistics")
-async def get_task_stats(db: Session = Depends(get_db)):
+def get_task_stats(
+    tenant_id: str = Depends(get_tenant_id),
+    db: Session = Depends(get_tenant_db)
+):
     """
     Get detailed task statistics including:
     
@@ -36,23 +53,26 @@ async def get_task_stats(db: Session = Depends(get_db)):
     - **total_deleted**: Total number of deleted tasks
     - **total_modified**: Total number of modifications across all tasks
     - **average_modifications**: Average modifications per task
+    
+    Read from the tenant's counters row. Identical concurrent requests
+    share one query
     """
-    metrics_service = MetricsService(db)
-    stats = metrics_service.get_task_stats()
-    return stats
+    metrics_service = MetricsService(db, tenant_id)
+    return read_flights.json_response(("metrics.stats", tenant_id), metrics_service.get_task_stats)
 
 
 @router.get("/trends", summary="Get task completion trends")
 async def get_completion_trends(
     days: int = 30,
-    db: Session = Depends(get_db)
+    tenant_id: str = Depends(get_tenant_id),
+    db: Session = Depends(get_tenant_db)
 ):
     """
     Get task completion trends over time
     
     - **days**: Number of days to analyze (default: 30)
     """
-    metrics_service = MetricsService(db)
+    metrics_service = MetricsService(db, tenant_id)
     trends = metrics_service.get_completion_trends(days)
     return trends
 
@@ -60,7 +80,8 @@ async def get_completion_trends(
 @router.get("/most-modified", summary="Get most modified tasks")
 async def get_most_modified_tasks(
     limit: int = 10,
-    db: Session = Depends(get_db)
+    tenant_id: str = Depends(get_tenant_id),
+    db: Session = Depends(get_tenant_db)
 ):
     """
     Get tasks with the highest modification counts
@@ -73,13 +94,16 @@ async def get_most_modified_tasks(
             detail="Limit must be between 1 and 100"
         )
     
-    metrics_service = MetricsService(db)
+    metrics_service = MetricsService(db, tenant_id)
     most_modified = metrics_service.get_most_modified_tasks(limit)
     return most_modified
 
 
 @router.get("/productivity", summary="Get productivity metrics")
-async def get_productivity_metrics(db: Session = Depends(get_db)):
+async def get_productivity_metrics(
+    tenant_id: str = Depends(get_tenant_id),
+    db: Session = Depends(get_tenant_db)
+):
     """
     Get productivity-related metrics including:
     
@@ -87,43 +111,115 @@ async def get_productivity_metrics(db: Session = Depends(get_db)):
     - **average_task_lifetime**: Average time from creation to completion
     - **most_active_hour**: Hour with most task activity
     """
-    metrics_service = MetricsService(db)
+    metrics_service = MetricsService(db, tenant_id)
     productivity = metrics_service.get_productivity_metrics()
     return productivity
 
 
 @router.get("/categories", summary="Get task category breakdown")
-async def get_category_breakdown(db: Session = Depends(get_db)):
+async def get_category_breakdown(
+    tenant_id: str = Depends(get_tenant_id),
+    db: Session = Depends(get_tenant_db)
+):
     """
     Get task breakdown by categories (if categories are implemented)
     
     Returns category distribution and uncategorized task count
     """
-    metrics_service = MetricsService(db)
+    metrics_service = MetricsService(db, tenant_id)
     categories = metrics_service.get_category_breakdown()
     return categories
 
 
+def get_analytics(tenant_id: str = Depends(get_tenant_id)) -> AnalyticsService:
+    """
+    Dependency returning AnalyticsService on the current snapshot
+    
+    Raises:
+        HTTPException: 503 if no snapshot can be read
+    """
+    try:
+        return AnalyticsService(snapshot_store.get(), tenant_id)
+    except SnapshotUnavailable as exc:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(exc))
+
+
+@router.get(
+    "/analytics/modifications", response_model=ModificationHistogramResponse,
+    summary="Get modification count distribution"
+)
+def get_modification_histogram(
+    include_deleted: bool = Query(False, description="Count deleted and archived tasks too"),
+    analytics: AnalyticsService = Depends(get_analytics)
+):
+    """
+    Histogram of modification_count over the tenant's tasks
+    
+    - **include_deleted**: Include deleted and archived tasks (default: false)
+    
+    Computed from the columnar snapshot, not the database
+    """
+    return analytics.get_modification_histogram(include_deleted)
+
+
+@router.get(
+    "/analytics/lifetimes", response_model=LifetimePercentilesResponse, summary="Get task lifetime percentiles"
+)
+def get_lifetime_percentiles(
+    of: Literal["deleted", "completed"] = Query("deleted", description="Measure deleted or completed tasks"),
+    analytics: AnalyticsService = Depends(get_analytics)
+):
+    """
+    Percentiles of the time from creation to deletion or completion
+    
+    - **of**: deleted (time until the soft delete) or completed (time until the last edit)
+    
+    Computed from the columnar snapshot, not the database
+    """
+    return analytics.get_lifetime_percentiles(of)
+
+
+@router.get("/analytics/rollup", response_model=RollupResponse, summary="Get created versus deleted per period")
+def get_rollup(
+    bucket: Literal["day", "week", "month"] = Query("week", description="Bucket size"),
+    periods: int = Query(12, ge=1, le=366, description="Number of buckets"),
+    analytics: AnalyticsService = Depends(get_analytics)
+):
+    """
+    Tasks created and deleted per day, week (Monday start) or month
+    
+    - **bucket**: day, week or month (default: week)
+    - **periods**: Number of buckets ending with the current one (1-366)
+    
+    Computed from the columnar snapshot, not the database
+    """
+    return analytics.get_rollup(bucket, periods)
+
+
+@router.get("/analytics/snapshot", response_model=AnalyticsSnapshotResponse, summary="Get analytics snapshot info")
+def get_analytics_snapshot(analytics: AnalyticsService = Depends(get_analytics)):
+    """
+    Describe the snapshot behind /metrics/analytics (build time and size)
+    """
+    return analytics.get_snapshot_info()
+
+
 @router.get("/health", summary="Get metrics service health")
-async def get_metrics_health(db: Session = Depends(get_db)):
+def get_metrics_health():
     """
     Check the health of the metrics service
     
-    Returns basic service status and connection information
+    Returns basic service status and database connectivity. Runs a pooled
+    SELECT 1 (cached briefly) instead of the dashboard aggregates
     """
-    try:
-        metrics_service = MetricsService(db)
-        # Test basic functionality
-        basic_metrics = metrics_service.get_metrics()
-        
-        return {
-            "status": "healthy",
-            "message": "Metrics service is operational",
-            "basic_metrics_available": True,
-            "total_tasks": basic_metrics.total_tasks
-        }
-    except Exception as e:
+    database = health.check_database()
+    if not database["ok"]:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail=f"Metrics service is unavailable: {str(e)}"
+            detail=f"Metrics service is unavailable: {database['error']}"
         )
+    return {
+        "status": "healthy",
+        "message": "Metrics service is operational",
+        "database": database
+    }
@@ -2,14 +2,19 @@
 API routes for task operations
 """
 
-from typing import List
+from datetime import datetime
+from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.exceptions import RequestValidationError
 from sqlalchemy.orm import Session
-from app.db.database import get_db
-from app.services.task_service import TaskService
+from app.db.tenancy import get_tenant_db, get_tenant_id
+from app.services.task_service import TaskService, UnindexedSearchError
+from app.services.single_flight import read_flights
 from app.schemas.task import (
     TaskCreate, TaskUpdate, TaskResponse, TaskListResponse,
-    BulkDeleteRequest, BulkDeleteResponse, TaskSearchRequest
+    BulkDeleteRequest, BulkDeleteResponse, BulkRestoreRequest, BulkRestoreResponse,
+    TaskSearchRequest, TaskBatchRequest, TaskBatchResponse, BATCH_GET_MAX_IDS,
+    TaskHistoryResponse, TaskRevisionResponse
 )
 from app.schemas.common import ErrorResponse
 
@@ -18,64 +23,132 @@ router = APIRouter(prefix="/tasks", tags=["tasks"])
 
 
 @router.get("/", response_model=TaskListResponse, summary="Get all tasks")
-async def get_tasks(
+def get_tasks(
     skip: int = Query(0, ge=0, description="Number of tasks to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Number of tasks to return"),
-    db: Session = Depends(get_db)
+    created_after: Optional[datetime] = Query(None, description="Only tasks created at or after this time"),
+    created_before: Optional[datetime] = Query(None, description="Only tasks created before this time"),
+    tenant_id: str = Depends(get_tenant_id),
+    db: Session = Depends(get_tenant_db)
 ):
     """
     Retrieve all active tasks with pagination
     
     - **skip**: Number of tasks to skip (for pagination)
     - **limit**: Maximum number of tasks to return (1-1000)
-    """
-    task_service = TaskService(db)
-    tasks = task_service.get_all_tasks(skip=skip, limit=limit)
-    total = task_service.get_tasks_count()
+    - **created_after** / **created_before**: Optional creation time range
     
-    return TaskListResponse(
-        tasks=tasks,
-        total=total,
-        page=(skip // limit) + 1,
-        size=limit
+    Identical concurrent requests share one query and one serialized body
+    """
+    task_service = TaskService(db, tenant_id)
+    return read_flights.json_response(
+        ("tasks.list", tenant_id, skip, limit, created_after, created_before),
+        lambda: task_service.list_tasks_page(
+            skip=skip, limit=limit, created_after=created_after, created_before=created_before
+        )
     )
 
 
 @router.get("/search", response_model=TaskListResponse, summary="Search tasks")
-async def search_tasks(
+def search_tasks(
     search_params: TaskSearchRequest = Depends(),
-    db: Session = Depends(get_db)
+    tenant_id: str = Depends(get_tenant_id),
+    db: Session = Depends(get_tenant_db)
 ):
     """
     Search and filter tasks with advanced criteria
     
     - **title**: Search by task title (partial match)
+    - **is_completed**: Only done (true) or not done (false) tasks
+    - **created_after** / **created_before**: Optional creation time range
+    - **updated_after** / **updated_before**: Optional last-update time range
+    - **min_modifications** / **max_modifications**: Optional modification count range
+    - **sort_by**: created_at, updated_at or modification_count (default: the range-filtered column)
+    - **sort_order**: asc or desc (default: desc)
     - **page**: Page number (starts from 1)
     - **size**: Number of tasks per page (1-100)
-    """
-    task_service = TaskService(db)
-    tasks, total = task_service.search_tasks(search_params)
     
-    return TaskListResponse(
+    Ranges on a column other than sort_by can't use an index; such searches
+    are logged, or refused with 400 when TASK_QUERY_POLICY=reject.
+    Identical concurrent requests share one query and one serialized body
+    """
+    task_service = TaskService(db, tenant_id)
+    try:
+        return read_flights.json_response(
+            ("tasks.search", tenant_id, search_params.model_dump_json()),
+            lambda: task_service.search_tasks_page(search_params)
+        )
+    except UnindexedSearchError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+
+
+def _batch_response(task_service: TaskService, task_ids: List[int]) -> TaskBatchResponse:
+    tasks = task_service.get_active_task_responses(task_ids)
+    return TaskBatchResponse(
         tasks=tasks,
-        total=total,
-        page=search_params.page,
-        size=search_params.size
+        missing_ids=[task_id for task_id, task in zip(task_ids, tasks) if task is None]
     )
 
 
+@router.get("/batch", response_model=TaskBatchResponse, summary="Get tasks by IDs")
+def get_tasks_batch(
+    ids: Optional[List[str]] = Query(None, description="Comma-separated task IDs (or repeated ids parameters)"),
+    tenant_id: str = Depends(get_tenant_id),
+    db: Session = Depends(get_tenant_db)
+):
+    """
+    Retrieve many active tasks in one request
+    
+    - **ids**: Task IDs, e.g. `?ids=3,1,2` (at most 5000)
+    
+    Results keep the request order; IDs without an active task get a
+    null entry and are listed in `missing_ids`. Use POST /tasks/batch for
+    ID lists too long for a URL.
+    """
+    try:
+        task_ids = [int(part) for value in ids or [] for part in value.split(",") if part.strip()]
+    except ValueError:
+        raise RequestValidationError([{
+            "type": "int_parsing", "loc": ("query", "ids"), "input": ids,
+            "msg": "Input should be a comma-separated list of integers"
+        }])
+    if not 1 <= len(task_ids) <= BATCH_GET_MAX_IDS:
+        raise RequestValidationError([{
+            "type": "too_long" if task_ids else "too_short", "loc": ("query", "ids"), "input": ids,
+            "msg": f"Provide between 1 and {BATCH_GET_MAX_IDS} task IDs"
+        }])
+    return _batch_response(TaskService(db, tenant_id), task_ids)
+
+
+@router.post("/batch", response_model=TaskBatchResponse, summary="Get tasks by IDs (POST)")
+def post_tasks_batch(
+    batch_request: TaskBatchRequest,
+    tenant_id: str = Depends(get_tenant_id),
+    db: Session = Depends(get_tenant_db)
+):
+    """
+    Retrieve many active tasks in one request (IDs in the body)
+    
+    - **task_ids**: IDs of the tasks to fetch (at most 5000)
+    
+    Same response as GET /tasks/batch; nothing is modified
+    """
+    return _batch_response(TaskService(db, tenant_id), batch_request.task_ids)
+
+
 @router.get("/{task_id}", response_model=TaskResponse, summary="Get task by ID")
-async def get_task(
+def get_task(
     task_id: int,
-    db: Session = Depends(get_db)
+    tenant_id: str = Depends(get_tenant_id),
+    db: Session = Depends(get_tenant_db)
 ):
     """
     Retrieve a specific task by ID
     
     - **task_id**: The ID of the task to retrieve
     """
-    task_service = TaskService(db)
-    task = task_service.get_active_task_by_id(task_id)
+    task_service = TaskService(db, tenant_id)
+    task = task_service.get_active_task_response(task_id)
     
     if not task:
         raise HTTPException(
@@ -86,27 +159,86 @@ async def get_task(
     return task
 
 
+@router.get("/{task_id}/history", response_model=TaskHistoryResponse, summary="Get task history")
+def get_task_history(
+    task_id: int,
+    limit: int = Query(20, ge=1, le=100, description="Maximum number of versions to return"),
+    before: Optional[int] = Query(None, ge=1, description="Only versions older than this one"),
+    tenant_id: str = Depends(get_tenant_id),
+    db: Session = Depends(get_tenant_db)
+):
+    """
+    Retrieve the past versions of a task, newest first
+    
+    - **task_id**: The ID of the task
+    - **limit**: Maximum number of versions per page (1-100)
+    - **before**: Continue from a previous page's next_before
+    
+    Versions are rebuilt from compact deltas stored by each update
+    """
+    task_service = TaskService(db, tenant_id)
+    history = task_service.get_task_history(task_id, limit, before)
+    
+    if not history:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Task with ID {task_id} not found"
+        )
+    
+    return history
+
+
+@router.get("/{task_id}/history/{revision}", response_model=TaskRevisionResponse, summary="Get task version")
+def get_task_revision(
+    task_id: int,
+    revision: int,
+    tenant_id: str = Depends(get_tenant_id),
+    db: Session = Depends(get_tenant_db)
+):
+    """
+    Retrieve a task as it was at one point in its history
+    
+    - **task_id**: The ID of the task
+    - **revision**: Version number (0 is the task as created)
+    """
+    task_service = TaskService(db, tenant_id)
+    version = task_service.get_task_revision(task_id, revision)
+    
+    if not version:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Revision {revision} of task {task_id} not found"
+        )
+    
+    return version
+
+
 @router.post("/", response_model=TaskResponse, status_code=status.HTTP_201_CREATED, summary="Create new task")
-async def create_task(
+def create_task(
     task_data: TaskCreate,
-    db: Session = Depends(get_db)
+    tenant_id: str = Depends(get_tenant_id),
+    db: Session = Depends(get_tenant_db)
 ):
     """
     Create a new task
     
     - **title**: Task title (required, 1-255 characters)
     - **description**: Task description (optional)
+    
+    Runs in the threadpool so concurrent creates can share a group commit
+    when TASK_CREATE_BATCHING is enabled
     """
-    task_service = TaskService(db)
+    task_service = TaskService(db, tenant_id)
     task = task_service.create_task(task_data)
     return task
 
 
 @router.put("/{task_id}", response_model=TaskResponse, summary="Update task")
-async def update_task(
+def update_task(
     task_id: int,
     task_data: TaskUpdate,
-    db: Session = Depends(get_db)
+    tenant_id: str = Depends(get_tenant_id),
+    db: Session = Depends(get_tenant_db)
 ):
     """
     Update an existing task
@@ -117,7 +249,7 @@ async def update_task(
     
     Note: This operation will increment the modification count
     """
-    task_service = TaskService(db)
+    task_service = TaskService(db, tenant_id)
     task = task_service.update_task(task_id, task_data)
     
     if not task:
@@ -130,9 +262,10 @@ async def update_task(
 
 
 @router.delete("/{task_id}", status_code=status.HTTP_204_NO_CONTENT, summary="Delete task")
-async def delete_task(
+def delete_task(
     task_id: int,
-    db: Session = Depends(get_db)
+    tenant_id: str = Depends(get_tenant_id),
+    db: Session = Depends(get_tenant_db)
 ):
     """
     Soft delete a task (set is_deleted to True)
@@ -141,7 +274,7 @@ async def delete_task(
     
     Note: This is a soft delete - the task will be marked as deleted but not removed from the database
     """
-    task_service = TaskService(db)
+    task_service = TaskService(db, tenant_id)
     success = task_service.delete_task(task_id)
     
     if not success:
@@ -152,19 +285,25 @@ async def delete_task(
 
 
 @router.post("/bulk", response_model=BulkDeleteResponse, summary="Bulk delete tasks")
-async def bulk_delete_tasks(
+def bulk_delete_tasks(
     delete_request: BulkDeleteRequest,
-    db: Session = Depends(get_db)
+    tenant_id: str = Depends(get_tenant_id),
+    db: Session = Depends(get_tenant_db)
 ):
     """
     Soft delete multiple tasks at once
     
     - **task_ids**: List of task IDs to delete
+    - **filter**: Delete every active task matching title / created_after / created_before instead
     
+    Tasks are deleted in chunks, each in its own transaction.
     Returns the number of tasks successfully deleted
     """
-    task_service = TaskService(db)
-    deleted_count = task_service.bulk_delete_tasks(delete_request.task_ids)
+    task_service = TaskService(db, tenant_id)
+    if delete_request.filter is not None:
+        deleted_count = task_service.bulk_delete_matching(delete_request.filter)
+    else:
+        deleted_count = task_service.bulk_delete_tasks(delete_request.task_ids)
     
     return BulkDeleteResponse(
         deleted_count=deleted_count,
@@ -172,27 +311,46 @@ async def bulk_delete_tasks(
     )
 
 
+@router.post("/bulk/restore", response_model=BulkRestoreResponse, summary="Bulk restore tasks")
+def bulk_restore_tasks(
+    restore_request: BulkRestoreRequest,
+    tenant_id: str = Depends(get_tenant_id),
+    db: Session = Depends(get_tenant_db)
+):
+    """
+    Restore multiple soft-deleted or archived tasks at once
+    
+    - **task_ids**: List of task IDs to restore
+    
+    Returns the number of tasks successfully restored
+    """
+    task_service = TaskService(db, tenant_id)
+    restored_count = task_service.bulk_restore_tasks(restore_request.task_ids)
+    
+    return BulkRestoreResponse(
+        restored_count=restored_count,
+        message=f"Successfully restored {restored_count} task(s)"
+    )
 
 
 @router.post("/{task_id}/restore", response_model=TaskResponse, summary="Restore deleted task")
-async def restore_task(
+def restore_task(
     task_id: int,
-    db: Session = Depends(get_db)
+    tenant_id: str = Depends(get_tenant_id),
+    db: Session = Depends(get_tenant_db)
 ):
     """
     Restore a soft-deleted task
     
     - **task_id**: The ID of the task to restore
     """
-    task_service = TaskService(db)
-    success = task_service.restore_task(task_id)
+    task_service = TaskService(db, tenant_id)
+    task = task_service.restore_task(task_id)
     
-    if not success:
+    if not task:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Deleted task with ID {task_id} not found"
         )
     
-    # Return the restored task
-    task = task_service.get_active_task_by_id(task_id)
     return task
@@ -1,17 +1,32 @@
 # Schemas package
 from .task import (
     TaskBase, TaskCreate, TaskUpdate, TaskResponse, 
-    TaskListResponse, BulkDeleteRequest, BulkDeleteResponse, TaskSearchRequest
+    TaskListResponse, BulkDeleteRequest, BulkDeleteResponse, TaskSearchRequest,
+    TaskFilter, BulkRestoreRequest, BulkRestoreResponse, TaskBatchRequest, TaskBatchResponse,
+    TaskRevisionResponse, TaskHistoryResponse
+)
+from .metrics import (
+    MetricsResponse, TaskStatsResponse, AnalyticsResponse, HistogramBucket, ModificationHistogramResponse,
+    LifetimePercentilesResponse, RollupPeriod, RollupResponse, AnalyticsSnapshotResponse
+)
+from .job import (
+    JobCreate, JobResponse, ArchiveJobParams, ImportJobParams, ExportJobParams, ReconcileCountersJobParams
 )
-from .metrics import MetricsResponse, TaskStatsResponse
 from .common import ErrorResponse, SuccessResponse, HealthCheckResponse
 
 __all__ = [
     # Task schemas
     "TaskBase", "TaskCreate", "TaskUpdate", "TaskResponse",
     "TaskListResponse", "BulkDeleteRequest", "BulkDeleteResponse", "TaskSearchRequest",
+    "TaskFilter", "BulkRestoreRequest", "BulkRestoreResponse", "TaskBatchRequest", "TaskBatchResponse",
+    "TaskRevisionResponse", "TaskHistoryResponse",
     # Metrics schemas
-    "MetricsResponse", "TaskStatsResponse",
+    "MetricsResponse", "TaskStatsResponse", "AnalyticsResponse", "HistogramBucket",
+    "ModificationHistogramResponse", "LifetimePercentilesResponse", "RollupPeriod", "RollupResponse",
+    "AnalyticsSnapshotResponse",
+    # Job schemas
+    "JobCreate", "JobResponse", "ArchiveJobParams", "ImportJobParams", "ExportJobParams",
+    "ReconcileCountersJobParams",
     # Common schemas
     "ErrorResponse", "SuccessResponse", "HealthCheckResponse"
 ]
@@ -0,0 +1,80 @@
+"""
+Pydantic schemas for background jobs
+"""
+
+from datetime import datetime
+from typing import Any, Dict, Literal, Optional
+from pydantic import BaseModel, Field, ConfigDict
+
+from app.schemas.task import TaskCreate, TaskFilter, BULK_MAX_IDS
+
+# Operations that can be queued through POST /jobs
+JobOperation = Literal["bulk_delete", "bulk_restore", "archive", "import", "export", "reconcile_counters"]
+
+# Lifecycle of a job: queued -> running -> succeeded | failed | cancelled
+JobStatus = Literal["queued", "running", "succeeded", "failed", "cancelled"]
+
+
+class JobCreate(BaseModel):
+    """
+    Schema for queueing a background job
+    """
+    operation: JobOperation = Field(..., description="Operation to run")
+    params: Dict[str, Any] = Field(default_factory=dict, description="Operation parameters")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "operation": "bulk_delete",
+                "params": {"filter": {"title": "draft"}}
+            }
+        }
+
+
+class JobResponse(BaseModel):
+    """
+    Schema for job status and progress
+    """
+    id: int = Field(..., description="Job ID")
+    tenant_id: str = Field(..., description="Tenant that queued the job")
+    operation: str = Field(..., description="Operation name")
+    status: JobStatus = Field(..., description="Job status")
+    params: Dict[str, Any] = Field(..., description="Operation parameters")
+    result: Optional[Dict[str, Any]] = Field(None, description="Operation result once finished")
+    error: Optional[str] = Field(None, description="Error message of a failed job")
+    processed: int = Field(..., description="Number of items processed so far")
+    total: Optional[int] = Field(None, description="Number of items to process, when known")
+    cancel_requested: bool = Field(..., description="Whether cancellation was requested")
+    created_at: datetime = Field(..., description="Job creation timestamp")
+    started_at: Optional[datetime] = Field(None, description="Job start timestamp")
+    finished_at: Optional[datetime] = Field(None, description="Job completion timestamp")
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ArchiveJobParams(BaseModel):
+    """
+    Parameters of the archive operation
+    """
+    older_than_days: Optional[int] = Field(None, ge=0, description="Minimum age of the soft delete in days")
+
+
+class ImportJobParams(BaseModel):
+    """
+    Parameters of the import operation
+    """
+    tasks: list[TaskCreate] = Field(..., min_length=1, max_length=BULK_MAX_IDS, description="Tasks to create")
+
+
+class ReconcileCountersJobParams(BaseModel):
+    """
+    Parameters of the reconcile_counters operation (none; it recounts the job's tenant)
+    """
+
+
+class ExportJobParams(BaseModel):
+    """
+    Parameters of the export operation
+    """
+    filter: Optional[TaskFilter] = Field(None, description="Only export tasks matching this filter")
+    include_deleted: bool = Field(False, description="Also export soft-deleted tasks")
@@ -2,6 +2,9 @@
 Pydantic schemas for metrics and analytics
 """
 
+from datetime import date, datetime
+from typing import Dict, Optional
+
 from pydantic import BaseModel, Field
 
 
@@ -41,3 +44,67 @@ class TaskStatsResponse(BaseModel):
                 "average_modifications": 0.375
             }
         }
+
+
+class AnalyticsResponse(BaseModel):
+    """
+    Base schema for analytics answered from the columnar snapshot
+    """
+    snapshot_built_at: datetime = Field(..., description="When the snapshot the numbers come from was built")
+
+
+class HistogramBucket(BaseModel):
+    """
+    Schema for one histogram bucket
+    """
+    min: int = Field(..., description="Lowest value in the bucket")
+    max: Optional[int] = Field(None, description="Highest value in the bucket (null: open-ended)")
+    count: int = Field(..., description="Number of tasks in the bucket")
+
+
+class ModificationHistogramResponse(AnalyticsResponse):
+    """
+    Schema for the modification_count distribution
+    """
+    tasks: int = Field(..., description="Number of tasks counted")
+    buckets: list[HistogramBucket] = Field(..., description="Buckets in ascending order")
+    mean: float = Field(..., description="Mean modification count")
+    median: float = Field(..., description="Median modification count")
+    max: int = Field(..., description="Highest modification count")
+
+
+class LifetimePercentilesResponse(AnalyticsResponse):
+    """
+    Schema for task lifetime percentiles
+    """
+    of: str = Field(..., description="Which tasks were measured (deleted or completed)")
+    tasks: int = Field(..., description="Number of tasks measured")
+    mean_hours: float = Field(..., description="Mean lifetime in hours")
+    percentiles: Dict[str, float] = Field(..., description="Lifetime in hours by percentile (p50, p90, ...)")
+
+
+class RollupPeriod(BaseModel):
+    """
+    Schema for one time bucket of a rollup
+    """
+    start: date = Field(..., description="First day of the bucket")
+    created: int = Field(..., description="Tasks created in the bucket")
+    deleted: int = Field(..., description="Tasks deleted in the bucket")
+    net: int = Field(..., description="Created minus deleted")
+
+
+class RollupResponse(AnalyticsResponse):
+    """
+    Schema for created-versus-deleted rollups
+    """
+    bucket: str = Field(..., description="Bucket size (day, week or month)")
+    periods: list[RollupPeriod] = Field(..., description="Buckets, oldest first")
+
+
+class AnalyticsSnapshotResponse(AnalyticsResponse):
+    """
+    Schema describing the analytics snapshot
+    """
+    snapshot: str = Field(..., description="Snapshot name")
+    rows: int = Field(..., description="Rows in the snapshot (all tenants)")
+    tenant_rows: int = Field(..., description="Rows of the requesting tenant")
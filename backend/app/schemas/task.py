@@ -3,8 +3,16 @@ Pydantic schemas for Task model validation and serialization
 """
 
 from datetime import datetime
-from typing import Optional
-from pydantic import BaseModel, Field, ConfigDict
+from typing import Literal, Optional
+from pydantic import BaseModel, Field, ConfigDict, model_validator
+
+# Upper bound on the number of IDs accepted by one bulk request
+BULK_MAX_IDS = 100000
+# Upper bound on the number of IDs fetched by one batch lookup
+BATCH_GET_MAX_IDS = 5000
+
+# Columns task searches can sort on
+TaskSortField = Literal["created_at", "updated_at", "modification_count"]
 
 
 class TaskBase(BaseModel):
@@ -29,6 +37,15 @@ class TaskUpdate(BaseModel):
     """
     title: Optional[str] = Field(None, min_length=1, max_length=255, description="Task title")
     description: Optional[str] = Field(None, description="Task description")
+    is_completed: Optional[bool] = Field(None, description="Mark the task as done or not done")
+    
+    @model_validator(mode="after")
+    def check_not_null(self) -> "TaskUpdate":
+        """Reject an explicit null for fields the task can't be without (description may be cleared)"""
+        for name in ("title", "is_completed"):
+            if name in self.model_fields_set and getattr(self, name) is None:
+                raise ValueError(f"{name} may be omitted but not null")
+        return self
     
     class Config:
         # Allow partial updates
@@ -40,7 +57,9 @@ class TaskResponse(TaskBase):
     Schema for task response data
     """
     id: int = Field(..., description="Task ID")
+    tenant_id: str = Field(..., description="Tenant owning the task")
     is_deleted: bool = Field(..., description="Soft delete flag")
+    is_completed: bool = Field(..., description="Whether the task is done")
     modification_count: int = Field(..., description="Number of times task was modified")
     created_at: datetime = Field(..., description="Task creation timestamp")
     updated_at: datetime = Field(..., description="Task last update timestamp")
@@ -58,11 +77,36 @@ class TaskListResponse(BaseModel):
     size: int = Field(..., description="Number of tasks per page")
 
 
+class TaskFilter(BaseModel):
+    """
+    Schema for task filter criteria shared by search and bulk operations
+    """
+    title: Optional[str] = Field(None, description="Search by title (partial match)")
+    created_after: Optional[datetime] = Field(None, description="Only tasks created at or after this time")
+    created_before: Optional[datetime] = Field(None, description="Only tasks created before this time")
+    updated_after: Optional[datetime] = Field(None, description="Only tasks last updated at or after this time")
+    updated_before: Optional[datetime] = Field(None, description="Only tasks last updated before this time")
+    min_modifications: Optional[int] = Field(None, ge=0, description="Only tasks modified at least this many times")
+    max_modifications: Optional[int] = Field(None, ge=0, description="Only tasks modified at most this many times")
+    is_completed: Optional[bool] = Field(None, description="Only done (true) or not done (false) tasks")
+
+
 class BulkDeleteRequest(BaseModel):
     """
     Schema for bulk delete operation
+    Either task_ids or filter must be given
     """
-    task_ids: list[int] = Field(..., min_items=1, description="List of task IDs to delete")
+    task_ids: Optional[list[int]] = Field(
+        None, min_length=1, max_length=BULK_MAX_IDS, description="List of task IDs to delete"
+    )
+    filter: Optional[TaskFilter] = Field(None, description="Delete all active tasks matching this filter")
+    
+    @model_validator(mode="after")
+    def check_target(self) -> "BulkDeleteRequest":
+        """Require exactly one of task_ids and filter"""
+        if (self.task_ids is None) == (self.filter is None):
+            raise ValueError("Provide either task_ids or filter")
+        return self
     
     class Config:
         # Validate that all IDs are positive integers
@@ -81,19 +125,102 @@ class BulkDeleteResponse(BaseModel):
     message: str = Field(..., description="Success message")
 
 
-class TaskSearchRequest(BaseModel):
+class BulkRestoreRequest(BaseModel):
+    """
+    Schema for bulk restore operation
+    """
+    task_ids: list[int] = Field(
+        ..., min_length=1, max_length=BULK_MAX_IDS, description="List of task IDs to restore"
+    )
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "task_ids": [1, 2, 3]
+            }
+        }
+
+
+class BulkRestoreResponse(BaseModel):
+    """
+    Schema for bulk restore response
+    """
+    restored_count: int = Field(..., description="Number of tasks restored")
+    message: str = Field(..., description="Success message")
+
+
+class TaskSearchRequest(TaskFilter):
     """
     Schema for task search/filtering
     """
-    title: Optional[str] = Field(None, description="Search by title (partial match)")
     page: int = Field(1, ge=1, description="Page number")
     size: int = Field(10, ge=1, le=100, description="Number of tasks per page")
+    sort_by: Optional[TaskSortField] = Field(
+        None, description="Sort column (default: the range-filtered column, else created_at)"
+    )
+    sort_order: Literal["asc", "desc"] = Field("desc", description="Sort direction")
     
     class Config:
         json_schema_extra = {
             "example": {
                 "title": "important",
+                "is_completed": False,
+                "min_modifications": 1,
+                "sort_by": "modification_count",
+                "sort_order": "desc",
                 "page": 1,
                 "size": 10
             }
         }
+
+
+class TaskBatchRequest(BaseModel):
+    """
+    Schema for fetching many tasks by ID in one request
+    """
+    task_ids: list[int] = Field(
+        ..., min_length=1, max_length=BATCH_GET_MAX_IDS, description="IDs of the tasks to fetch"
+    )
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "task_ids": [3, 1, 2]
+            }
+        }
+
+
+class TaskBatchResponse(BaseModel):
+    """
+    Schema for batch lookup results
+    """
+    tasks: list[Optional[TaskResponse]] = Field(
+        ..., description="One entry per requested ID, in request order; null if the task was not found"
+    )
+    missing_ids: list[int] = Field(..., description="Requested IDs without an active task, in request order")
+
+
+class TaskRevisionResponse(BaseModel):
+    """
+    Schema for one version of a task, rebuilt from its revision history
+    """
+    revision: int = Field(..., description="Version number (modification count at that point, 0 = as created)")
+    title: Optional[str] = Field(None, description="Task title in this version")
+    description: Optional[str] = Field(None, description="Task description in this version")
+    is_completed: Optional[bool] = Field(None, description="Completion status in this version")
+    changed_fields: Optional[list[str]] = Field(
+        None, description="Fields changed by the edit that produced this version (null if not recorded)"
+    )
+    recorded_at: Optional[datetime] = Field(None, description="When this version was created (null if not recorded)")
+
+
+class TaskHistoryResponse(BaseModel):
+    """
+    Schema for a page of task versions, newest first
+    """
+    task_id: int = Field(..., description="Task ID")
+    current_revision: int = Field(..., description="Version number of the task as it is now")
+    revisions: list[TaskRevisionResponse] = Field(..., description="Versions, newest first")
+    next_before: Optional[int] = Field(
+        None, description="Pass as 'before' to fetch the next (older) page; null on the last page"
+    )
@@ -1,5 +1,13 @@
 # Services package
 from .task_service import TaskService
 from .metrics_service import MetricsService
+from .archive_service import ArchiveService
+from .job_service import JobService
+from .tenant_counter_service import TenantCounterService
+from .history_service import TaskHistoryService
+from .analytics_service import AnalyticsService
 
-__all__ = ["TaskService", "MetricsService"]
+__all__ = [
+    "TaskService", "MetricsService", "ArchiveService", "JobService", "TenantCounterService", "TaskHistoryService",
+    "AnalyticsService"
+]
@@ -0,0 +1,189 @@
+"""
+Vectorized task analytics over the columnar snapshot (see task_snapshot)
+"""
+
+from datetime import date
+from typing import Any, Dict, List, Sequence
+
+from app.services.task_snapshot import TaskSnapshot, numpy
+
+# Lower edges of the modification_count histogram buckets (the last one is open)
+MODIFICATION_BUCKET_EDGES = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+# Percentiles reported for task lifetimes
+LIFETIME_PERCENTILES = (50, 75, 90, 95, 99)
+
+_SECONDS_PER_DAY = 86400
+
+
+def _median(cumulative) -> float:
+    """Median of non-negative integers given their cumulative frequencies"""
+    np = numpy()
+    total = int(cumulative[-1])
+    low = int(np.searchsorted(cumulative, (total + 1) // 2))
+    high = int(np.searchsorted(cumulative, total // 2 + 1))
+    return (low + high) / 2
+
+
+class AnalyticsService:
+    """
+    Service class for reporting queries answered from a task snapshot
+
+    Every method works on whole columns of one tenant's slice with NumPy
+    operations; nothing here reads the database.
+    """
+
+    def __init__(self, snapshot: TaskSnapshot, tenant_id: str):
+        """
+        Initialize AnalyticsService with a snapshot
+
+        Args:
+            snapshot: Loaded TaskSnapshot
+            tenant_id: Tenant whose tasks are analyzed
+        """
+        self.snapshot = snapshot
+        self.tenant_id = tenant_id
+        self.columns = snapshot.tenant_columns(tenant_id)
+
+    def _meta(self) -> Dict[str, Any]:
+        return {"snapshot_built_at": self.snapshot.built_at}
+
+    def get_modification_histogram(self, include_deleted: bool = False,
+                                   edges: Sequence[int] = MODIFICATION_BUCKET_EDGES) -> Dict[str, Any]:
+        """
+        Get the distribution of modification_count
+
+        Args:
+            include_deleted: Count deleted (and archived) tasks too
+            edges: Ascending lower bucket edges, starting at 0
+
+        Returns:
+            Dictionary with the buckets and summary statistics
+        """
+        np = numpy()
+        counts = self.columns["modification_count"]
+        if not include_deleted:
+            counts = counts[~self.columns["is_deleted"]]
+        # One counting pass; buckets, median and mean come from the frequencies
+        frequencies = np.bincount(counts, minlength=edges[-1] + 1)
+        totals = np.add.reduceat(frequencies, edges)
+        cumulative = np.cumsum(frequencies)
+        buckets = [
+            {
+                "min": edges[index],
+                "max": edges[index + 1] - 1 if index + 1 < len(edges) else None,
+                "count": int(totals[index])
+            }
+            for index in range(len(edges))
+        ]
+        return {
+            **self._meta(),
+            "tasks": int(counts.size),
+            "buckets": buckets,
+            "mean": round(float(np.dot(np.arange(frequencies.size), frequencies) / counts.size), 4)
+            if counts.size else 0.0,
+            "median": _median(cumulative) if counts.size else 0.0,
+            "max": int(frequencies.nonzero()[0][-1]) if counts.size else 0
+        }
+
+    def get_lifetime_percentiles(self, of: str = "deleted",
+                                 percentiles: Sequence[float] = LIFETIME_PERCENTILES) -> Dict[str, Any]:
+        """
+        Get percentiles of task lifetimes in hours
+
+        A task's lifetime runs from creation to its last update: the soft
+        delete for deleted tasks, the last edit (usually the completion)
+        for completed ones.
+
+        Args:
+            of: "deleted" or "completed" tasks
+            percentiles: Percentiles to report (0-100)
+
+        Returns:
+            Dictionary with the task count, mean and percentiles
+        """
+        np = numpy()
+        if of == "deleted":
+            selected = self.columns["is_deleted"]
+        else:
+            selected = self.columns["is_completed"] & ~self.columns["is_deleted"]
+        hours = (self.columns["updated_at"][selected] - self.columns["created_at"][selected]) / 3600.0
+        values = np.percentile(hours, percentiles) if hours.size else [0.0] * len(percentiles)
+        return {
+            **self._meta(),
+            "of": of,
+            "tasks": int(hours.size),
+            "mean_hours": round(float(hours.mean()), 4) if hours.size else 0.0,
+            "percentiles": {f"p{percentile:g}": round(float(value), 4) for percentile, value in zip(percentiles, values)}
+        }
+
+    @staticmethod
+    def _bucket_index(seconds, bucket: str):
+        """Map epoch seconds to consecutive bucket numbers (weeks start on Monday)"""
+        np = numpy()
+        if bucket == "month":
+            return seconds.astype("datetime64[s]").astype("datetime64[M]").astype(np.int64)
+        days = seconds // _SECONDS_PER_DAY
+        # 1970-01-01 was a Thursday: shift so bucket boundaries fall on Mondays
+        return days if bucket == "day" else (days + 3) // 7
+
+    @staticmethod
+    def _bucket_start(index: int, bucket: str) -> date:
+        np = numpy()
+        if bucket == "month":
+            day = np.datetime64(index, "M").astype("datetime64[D]")
+        else:
+            day = np.datetime64(index if bucket == "day" else index * 7 - 3, "D")
+        return day.astype(date)
+
+    def get_rollup(self, bucket: str = "week", periods: int = 12) -> Dict[str, Any]:
+        """
+        Get tasks created versus deleted per time bucket
+
+        Deletions are dated by the soft delete (the task's last update).
+        Periods end with the one containing the snapshot time.
+
+        Args:
+            bucket: "day", "week" or "month"
+            periods: Number of buckets
+
+        Returns:
+            Dictionary with one entry per bucket, oldest first
+        """
+        np = numpy()
+        last = int(self._bucket_index(np.array([int(self.snapshot.built_at.timestamp())]), bucket)[0])
+        first = last - periods + 1
+
+        def per_bucket(seconds) -> List[int]:
+            index = self._bucket_index(seconds, bucket) - first
+            index = index[(index >= 0) & (index < periods)]
+            return np.bincount(index, minlength=periods).tolist()
+
+        created = per_bucket(self.columns["created_at"])
+        deleted = per_bucket(self.columns["updated_at"][self.columns["is_deleted"]])
+        return {
+            **self._meta(),
+            "bucket": bucket,
+            "periods": [
+                {
+                    "start": self._bucket_start(first + offset, bucket),
+                    "created": created[offset],
+                    "deleted": deleted[offset],
+                    "net": created[offset] - deleted[offset]
+                }
+                for offset in range(periods)
+            ]
+        }
+
+    def get_snapshot_info(self) -> Dict[str, Any]:
+        """
+        Describe the snapshot the analytics are computed from
+
+        Returns:
+            Dictionary with build time, total rows and the tenant's rows
+        """
+        return {
+            **self._meta(),
+            "snapshot": self.snapshot.name,
+            "rows": self.snapshot.rows,
+            "tenant_rows": int(self.columns["created_at"].size)
+        }
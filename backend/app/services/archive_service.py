@@ -0,0 +1,275 @@
+"""
+Archive service moving old soft-deleted tasks out of the hot tasks table
+"""
+
+import os
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Callable, List, Optional, Tuple
+
+from sqlalchemy import and_, case, delete, false, func, insert, inspect, select, text, true
+from sqlalchemy.orm import Session
+
+from app.db.partitions import PARTITIONED_TABLE, add_months, list_partitions
+from app.models.task import Task
+from app.models.task_archive import TaskArchive
+from app.services.task_cache import task_cache
+from app.services.tenant_counter_service import TenantCounterService
+
+# Tasks deleted longer ago than this are archived
+ARCHIVE_AFTER_DAYS = int(os.getenv("ARCHIVE_AFTER_DAYS", "30"))
+# Rows moved per transaction
+ARCHIVE_BATCH_SIZE = int(os.getenv("ARCHIVE_BATCH_SIZE", "1000"))
+# Pause between batches so the job never hogs the table
+ARCHIVE_BATCH_PAUSE_MS = float(os.getenv("ARCHIVE_BATCH_PAUSE_MS", "50"))
+
+# Columns copied between tasks and tasks_archive (descriptions stay in
+# task_descriptions, keyed by task ID, while a task is archived)
+ARCHIVED_COLUMNS = (
+    "id", "tenant_id", "title", "is_deleted", "is_completed", "modification_count",
+    "created_at", "updated_at"
+)
+
+
+class ArchiveService:
+    """
+    Service class for archiving and restoring soft-deleted tasks
+
+    Archived tasks count as deleted either way, so archiving leaves the
+    tenant counters alone; restores move tasks back to active and update
+    the owning tenant's counters.
+    """
+
+    def __init__(self, db: Session, tenant_id: Optional[str] = None):
+        """
+        Initialize ArchiveService with database session
+
+        Args:
+            db: SQLAlchemy database session
+            tenant_id: Only archive, restore and count this tenant's tasks (None: every tenant)
+        """
+        self.db = db
+        self.tenant_id = tenant_id
+        self.counters = TenantCounterService(db)
+
+    def _in_tenant(self, criterion):
+        """Restrict an archive criterion to the service's tenant, if any"""
+        if self.tenant_id is None:
+            return criterion
+        return and_(criterion, TaskArchive.tenant_id == self.tenant_id)
+
+    def archive_deleted_tasks(
+        self,
+        older_than_days: int = ARCHIVE_AFTER_DAYS,
+        batch_size: int = ARCHIVE_BATCH_SIZE,
+        pause_ms: float = ARCHIVE_BATCH_PAUSE_MS,
+        max_batches: Optional[int] = None,
+        progress: Optional[Callable[[int], None]] = None
+    ) -> int:
+        """
+        Move tasks soft-deleted more than ``older_than_days`` ago to tasks_archive
+
+        Soft-deleted tasks can't be edited, so ``updated_at`` is the time of
+        the delete. Rows move in primary-key ordered batches, each in its own
+        short transaction, so locks are held only briefly.
+
+        Args:
+            older_than_days: Minimum age of the soft delete in days
+            batch_size: Number of tasks moved per transaction
+            pause_ms: Sleep between batches in milliseconds
+            max_batches: Stop after this many batches (optional)
+            progress: Callback receiving the running total after each batch
+
+        Returns:
+            Number of tasks archived
+        """
+        cutoff = datetime.now(timezone.utc) - timedelta(days=older_than_days)
+        archivable = and_(Task.is_deleted == True, Task.updated_at < cutoff)
+        if self.tenant_id is not None:
+            archivable = and_(archivable, Task.tenant_id == self.tenant_id)
+        columns = [getattr(Task, name) for name in ARCHIVED_COLUMNS]
+        archived = 0
+        batches = 0
+        last_id = 0
+
+        while max_batches is None or batches < max_batches:
+            ids = self.db.scalars(
+                select(Task.id).where(and_(archivable, Task.id > last_id)).order_by(Task.id).limit(batch_size)
+            ).all()
+            if not ids:
+                break
+            last_id = ids[-1]
+
+            in_batch = and_(Task.id.in_(ids), archivable)
+            self.db.execute(
+                insert(TaskArchive).from_select(list(ARCHIVED_COLUMNS), select(*columns).where(in_batch))
+            )
+            moved = self.db.execute(delete(Task).where(in_batch)).rowcount
+            self.db.commit()
+            task_cache.invalidate()
+
+            archived += moved
+            batches += 1
+            if progress:
+                progress(archived)
+            if pause_ms > 0:
+                time.sleep(pause_ms / 1000.0)
+
+        return archived
+
+    def archive_deleted_partitions(self, older_than_days: int = ARCHIVE_AFTER_DAYS) -> int:
+        """
+        Archive whole monthly partitions of tasks that only hold old deleted rows
+
+        On a partitioned tasks table (MySQL), a partition whose rows are all
+        soft-deleted before the cutoff is swapped out with EXCHANGE PARTITION
+        and dropped, which is instant for the hot table. The swapped-out rows
+        are then copied into tasks_archive; any row restored in the meantime
+        goes back into tasks. A swap table left behind by an interrupted run
+        is drained the same way before anything else, so its rows are never
+        lost. No-op on unpartitioned tables, and for a tenant-scoped service
+        (partitions hold every tenant's rows).
+
+        Args:
+            older_than_days: Minimum age of the soft delete in days
+
+        Returns:
+            Number of tasks archived
+        """
+        if self.tenant_id is not None:
+            return 0
+        conn = self.db.connection()
+        partitions = list_partitions(conn)
+        if not partitions:
+            return 0
+
+        cutoff = datetime.now(timezone.utc) - timedelta(days=older_than_days)
+        swap_table = f"{PARTITIONED_TABLE}_partition_swap"
+        archived = 0
+        if inspect(conn).has_table(swap_table):
+            # A previous run stopped between the swap and the copy
+            archived += self._drain_swap_table(swap_table)
+
+        # Never drop the newest month partitions or the catch-all one
+        for name, month in partitions[:-1]:
+            if month is None or add_months(month, 1) > cutoff.date():
+                break
+            live = self.db.execute(text(
+                f"SELECT COUNT(*) FROM {PARTITIONED_TABLE} PARTITION ({name}) "
+                "WHERE is_deleted = 0 OR updated_at >= :cutoff"
+            ), {"cutoff": cutoff}).scalar()
+            if live:
+                continue
+
+            # DDL commits implicitly on MySQL. The swap table only exists
+            # while it holds rows not yet copied back; it is dropped last
+            self.db.execute(text(f"CREATE TABLE {swap_table} LIKE {PARTITIONED_TABLE}"))
+            self.db.execute(text(f"ALTER TABLE {swap_table} REMOVE PARTITIONING"))
+            self.db.execute(text(
+                f"ALTER TABLE {PARTITIONED_TABLE} EXCHANGE PARTITION {name} WITH TABLE {swap_table}"
+            ))
+            self.db.execute(text(f"ALTER TABLE {PARTITIONED_TABLE} DROP PARTITION {name}"))
+            archived += self._drain_swap_table(swap_table)
+
+        return archived
+
+    def _drain_swap_table(self, swap_table: str) -> int:
+        """
+        Copy a swapped-out partition's rows to tasks_archive (deleted) or
+        back to tasks (restored meanwhile), then drop the swap table
+
+        Rows already copied by an interrupted earlier drain are skipped,
+        so this is safe to re-run.
+
+        Returns:
+            Number of tasks archived
+        """
+        columns = ", ".join(ARCHIVED_COLUMNS)
+        archived = self.db.execute(text(
+            f"INSERT INTO tasks_archive ({columns}) SELECT {columns} FROM {swap_table} s "
+            "WHERE s.is_deleted = 1 AND NOT EXISTS (SELECT 1 FROM tasks_archive a WHERE a.id = s.id)"
+        )).rowcount
+        self.db.execute(text(
+            f"INSERT INTO {PARTITIONED_TABLE} SELECT s.* FROM {swap_table} s "
+            f"WHERE s.is_deleted = 0 AND NOT EXISTS (SELECT 1 FROM {PARTITIONED_TABLE} t WHERE t.id = s.id)"
+        ))
+        self.db.commit()
+        task_cache.invalidate()
+        self.db.execute(text(f"DROP TABLE {swap_table}"))
+        return archived
+
+    def restore_archived_task(self, task_id: int) -> Optional[Task]:
+        """
+        Move an archived task back into the tasks table as an active task
+
+        Args:
+            task_id: The ID of the archived task
+
+        Returns:
+            Restored Task object if it was archived, None otherwise
+        """
+        archived = self.db.get(TaskArchive, task_id)
+        if archived is None or (self.tenant_id is not None and archived.tenant_id != self.tenant_id):
+            return None
+
+        db_task = Task(**{name: getattr(archived, name) for name in ARCHIVED_COLUMNS})
+        db_task.is_deleted = False
+        db_task.updated_at = func.now()
+        self.db.delete(archived)
+        self.db.add(db_task)
+        self.counters.add(
+            archived.tenant_id, active_count=1, deleted_count=-1,
+            modified_count=1 if archived.modification_count > 0 else 0
+        )
+        self.db.commit()
+        task_cache.invalidate()
+        return db_task
+
+    def restore_archived_tasks(self, task_ids: List[int]) -> int:
+        """
+        Move a chunk of archived tasks back into the tasks table as active tasks
+
+        Args:
+            task_ids: IDs to restore; IDs that aren't archived are ignored
+
+        Returns:
+            Number of tasks restored
+        """
+        in_archive = self._in_tenant(TaskArchive.id.in_(task_ids))
+        restored_columns = [
+            getattr(TaskArchive, name) for name in ARCHIVED_COLUMNS if name not in ("is_deleted", "updated_at")
+        ]
+        restored = self.db.execute(
+            insert(Task).from_select(
+                [column.key for column in restored_columns] + ["is_deleted", "updated_at"],
+                select(*restored_columns, false(), func.now()).where(in_archive)
+            )
+        ).rowcount
+        if restored:
+            # Per-tenant counter moves, read inside the restoring transaction
+            moves = self.db.execute(
+                select(
+                    TaskArchive.tenant_id,
+                    func.count(TaskArchive.id),
+                    func.coalesce(func.sum(case((TaskArchive.modification_count > 0, 1), else_=0)), 0)
+                ).where(in_archive).group_by(TaskArchive.tenant_id)
+            ).all()
+            self.db.execute(delete(TaskArchive).where(in_archive))
+            for tenant_id, count, modified in moves:
+                self.counters.add(tenant_id, active_count=count, deleted_count=-count, modified_count=modified)
+        self.db.commit()
+        task_cache.invalidate()
+        return restored
+
+    def get_archived_totals(self) -> Tuple[int, int]:
+        """
+        Get the number of archived tasks and their summed modification counts
+
+        Returns:
+            Tuple of (archived task count, total modifications)
+        """
+        count, modifications = self.db.execute(
+            select(func.count(TaskArchive.id), func.coalesce(func.sum(TaskArchive.modification_count), 0))
+            .where(self._in_tenant(true()))
+        ).one()
+        return count, modifications
@@ -0,0 +1,122 @@
+"""
+Liveness and readiness checks built from in-memory state
+
+Probes run every few seconds on every worker, so nothing here scans a
+table: readiness runs one ``SELECT 1`` through the connection pool (at most
+once per HEALTH_DB_CHECK_TTL_MS) and reports everything else from counters
+the process already keeps.
+"""
+
+import os
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+from app.db.database import get_engine, get_read_engine
+from app.jobs.runner import job_runner
+from app.middleware.rate_limit import admission_stats, concurrency_limiters
+from app.services.invalidation_bus import invalidation_bus
+from app.services.single_flight import read_flights
+from app.services.task_cache import task_cache
+from app.services.warmup import warmup
+
+# Reuse the last database check for this long, so probe bursts cost one query
+HEALTH_DB_CHECK_TTL_MS = float(os.getenv("HEALTH_DB_CHECK_TTL_MS", "1000"))
+
+_started = time.monotonic()
+_db_check_lock = threading.Lock()
+_db_check: Optional[Tuple[float, Dict[str, Any]]] = None
+
+
+def liveness() -> Dict[str, Any]:
+    """
+    Whether the process is alive (never touches the database)
+
+    Returns:
+        Dictionary with status, process ID and uptime
+    """
+    return {
+        "status": "alive",
+        "pid": os.getpid(),
+        "uptime_seconds": round(time.monotonic() - _started, 1)
+    }
+
+
+def check_database(max_age_ms: float = HEALTH_DB_CHECK_TTL_MS) -> Dict[str, Any]:
+    """
+    Check out a pooled connection and run ``SELECT 1``
+
+    Args:
+        max_age_ms: Return the previous result if it is at most this old
+
+    Returns:
+        Dictionary with ok, latency_ms, checked_at age and the error, if any
+    """
+    global _db_check
+    with _db_check_lock:
+        now = time.monotonic()
+        if _db_check is not None and (now - _db_check[0]) * 1000 <= max_age_ms:
+            cached_at, result = _db_check
+            return {**result, "age_ms": round((now - cached_at) * 1000, 1)}
+
+        started = time.perf_counter()
+        try:
+            # Readers: a long write holding the SQLite writer must not fail the probe
+            with get_read_engine().connect() as connection:
+                connection.execute(text("SELECT 1"))
+            result = {"ok": True, "latency_ms": round((time.perf_counter() - started) * 1000, 2), "error": None}
+        except Exception as exc:
+            result = {"ok": False, "latency_ms": round((time.perf_counter() - started) * 1000, 2), "error": str(exc)}
+        _db_check = (time.monotonic(), result)
+        return {**result, "age_ms": 0.0}
+
+
+def pool_stats(engine: Optional[Engine] = None) -> Dict[str, Any]:
+    """
+    Connection pool usage of an engine
+
+    Args:
+        engine: Engine to inspect (default: the main engine)
+
+    Returns:
+        Dictionary with pool class, size, checked-out and overflow counts;
+        in SQLite file mode the reader pool is nested under "readers"
+    """
+    pool = (engine or get_engine()).pool
+    stats: Dict[str, Any] = {"pool": type(pool).__name__}
+    # Only QueuePool-style pools expose sizing
+    for name in ("size", "checkedin", "checkedout", "overflow"):
+        method = getattr(pool, name, None)
+        if callable(method):
+            stats[name] = method()
+    if engine is None and get_read_engine() is not get_engine():
+        stats["readers"] = pool_stats(get_read_engine())
+    return stats
+
+
+def readiness() -> Tuple[bool, Dict[str, Any]]:
+    """
+    Whether the process should receive traffic, plus in-memory statistics
+
+    Ready means the startup warm-up has finished and a pooled connection
+    answered ``SELECT 1``.
+
+    Returns:
+        Tuple of (ready, report)
+    """
+    database = check_database()
+    ready = warmup.is_ready() and database["ok"]
+    report = {
+        "status": "ready" if ready else "not_ready",
+        "warmup": warmup.state(),
+        "database": database,
+        "pool": pool_stats(),
+        "cache": {**task_cache.stats(), "bus_current": invalidation_bus.is_current()},
+        "coalescing": read_flights.stats(),
+        "jobs": job_runner.stats(),
+        "admission": admission_stats(concurrency_limiters)
+    }
+    return ready, report
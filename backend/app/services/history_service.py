@@ -0,0 +1,249 @@
+"""
+Task revision history: compact reverse deltas with periodic snapshots
+
+Each edit stores how to turn the new version back into the previous one.
+For a changed text field that is the common prefix and suffix lengths
+plus the old middle part, so a typo fix in a long description costs a few
+bytes. Every TASK_HISTORY_SNAPSHOT_INTERVAL-th revision stores the full
+previous version instead. Rebuilding any version therefore starts from
+the nearest snapshot above it (or the live row) and applies fewer than
+TASK_HISTORY_SNAPSHOT_INTERVAL deltas, read in one range query.
+
+Recording happens in the update's own flush: no extra reads, one extra
+INSERT in the same transaction.
+"""
+
+import json
+import os
+import zlib
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import and_, select
+from sqlalchemy.orm import Session
+
+from app.models.task import Task
+from app.models.task_revision import TaskRevision
+
+# Record a revision for every task update
+TASK_HISTORY_ENABLED = os.getenv("TASK_HISTORY_ENABLED", "true").lower() in ("1", "true", "yes")
+# Store a full snapshot every this many revisions (bounds the deltas per rebuild)
+TASK_HISTORY_SNAPSHOT_INTERVAL = max(1, int(os.getenv("TASK_HISTORY_SNAPSHOT_INTERVAL", "10")))
+# Compress payloads of at least this many bytes with zlib (0 disables compression)
+TASK_HISTORY_COMPRESS_MIN_BYTES = int(os.getenv("TASK_HISTORY_COMPRESS_MIN_BYTES", "256"))
+
+# Task fields tracked by the history
+TRACKED_FIELDS = ("title", "description", "is_completed")
+
+TaskState = Dict[str, Any]
+
+
+def reverse_delta(new: Any, old: Any) -> Any:
+    """Encode how to rebuild ``old`` from ``new``"""
+    if not isinstance(new, str) or not isinstance(old, str):
+        return {"v": old}
+    limit = min(len(new), len(old))
+    prefix = 0
+    while prefix < limit and new[prefix] == old[prefix]:
+        prefix += 1
+    suffix = 0
+    while suffix < limit - prefix and new[-1 - suffix] == old[-1 - suffix]:
+        suffix += 1
+    return [prefix, suffix, old[prefix:len(old) - suffix]]
+
+
+def apply_delta(new: Any, delta: Any) -> Any:
+    """Rebuild the previous value of a field from its current value"""
+    if isinstance(delta, dict):
+        return delta["v"]
+    prefix, suffix, middle = delta
+    return new[:prefix] + middle + new[len(new) - suffix:]
+
+
+def encode_payload(data: Dict[str, Any]) -> Tuple[bytes, bool]:
+    """
+    Serialize a revision payload, compressing it when that pays off
+
+    Returns:
+        Tuple of (payload bytes, whether they are compressed)
+    """
+    raw = json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    if 0 < TASK_HISTORY_COMPRESS_MIN_BYTES <= len(raw):
+        compressed = zlib.compress(raw, 6)
+        if len(compressed) < len(raw):
+            return compressed, True
+    return raw, False
+
+
+def decode_payload(revision: TaskRevision) -> Dict[str, Any]:
+    """Deserialize the payload of a stored revision"""
+    raw = zlib.decompress(revision.payload) if revision.is_compressed else revision.payload
+    return json.loads(raw)
+
+
+def snapshot_state(revision: TaskRevision, newer: TaskState) -> TaskState:
+    """
+    State stored in a snapshot revision
+
+    Fields tracked only since the snapshot was written keep their value
+    from ``newer`` (the version after it).
+    """
+    return {**newer, **decode_payload(revision)["s"]}
+
+
+@dataclass
+class TaskVersion:
+    """
+    One reconstructed version of a task
+
+    Attributes:
+        revision: Version number (modification_count at that point)
+        state: Tracked field values of the version
+        changed_fields: Fields changed by the edit that produced it (None if not recorded)
+        recorded_at: When the version came into being (None if not recorded)
+    """
+    revision: int
+    state: TaskState
+    changed_fields: Optional[List[str]]
+    recorded_at: Optional[datetime]
+
+
+class TaskHistoryService:
+    """
+    Service class recording and reconstructing task revisions
+    """
+
+    def __init__(self, db: Session, snapshot_interval: int = TASK_HISTORY_SNAPSHOT_INTERVAL):
+        """
+        Initialize TaskHistoryService with database session
+
+        Args:
+            db: SQLAlchemy database session
+            snapshot_interval: Revisions between full snapshots
+        """
+        self.db = db
+        self.snapshot_interval = snapshot_interval
+
+    def record_update(self, db_task: Task, previous: TaskState) -> TaskRevision:
+        """
+        Add the revision for an edit to the session (committed with the edit)
+
+        Call after the new values and modification_count are set on the task.
+
+        Args:
+            db_task: The edited task
+            previous: Tracked field values before the edit
+
+        Returns:
+            The pending TaskRevision
+        """
+        revision = db_task.modification_count
+        changed = [field for field in TRACKED_FIELDS if getattr(db_task, field) != previous[field]]
+        if revision % self.snapshot_interval == 0:
+            data = {"s": previous, "c": changed}
+            is_snapshot = True
+        else:
+            data = {"d": {field: reverse_delta(getattr(db_task, field), previous[field]) for field in changed}}
+            is_snapshot = False
+        payload, is_compressed = encode_payload(data)
+        db_revision = TaskRevision(
+            task_id=db_task.id,
+            revision=revision,
+            is_snapshot=is_snapshot,
+            is_compressed=is_compressed,
+            payload=payload
+        )
+        self.db.add(db_revision)
+        return db_revision
+
+    def get_versions(self, db_task: Task, newest: int, oldest: int) -> List[TaskVersion]:
+        """
+        Reconstruct the versions ``newest`` down to ``oldest`` of a task
+
+        Reads the revisions from ``oldest`` up to the nearest snapshot above
+        ``newest`` in one range query.
+
+        Args:
+            db_task: The task (its current row is version modification_count)
+            newest: Highest version to return (at most modification_count)
+            oldest: Lowest version to return (at least 0)
+
+        Returns:
+            Versions newest first; stops early where the history has a gap
+            (edits made before history was recorded)
+        """
+        current = db_task.modification_count
+        newest = min(newest, current)
+        if newest < oldest:
+            return []
+
+        highest = newest + self.snapshot_interval
+        rows = self._load(db_task.id, oldest, highest if highest < current else None)
+        base = self._find_snapshot(rows, newest)
+        if base is None and highest < current:
+            # No snapshot in range: the interval was raised after these were written
+            rows = self._load(db_task.id, oldest, None)
+            base = self._find_snapshot(rows, newest)
+        live = {field: getattr(db_task, field) for field in TRACKED_FIELDS}
+        if base is None:
+            base = (current, live)
+        else:
+            base = (base[0], {**live, **base[1]})
+
+        version, state = base
+        versions: List[TaskVersion] = []
+        while version >= oldest:
+            row = rows.get(version)
+            if version <= newest:
+                versions.append(self._version(db_task, version, state, row))
+            if version == oldest or row is None:
+                break
+            if row.is_snapshot:
+                state = snapshot_state(row, state)
+            else:
+                state = dict(state)
+                for field, delta in decode_payload(row)["d"].items():
+                    state[field] = apply_delta(state[field], delta)
+            version -= 1
+        return versions
+
+    def get_version(self, db_task: Task, revision: int) -> Optional[TaskVersion]:
+        """
+        Reconstruct one version of a task
+
+        Args:
+            db_task: The task
+            revision: Version number (0 is the task as created)
+
+        Returns:
+            TaskVersion, or None if that version isn't in the history
+        """
+        if revision < 0:
+            return None
+        versions = self.get_versions(db_task, revision, revision)
+        return versions[0] if versions and versions[0].revision == revision else None
+
+    def _load(self, task_id: int, oldest: int, highest: Optional[int]) -> Dict[int, TaskRevision]:
+        criteria = [TaskRevision.task_id == task_id, TaskRevision.revision >= max(oldest, 1)]
+        if highest is not None:
+            criteria.append(TaskRevision.revision <= highest)
+        return {row.revision: row for row in self.db.scalars(select(TaskRevision).where(and_(*criteria)))}
+
+    @staticmethod
+    def _find_snapshot(rows: Dict[int, TaskRevision], newest: int) -> Optional[Tuple[int, TaskState]]:
+        """Lowest snapshotted version at or above ``newest``, if any"""
+        for revision in sorted(rows):
+            if revision > newest and rows[revision].is_snapshot:
+                return revision - 1, dict(decode_payload(rows[revision])["s"])
+        return None
+
+    @staticmethod
+    def _version(db_task: Task, version: int, state: TaskState, row: Optional[TaskRevision]) -> TaskVersion:
+        if version == 0:
+            return TaskVersion(0, state, [], db_task.created_at)
+        if row is None:
+            return TaskVersion(version, state, None, None)
+        payload = decode_payload(row)
+        changed = payload["c"] if row.is_snapshot else list(payload["d"])
+        return TaskVersion(version, state, changed, row.created_at)
@@ -0,0 +1,256 @@
+"""
+Cache invalidation bus keeping in-process caches coherent across workers
+
+Every cache that attaches to the bus publishes the keys it invalidates and
+drops the keys published by everyone else. ``LocalBus`` delivers between
+subscribers of one process (single worker, tests); ``DatabaseBus`` also
+writes each message to the ``cache_invalidations`` table, which a poller
+thread in every worker process reads back.
+"""
+
+import logging
+import os
+import socket
+import threading
+import time
+from collections import defaultdict, deque
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, Hashable, Iterable, List, Optional
+
+from sqlalchemy import delete, func, select
+
+from app.db.database import SessionLocal
+from app.models.cache_invalidation import CacheInvalidation
+
+logger = logging.getLogger(__name__)
+
+# "local", "database", or "auto" (database when running several workers)
+CACHE_BUS = os.getenv("CACHE_BUS", "auto").lower()
+# How often each worker polls for invalidations published by the others
+CACHE_BUS_POLL_MS = float(os.getenv("CACHE_BUS_POLL_MS", "100"))
+# How long published invalidations are kept in the table
+CACHE_BUS_RETENTION_SECONDS = float(os.getenv("CACHE_BUS_RETENTION_SECONDS", "300"))
+
+# Re-read this many IDs behind the newest one seen, so rows committed out of
+# ID order by concurrent publishers are not skipped
+_POLL_LOOKBACK = 100
+_POLL_BATCH = 1000
+
+# Called with the invalidated keys, or None when the whole cache is cleared
+Subscriber = Callable[[Optional[List[Hashable]]], None]
+
+
+def worker_count() -> int:
+    """
+    Number of server worker processes configured by WEB_CONCURRENCY
+
+    Returns:
+        Worker count; "auto" means one per CPU core
+    """
+    value = os.getenv("WEB_CONCURRENCY", "1").lower()
+    if value == "auto":
+        return os.cpu_count() or 1
+    return max(1, int(value))
+
+
+def _decode_key(key):
+    # JSON turns composite (tuple) keys into lists
+    return tuple(_decode_key(part) for part in key) if isinstance(key, list) else key
+
+
+class LocalBus:
+    """
+    In-process bus delivering invalidations to every other local subscriber
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscribers: Dict[str, List[Subscriber]] = defaultdict(list)
+
+    def subscribe(self, channel: str, callback: Subscriber) -> None:
+        """
+        Receive invalidations published on a channel
+
+        Args:
+            channel: Channel name, e.g. "tasks"
+            callback: Called with the keys (None means clear everything)
+        """
+        with self._lock:
+            self._subscribers[channel].append(callback)
+
+    def publish(self, channel: str, keys: Optional[Iterable[Hashable]], source: Optional[Subscriber] = None) -> None:
+        """
+        Publish invalidated keys
+
+        Args:
+            channel: Channel name
+            keys: Invalidated keys, or None to clear every cache on the channel
+            source: Subscriber that published the message (not called back)
+        """
+        self._deliver(channel, None if keys is None else list(keys), source)
+
+    def is_current(self) -> bool:
+        """Whether every published invalidation has been delivered"""
+        return True
+
+    def start(self) -> None:
+        """Start delivering messages from other processes"""
+
+    def stop(self) -> None:
+        """Stop delivering messages from other processes"""
+
+    def _deliver(self, channel: str, keys: Optional[List[Hashable]], source: Optional[Subscriber] = None) -> None:
+        with self._lock:
+            subscribers = [callback for callback in self._subscribers.get(channel, ()) if callback != source]
+        for callback in subscribers:
+            try:
+                callback(keys)
+            except Exception:
+                logger.exception("Cache invalidation subscriber failed on channel %s", channel)
+
+
+class DatabaseBus(LocalBus):
+    """
+    Bus sharing invalidations between worker processes through the database
+
+    Caches consult ``is_current`` before serving a hit: when the poller has
+    not caught up recently (database unreachable, thread stalled) cached
+    entries are bypassed instead of risking stale reads.
+    """
+
+    def __init__(
+        self,
+        session_factory=SessionLocal,
+        poll_interval_ms: float = CACHE_BUS_POLL_MS,
+        retention_seconds: float = CACHE_BUS_RETENTION_SECONDS
+    ):
+        super().__init__()
+        self.session_factory = session_factory
+        self.poll_interval = poll_interval_ms / 1000.0
+        self.retention = retention_seconds
+        self.origin = ""
+        self._last_id = 0
+        self._seen: deque = deque(maxlen=_POLL_LOOKBACK * 10)
+        self._last_poll = 0.0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def publish(self, channel: str, keys: Optional[Iterable[Hashable]], source: Optional[Subscriber] = None) -> None:
+        keys = None if keys is None else list(keys)
+        self._deliver(channel, keys, source)
+        db = self.session_factory()
+        try:
+            db.add(CacheInvalidation(channel=channel, keys=keys, origin=self.origin or _process_id()))
+            db.commit()
+        finally:
+            db.close()
+
+    def is_current(self) -> bool:
+        return self._thread is not None and time.monotonic() - self._last_poll < self.poll_interval * 3
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        # Resolved here rather than at import so forked workers get their own
+        self.origin = _process_id()
+        db = self.session_factory()
+        try:
+            self._last_id = db.scalar(select(func.max(CacheInvalidation.id))) or 0
+        finally:
+            db.close()
+        self._last_poll = time.monotonic()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="cache-invalidation-bus", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+    def poll(self) -> int:
+        """
+        Deliver invalidations published by other processes since the last poll
+
+        Returns:
+            Number of messages delivered
+        """
+        db = self.session_factory()
+        try:
+            rows = db.execute(
+                select(CacheInvalidation.id, CacheInvalidation.channel, CacheInvalidation.keys,
+                       CacheInvalidation.origin)
+                .where(CacheInvalidation.id > self._last_id - _POLL_LOOKBACK)
+                .order_by(CacheInvalidation.id)
+                .limit(_POLL_BATCH + _POLL_LOOKBACK)
+            ).all()
+        finally:
+            db.close()
+
+        delivered = 0
+        if time.monotonic() - self._last_poll > self.retention / 2:
+            # Missed messages may already be pruned: start over with empty caches
+            for channel in list(self._subscribers):
+                self._deliver(channel, None)
+        for row_id, channel, keys, origin in rows:
+            if row_id in self._seen:
+                continue
+            self._seen.append(row_id)
+            self._last_id = max(self._last_id, row_id)
+            if origin == self.origin:
+                continue
+            self._deliver(channel, None if keys is None else [_decode_key(key) for key in keys])
+            delivered += 1
+        self._last_poll = time.monotonic()
+        return delivered
+
+    def prune(self) -> int:
+        """
+        Delete invalidations older than the retention period
+
+        Returns:
+            Number of rows deleted
+        """
+        cutoff = datetime.now(timezone.utc) - timedelta(seconds=self.retention)
+        db = self.session_factory()
+        try:
+            deleted = db.execute(
+                delete(CacheInvalidation).where(CacheInvalidation.published_at < cutoff)
+            ).rowcount
+            db.commit()
+            return deleted
+        finally:
+            db.close()
+
+    def _run(self) -> None:
+        next_prune = time.monotonic() + self.retention
+        while not self._stop.wait(self.poll_interval):
+            try:
+                self.poll()
+                if time.monotonic() >= next_prune:
+                    self.prune()
+                    next_prune = time.monotonic() + self.retention
+            except Exception:
+                logger.exception("Polling cache invalidations failed")
+
+
+def _process_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def create_bus() -> LocalBus:
+    """
+    Build the bus selected by CACHE_BUS
+
+    Returns:
+        LocalBus for a single worker, DatabaseBus otherwise
+    """
+    if CACHE_BUS == "database" or (CACHE_BUS == "auto" and worker_count() > 1):
+        return DatabaseBus()
+    return LocalBus()
+
+
+# Shared instance the process-level caches attach to
+invalidation_bus = create_bus()
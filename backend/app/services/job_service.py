@@ -0,0 +1,235 @@
+"""
+Job service layer persisting background job state
+"""
+
+from typing import Any, Dict, List, Optional
+from sqlalchemy import and_, func, select, update
+from sqlalchemy.orm import Session
+from app.db.tenancy import DEFAULT_TENANT_ID
+from app.models.job import Job
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_SUCCEEDED = "succeeded"
+JOB_FAILED = "failed"
+JOB_CANCELLED = "cancelled"
+
+# Statuses a job never leaves
+FINAL_STATUSES = (JOB_SUCCEEDED, JOB_FAILED, JOB_CANCELLED)
+
+
+class JobService:
+    """
+    Service class for background job bookkeeping
+    """
+
+    def __init__(self, db: Session):
+        """
+        Initialize JobService with database session
+
+        Args:
+            db: SQLAlchemy database session
+        """
+        self.db = db
+
+    def create_job(
+        self,
+        operation: str,
+        params: Dict[str, Any],
+        total: Optional[int] = None,
+        tenant_id: str = DEFAULT_TENANT_ID
+    ) -> Job:
+        """
+        Persist a new queued job
+
+        Args:
+            operation: Registered operation name
+            params: JSON-serializable operation parameters
+            total: Number of items to process, when known up front
+            tenant_id: Tenant whose tasks the job works on
+
+        Returns:
+            Created Job object
+        """
+        job = Job(tenant_id=tenant_id, operation=operation, status=JOB_QUEUED, params=params, total=total)
+        self.db.add(job)
+        self.db.commit()
+        return job
+
+    def get_job(self, job_id: int, tenant_id: Optional[str] = None) -> Optional[Job]:
+        """
+        Retrieve a job by ID
+
+        Args:
+            job_id: The ID of the job
+            tenant_id: Only return the job if this tenant queued it (optional)
+
+        Returns:
+            Job object if found, None otherwise
+        """
+        job = self.db.get(Job, job_id)
+        if job is None or (tenant_id is not None and job.tenant_id != tenant_id):
+            return None
+        return job
+
+    def list_jobs(self, status: Optional[str] = None, limit: int = 50, tenant_id: Optional[str] = None) -> List[Job]:
+        """
+        List the most recent jobs
+
+        Args:
+            status: Only jobs with this status (optional)
+            limit: Maximum number of jobs to return
+            tenant_id: Only jobs queued by this tenant (optional)
+
+        Returns:
+            List of Job objects, newest first
+        """
+        query = self.db.query(Job)
+        if tenant_id is not None:
+            query = query.filter(Job.tenant_id == tenant_id)
+        if status is not None:
+            query = query.filter(Job.status == status)
+        return query.order_by(Job.id.desc()).limit(limit).all()
+
+    def request_cancel(self, job_id: int, tenant_id: Optional[str] = None) -> Optional[Job]:
+        """
+        Cancel a job
+
+        A queued job is cancelled right away; a running job is flagged and
+        stops at its next progress checkpoint. Finished jobs are unchanged.
+
+        Args:
+            job_id: The ID of the job
+            tenant_id: Only cancel the job if this tenant queued it (optional)
+
+        Returns:
+            Job object if found, None otherwise
+        """
+        job = self.get_job(job_id, tenant_id)
+        if job is None or job.status in FINAL_STATUSES:
+            return job
+
+        job.cancel_requested = True
+        if job.status == JOB_QUEUED:
+            job.status = JOB_CANCELLED
+            job.finished_at = func.now()
+        self.db.commit()
+        self.db.refresh(job)
+        return job
+
+    def claim_job(self, job_id: int, worker: str) -> bool:
+        """
+        Atomically move a queued job to running
+
+        Only one worker (or process) can claim a given job.
+
+        Args:
+            job_id: The ID of the job
+            worker: "host:pid" of the claiming process
+
+        Returns:
+            True if this caller claimed the job
+        """
+        claimed = self.db.execute(
+            update(Job)
+            .where(and_(Job.id == job_id, Job.status == JOB_QUEUED))
+            .values(status=JOB_RUNNING, claimed_by=worker, started_at=func.now())
+        ).rowcount
+        self.db.commit()
+        return claimed == 1
+
+    def report_progress(self, job_id: int, processed: int, total: Optional[int] = None) -> bool:
+        """
+        Record job progress
+
+        Args:
+            job_id: The ID of the job
+            processed: Number of items processed so far
+            total: Number of items to process (optional)
+
+        Returns:
+            True if cancellation was requested
+        """
+        values: Dict[str, Any] = {"processed": processed}
+        if total is not None:
+            values["total"] = total
+        self.db.execute(update(Job).where(Job.id == job_id).values(**values))
+        cancel_requested = self.db.scalar(select(Job.cancel_requested).where(Job.id == job_id))
+        self.db.commit()
+        return bool(cancel_requested)
+
+    def finish_job(
+        self,
+        job_id: int,
+        status: str,
+        result: Optional[Dict[str, Any]] = None,
+        error: Optional[str] = None
+    ) -> None:
+        """
+        Move a job to a final status
+
+        Args:
+            job_id: The ID of the job
+            status: succeeded, failed or cancelled
+            result: Operation result (optional)
+            error: Error message (optional)
+        """
+        self.db.execute(
+            update(Job)
+            .where(Job.id == job_id)
+            .values(status=status, result=result, error=error, finished_at=func.now())
+        )
+        self.db.commit()
+
+    def fail_interrupted_jobs(self, workers: List[str]) -> int:
+        """
+        Fail jobs left running by processes that stopped mid-job
+
+        Args:
+            workers: "host:pid" values of processes that are gone
+
+        Returns:
+            Number of jobs marked as failed
+        """
+        if not workers:
+            return 0
+        failed = self.db.execute(
+            update(Job)
+            .where(and_(Job.status == JOB_RUNNING, Job.claimed_by.in_(workers)))
+            .values(status=JOB_FAILED, error="Interrupted by shutdown", finished_at=func.now())
+        ).rowcount
+        self.db.commit()
+        return failed
+
+    def get_running_workers(self) -> List[str]:
+        """
+        Distinct "host:pid" values of processes holding running jobs
+
+        Returns:
+            List of worker identifiers
+        """
+        return self.db.scalars(
+            select(Job.claimed_by).where(Job.status == JOB_RUNNING).distinct()
+        ).all()
+
+    def get_queued_job_ids(self) -> List[int]:
+        """
+        IDs of queued jobs, oldest first
+
+        Returns:
+            List of job IDs
+        """
+        return self.db.scalars(
+            select(Job.id).where(Job.status == JOB_QUEUED).order_by(Job.created_at, Job.id)
+        ).all()
+
+    def count_backlog(self) -> int:
+        """
+        Number of queued and running jobs
+
+        Returns:
+            Job count
+        """
+        return self.db.scalar(
+            select(func.count(Job.id)).where(Job.status.in_((JOB_QUEUED, JOB_RUNNING)))
+        )
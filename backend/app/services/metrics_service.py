@@ -2,26 +2,35 @@
 Metrics service layer for dashboard analytics and statistics
 """
 
+from datetime import datetime, timedelta, timezone
 from typing import Dict, Any
 from sqlalchemy.orm import Session
-from sqlalchemy import func, and_
+from sqlalchemy import func, case, lambda_stmt, select
+from app.db.tenancy import DEFAULT_TENANT_ID
 from app.models.task import Task
 from app.schemas.metrics import MetricsResponse, TaskStatsResponse
+from app.services.tenant_counter_service import TenantCounterService
 
 
 class MetricsService:
     """
     Service class for metrics and analytics business logic
+    
+    All metrics are for one tenant. The dashboard totals come from the
+    tenant's counters row; the remaining queries are bounded by the
+    tenant-leading task indexes.
     """
     
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, tenant_id: str = DEFAULT_TENANT_ID):
         """
         Initialize MetricsService with database session
         
         Args:
-            db: SQLAlchemy database session
+            db: SQLAlchemy database session (on the tenant's database)
+            tenant_id: Tenant whose tasks are measured
         """
         self.db = db
+        self.tenant_id = tenant_id
     
     def get_metrics(self) -> MetricsResponse:
         """
@@ -30,17 +39,13 @@ class MetricsService:
         Returns:
             MetricsResponse with all dashboard statistics
         """
-        # Get basic counts
-        total_tasks = self.db.query(Task).filter(Task.is_deleted == False).count()
-        deleted_tasks = self.db.query(Task).filter(Task.is_deleted == True).count()
-        modified_tasks = self.db.query(Task).filter(
-            and_(Task.is_deleted == False, Task.modification_count > 0)
-        ).count()
+        # One primary-key lookup (archived tasks count as deleted)
+        counters = TenantCounterService(self.db).get(self.tenant_id)
         
         return MetricsResponse(
-            total_tasks=total_tasks,
-            modified_tasks=modified_tasks,
-            deleted_tasks=deleted_tasks
+            total_tasks=counters["active_count"],
+            modified_tasks=counters["modified_count"],
+            deleted_tasks=counters["deleted_count"]
         )
     
     def get_task_stats(self) -> TaskStatsResponse:
@@ -50,13 +55,11 @@ class MetricsService:
         Returns:
             TaskStatsResponse with detailed statistics
         """
-        # Get total counts
-        total_created = self.db.query(Task).count()
-        total_deleted = self.db.query(Task).filter(Task.is_deleted == True).count()
-        
-        # Get total modifications across all tasks
-        total_modifications_result = self.db.query(func.sum(Task.modification_count)).scalar()
-        total_modifications = total_modifications_result if total_modifications_result else 0
+        # Totals from the tenant's counters, including archived tasks
+        counters = TenantCounterService(self.db).get(self.tenant_id)
+        total_created = counters["created_count"]
+        total_deleted = counters["deleted_count"]
+        total_modifications = counters["modifications"]
         
         # Calculate average modifications per task
         average_modifications = (total_modifications / total_created) if total_created > 0 else 0.0
@@ -78,13 +81,26 @@ class MetricsService:
         Returns:
             Dictionary with completion trends data
         """
-        # This would require additional date filtering logic
-        # For now, return basic structure
+        # Bounded on created_at so a partitioned table only scans the
+        # partitions inside the period
+        cutoff = datetime.now(timezone.utc) - timedelta(days=days)
+        tenant_id = self.tenant_id
+        tasks_created, tasks_deleted, tasks_completed = self.db.execute(lambda_stmt(
+            lambda: select(
+                func.count(Task.id),
+                func.coalesce(func.sum(case((Task.is_deleted == True, 1), else_=0)), 0),
+                func.coalesce(func.sum(case(((Task.is_deleted == False) & (Task.is_completed == True), 1),
+                                            else_=0)), 0)
+            ).where(Task.tenant_id == tenant_id, Task.created_at >= cutoff)
+        )).one()
+        
         return {
             "period_days": days,
-            "tasks_created": 0,  # Would be calculated with date filters
-            "tasks_completed": 0,  # Would be calculated with date filters
-            "completion_rate": 0.0  # Would be calculated
+            "tasks_created": tasks_created,
+            "tasks_deleted": tasks_deleted,
+            # Tasks created in the period that are done now (completion time isn't tracked)
+            "tasks_completed": tasks_completed,
+            "completion_rate": round(tasks_completed / tasks_created, 4) if tasks_created else 0.0
         }
     
     def get_most_modified_tasks(self, limit: int = 10) -> Dict[str, Any]:
@@ -97,12 +113,13 @@ class MetricsService:
         Returns:
             Dictionary with most modified tasks data
         """
-        most_modified = self.db.query(Task).filter(
-            and_(
-                Task.is_deleted == False,
-                Task.modification_count > 0
-            )
-        ).order_by(Task.modification_count.desc()).limit(limit).all()
+        tenant_id = self.tenant_id
+        most_modified = self.db.execute(lambda_stmt(
+            lambda: select(Task.id, Task.title, Task.modification_count, Task.is_completed)
+            .where(Task.tenant_id == tenant_id, Task.is_deleted == False, Task.modification_count > 0)
+            .order_by(Task.modification_count.desc())
+            .limit(limit)
+        )).all()
         
         return {
             "tasks": [
@@ -124,10 +141,15 @@ class MetricsService:
         Returns:
             Dictionary with productivity metrics
         """
-        # Get tasks created today (would need date filtering in real implementation)
-        # For now, return basic structure
+        # Only today's partition is touched on a partitioned table
+        today = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+        tenant_id = self.tenant_id
+        tasks_created_today = self.db.scalar(lambda_stmt(
+            lambda: select(func.count(Task.id)).where(Task.tenant_id == tenant_id, Task.created_at >= today)
+        ))
+        
         return {
-            "tasks_created_today": 0,
+            "tasks_created_today": tasks_created_today,
             "tasks_completed_today": 0,
             "average_task_lifetime": 0.0,  # Average time from creation to completion
             "most_active_hour": "14:00"  # Hour with most task activity
@@ -0,0 +1,154 @@
+"""
+Request coalescing: concurrent identical reads share one database query
+"""
+
+import json
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import Response
+from pydantic import BaseModel
+
+from app.db.instrumentation import current_request_stats
+from app.services.invalidation_bus import invalidation_bus
+
+# Coalesce identical concurrent reads (false runs every read on its own)
+SINGLE_FLIGHT_ENABLED = os.getenv("SINGLE_FLIGHT_ENABLED", "true").lower() in ("1", "true", "yes")
+
+
+class _Flight:
+    """A call in progress and, once done, its outcome"""
+
+    __slots__ = ("done", "value", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Deduplicates concurrent calls with the same key
+
+    The first caller for a key (the leader) runs the function; callers that
+    arrive while it is running wait and receive the same result or
+    exception. Nothing is kept once the call finishes, so this never serves
+    data older than a read that was already in flight.
+
+    Writes call ``forget`` (through the invalidation bus), which detaches
+    the running flights: a read that starts after a committed write always
+    runs its own query instead of joining one that began before the write.
+    """
+
+    def __init__(self, enabled: bool = SINGLE_FLIGHT_ENABLED):
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._flights: Dict[Hashable, _Flight] = {}
+        self.leaders = 0
+        self.followers = 0
+
+    def do(self, key: Hashable, func: Callable[[], Any]) -> Any:
+        """
+        Run ``func`` unless an identical call is already running
+
+        Args:
+            key: Identifies identical calls (must include every argument)
+            func: Zero-argument callable producing the result
+
+        Returns:
+            The result of ``func`` (shared between coalesced callers)
+        """
+        if not self.enabled:
+            return func()
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+                self.leaders += 1
+            else:
+                self.followers += 1
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+
+        try:
+            flight.value = func()
+        except BaseException as exc:
+            flight.error = exc
+            raise
+        finally:
+            with self._lock:
+                if self._flights.get(key) is flight:
+                    del self._flights[key]
+            flight.done.set()
+        return flight.value
+
+    def json_response(self, key: Hashable, func: Callable[[], Any]) -> Response:
+        """
+        Coalesce a read and share its serialized JSON body
+
+        The leader renders the result once; every coalesced request sends
+        the same bytes.
+
+        Args:
+            key: Identifies identical calls
+            func: Returns a Pydantic model or JSON-compatible data
+
+        Returns:
+            JSON response with the shared body
+        """
+        body = self.do(key, lambda: _render_json(func()))
+        return Response(content=body, media_type="application/json")
+
+    def forget(self, keys=None) -> None:
+        """
+        Detach all running flights so later callers start fresh queries
+
+        Args:
+            keys: Ignored; any task write affects lists and aggregates
+        """
+        with self._lock:
+            self._flights.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get coalescing statistics
+
+        Returns:
+            Dictionary with in-flight, leader and follower counts
+        """
+        with self._lock:
+            calls = self.leaders + self.followers
+            return {
+                "in_flight": len(self._flights),
+                "leaders": self.leaders,
+                "followers": self.followers,
+                "coalesced_rate": round(self.followers / calls, 4) if calls else 0.0
+            }
+
+
+def _render_json(value: Any) -> bytes:
+    started = time.perf_counter()
+    if isinstance(value, BaseModel):
+        body = value.model_dump_json().encode()
+    else:
+        body = json.dumps(
+            jsonable_encoder(value), ensure_ascii=False, allow_nan=False, separators=(",", ":")
+        ).encode()
+    stats = current_request_stats.get()
+    if stats is not None:
+        stats.serialization_time += time.perf_counter() - started
+    return body
+
+
+# Shared instance for task and metrics reads; task writes detach its flights
+read_flights = SingleFlight()
+invalidation_bus.subscribe("tasks", read_flights.forget)
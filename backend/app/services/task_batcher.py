@@ -0,0 +1,184 @@
+"""
+Group-commit batching for task creation
+"""
+
+import logging
+import os
+import queue
+import threading
+import time
+from collections import Counter
+from concurrent.futures import Future
+from typing import Callable, List, Optional, Tuple
+
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session
+
+from app.db.database import SessionLocal
+from app.db.tenancy import DEFAULT_TENANT_ID
+from app.models.task import Task, set_new_descriptions
+from app.schemas.task import TaskCreate
+from app.services.task_cache import task_cache
+from app.services.tenant_counter_service import TenantCounterService
+
+logger = logging.getLogger(__name__)
+
+# Opt-in switch and tuning knobs for group commit
+TASK_CREATE_BATCHING = os.getenv("TASK_CREATE_BATCHING", "false").lower() in ("1", "true", "yes")
+TASK_CREATE_BATCH_SIZE = int(os.getenv("TASK_CREATE_BATCH_SIZE", "100"))
+TASK_CREATE_BATCH_MAX_LATENCY_MS = float(os.getenv("TASK_CREATE_BATCH_MAX_LATENCY_MS", "5"))
+
+_PendingCreate = Tuple[TaskCreate, str, Future]
+
+
+class TaskCreateBatcher:
+    """
+    Coalesces concurrent task creations into one INSERT and one transaction
+
+    Callers block on ``create`` while a single dispatcher thread collects
+    requests for up to ``max_latency_ms`` (or until ``batch_size`` requests
+    are waiting) and writes them together. Each caller still receives its own
+    Task with the generated ID and timestamps. If a batch fails, its rows are
+    retried one by one so an invalid row only fails its own caller.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        batch_size: int = TASK_CREATE_BATCH_SIZE,
+        max_latency_ms: float = TASK_CREATE_BATCH_MAX_LATENCY_MS,
+        enabled: bool = TASK_CREATE_BATCHING
+    ):
+        """
+        Initialize TaskCreateBatcher
+
+        Args:
+            session_factory: Callable returning a new database session
+            batch_size: Maximum number of tasks written per transaction
+            max_latency_ms: Maximum time a request waits for a batch to fill
+            enabled: Whether TaskService should route creates through the batcher
+        """
+        self.session_factory = session_factory
+        self.batch_size = max(1, batch_size)
+        self.max_latency = max(0.0, max_latency_ms) / 1000.0
+        self.enabled = enabled
+        self._queue: "queue.Queue[Optional[_PendingCreate]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def create(self, task_data: TaskCreate, tenant_id: str = DEFAULT_TENANT_ID) -> Task:
+        """
+        Create a task as part of the next batch and wait for the commit
+
+        Args:
+            task_data: TaskCreate schema with task information
+            tenant_id: Tenant owning the task
+
+        Returns:
+            Created (detached) Task object
+        """
+        return self.submit(task_data, tenant_id).result()
+
+    def submit(self, task_data: TaskCreate, tenant_id: str = DEFAULT_TENANT_ID) -> Future:
+        """
+        Queue a task for creation
+
+        Args:
+            task_data: TaskCreate schema with task information
+            tenant_id: Tenant owning the task
+
+        Returns:
+            Future resolving to the created Task
+        """
+        self._ensure_started()
+        future: Future = Future()
+        self._queue.put((task_data, tenant_id, future))
+        return future
+
+    def close(self) -> None:
+        """Flush pending creations and stop the dispatcher thread"""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._queue.put(None)
+            thread.join()
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="task-create-batcher", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            if item is None:
+                break
+            batch: List[_PendingCreate] = [item]
+            deadline = time.monotonic() + self.max_latency
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                try:
+                    item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+            self._flush(batch)
+
+    def _flush(self, batch: List[_PendingCreate]) -> None:
+        try:
+            tasks = self._insert([(task_data, tenant_id) for task_data, tenant_id, _ in batch])
+        except Exception:
+            logger.exception("Batched insert of %d task(s) failed, retrying individually", len(batch))
+            for task_data, tenant_id, future in batch:
+                try:
+                    future.set_result(self._insert([(task_data, tenant_id)])[0])
+                except Exception as exc:
+                    future.set_exception(exc)
+            return
+        for (_, _, future), task in zip(batch, tasks):
+            future.set_result(task)
+
+    def _insert(self, items: List[Tuple[TaskCreate, str]]) -> List[Task]:
+        """
+        Insert tasks in a single transaction and return them in input order
+        """
+        rows = [{"tenant_id": tenant_id, "title": item.title} for item, tenant_id in items]
+        db = self.session_factory()
+        try:
+            if db.get_bind().dialect.insert_executemany_returning_sort_by_parameter_order:
+                # One multi-row INSERT ... RETURNING, rows matched to their
+                # inputs by parameter order (not by comparing values)
+                tasks = list(db.scalars(insert(Task).returning(Task, sort_by_parameter_order=True), rows))
+            else:
+                # No RETURNING (MySQL): insert row by row inside the same
+                # transaction, then load all generated columns in one SELECT
+                ids = [db.execute(insert(Task).values(**row)).inserted_primary_key[0] for row in rows]
+                loaded = {task.id: task for task in db.scalars(select(Task).where(Task.id.in_(ids)))}
+                tasks = [loaded[task_id] for task_id in ids]
+            # Description rows are inserted by the commit's flush
+            set_new_descriptions(tasks, [item.description for item, _ in items])
+            counters = TenantCounterService(db)
+            for tenant_id, created in Counter(row["tenant_id"] for row in rows).items():
+                counters.add(tenant_id, created_count=created, active_count=created)
+            db.commit()
+            task_cache.invalidate()
+            db.expunge_all()
+            return tasks
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+
+# Shared instance used by TaskService
+task_create_batcher = TaskCreateBatcher(SessionLocal)
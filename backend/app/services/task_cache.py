@@ -0,0 +1,191 @@
+"""
+Process-level read-through cache for single task lookups
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+from app.schemas.task import TaskResponse
+from app.services.invalidation_bus import invalidation_bus
+
+# Maximum number of tasks kept in the cache (0 disables caching)
+TASK_CACHE_SIZE = int(os.getenv("TASK_CACHE_SIZE", "1024"))
+
+
+class TaskCache:
+    """
+    Thread-safe LRU cache of serialized tasks keyed by task ID
+
+    Readers take a token before querying the database and hand it back to
+    ``put``; a put is dropped when the key was invalidated after the token
+    was issued, so a slow reader can never re-insert data that a concurrent
+    write replaced.
+
+    Keys carry no version (modification_count/updated_at): a reader would
+    have to query the row to learn its current version, which is the read
+    the cache exists to skip. Every write invalidates the key instead, and
+    the token closes the race a version would otherwise guard against.
+    """
+
+    def __init__(self, max_size: int = TASK_CACHE_SIZE):
+        """
+        Initialize TaskCache
+
+        Args:
+            max_size: Maximum number of cached tasks
+        """
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, TaskResponse]" = OrderedDict()
+        # Generation at which each key was last invalidated (bounded)
+        self._invalidated: "OrderedDict[Hashable, int]" = OrderedDict()
+        self._invalidated_floor = 0
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self._bus = None
+        self._channel = None
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the cache stores anything at all"""
+        return self.max_size > 0
+
+    def attach(self, bus, channel: str) -> None:
+        """
+        Share invalidations with other caches through a bus
+
+        Args:
+            bus: LocalBus or DatabaseBus
+            channel: Channel name shared by the caches of every worker
+        """
+        self._bus = bus
+        self._channel = channel
+        bus.subscribe(channel, self._on_published)
+
+    def token(self) -> int:
+        """
+        Get a read token to pass to ``put`` after loading from the database
+
+        Returns:
+            Current invalidation generation
+        """
+        with self._lock:
+            return self._generation
+
+    def get(self, key: Hashable) -> Optional[TaskResponse]:
+        """
+        Look up a cached task
+
+        Args:
+            key: Cache key (task ID)
+
+        Returns:
+            Cached TaskResponse if present, None otherwise
+        """
+        if not self.enabled:
+            return None
+        bus_current = self._bus is None or self._bus.is_current()
+        with self._lock:
+            entry = self._entries.get(key) if bus_current else None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key: Hashable, value: TaskResponse, token: int) -> bool:
+        """
+        Store a task loaded from the database
+
+        Args:
+            key: Cache key (task ID)
+            value: Serialized task
+            token: Token obtained before the database read
+
+        Returns:
+            True if the value was stored, False if it was stale
+        """
+        if not self.enabled:
+            return False
+        with self._lock:
+            invalidated_at = self._invalidated.get(key, self._invalidated_floor)
+            if token < invalidated_at:
+                return False
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+            return True
+
+    def invalidate(self, *keys: Hashable) -> None:
+        """
+        Drop cached tasks after a write
+
+        Args:
+            keys: Cache keys (task IDs) that were modified; none for writes
+                that change no cached task (creates, archival), which still
+                notify the other subscribers
+        """
+        if self.enabled:
+            self._invalidate_local(keys)
+        # Published even when caching is off: other subscribers (request
+        # coalescing) rely on write notifications too
+        if self._bus is not None:
+            self._bus.publish(self._channel, keys, source=self._on_published)
+
+    def clear(self) -> None:
+        """Drop every cached task"""
+        self._clear_local()
+        if self._bus is not None:
+            self._bus.publish(self._channel, None, source=self._on_published)
+
+    def _invalidate_local(self, keys) -> None:
+        with self._lock:
+            self._generation += 1
+            for key in keys:
+                self._entries.pop(key, None)
+                self._invalidated[key] = self._generation
+                self._invalidated.move_to_end(key)
+            while len(self._invalidated) > self.max_size:
+                _, generation = self._invalidated.popitem(last=False)
+                self._invalidated_floor = max(self._invalidated_floor, generation)
+
+    def _clear_local(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            self._invalidated.clear()
+            self._invalidated_floor = self._generation
+
+    def _on_published(self, keys) -> None:
+        # Invalidation published by another cache on the same channel
+        if keys is None:
+            self._clear_local()
+        elif self.enabled:
+            self._invalidate_local(keys)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics
+
+        Returns:
+            Dictionary with size, hits, misses and hit rate
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0
+            }
+
+
+# Shared instance used by TaskService
+task_cache = TaskCache()
+task_cache.attach(invalidation_bus, "tasks")
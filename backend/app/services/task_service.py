@@ -2,41 +2,253 @@
 Task service layer containing all business logic for task operations
 """
 
-from typing import List, Optional, Tuple
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, func
+import logging
+import os
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable, Iterator, List, Optional, Tuple
+from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import and_, or_, func, insert, lambda_stmt, select, update
+from app.db.database import get_read_engine
+from app.db.tenancy import DEFAULT_TENANT_ID, get_tenant_engine
+from app.db.sqlite import SEARCH_INDEX_MIN_LENGTH, search_index_available, title_match
 from app.models.task import Task
-from app.schemas.task import TaskCreate, TaskUpdate, TaskSearchRequest
+from app.models.task_description import TaskDescription, description_row
+from app.schemas.task import (
+    TaskCreate, TaskUpdate, TaskResponse, TaskListResponse, TaskSearchRequest, TaskFilter,
+    TaskHistoryResponse, TaskRevisionResponse
+)
+from app.services.task_cache import task_cache
+from app.services.task_batcher import task_create_batcher
+from app.services.single_flight import read_flights
+from app.services.archive_service import ArchiveService
+from app.services.tenant_counter_service import TenantCounterService
+from app.services.history_service import TASK_HISTORY_ENABLED, TRACKED_FIELDS, TaskHistoryService, TaskVersion
+
+# Number of task IDs handled per transaction by bulk operations
+BULK_CHUNK_SIZE = int(os.getenv("BULK_CHUNK_SIZE", "1000"))
+# Number of IDs per IN (...) query of a batch lookup
+BATCH_GET_CHUNK_SIZE = int(os.getenv("BATCH_GET_CHUNK_SIZE", "500"))
+
+# What plan_search does with searches its indexes can't fully serve:
+# "warn" logs them, "reject" refuses them, "off" runs them silently
+TASK_QUERY_POLICY = os.getenv("TASK_QUERY_POLICY", "warn").lower()
+
+# Called with (processed IDs, affected rows) after each bulk chunk
+ProgressCallback = Callable[[int, int], None]
+
+logger = logging.getLogger(__name__)
+
+# Range-filterable and sortable columns, keyed by TaskFilter / sort_by name
+RANGE_COLUMNS = {
+    "created_at": Task.created_at,
+    "updated_at": Task.updated_at,
+    "modification_count": Task.modification_count,
+}
+
+# Index serving (tenant_id, is_deleted[, is_completed]) equality plus a
+# range and order on one column, keyed by (is_completed filtered, column)
+SEARCH_INDEXES = {
+    (False, "created_at"): "ix_tasks_tenant_deleted_created",
+    (False, "updated_at"): "ix_tasks_tenant_deleted_updated",
+    (False, "modification_count"): "ix_tasks_tenant_deleted_modifications",
+    (True, "created_at"): "ix_tasks_tenant_deleted_completed_created",
+    (True, "updated_at"): "ix_tasks_tenant_deleted_completed_updated",
+    (True, "modification_count"): "ix_tasks_tenant_deleted_completed_modifications",
+}
+
+
+class UnindexedSearchError(ValueError):
+    """Search that no index fully serves, refused under TASK_QUERY_POLICY=reject"""
+
+
+@dataclass
+class SearchPlan:
+    """
+    How a task search is executed
+    
+    Attributes:
+        sort_by: Column the results are ordered by (ties broken by ID)
+        descending: Sort direction
+        index: Index providing the equality prefix, the range and the order
+        residual: Filters the index can't apply, checked row by row over the
+            whole index range (a scan of the tenant's tasks when non-empty)
+    """
+    sort_by: str
+    descending: bool
+    index: str
+    residual: List[str] = field(default_factory=list)
+
+
+def _chunks(items: List[int], size: int) -> Iterator[List[int]]:
+    """Split a list into consecutive chunks of at most ``size`` items"""
+    for start in range(0, len(items), max(1, size)):
+        yield items[start:start + size]
+
+
+def _revision_response(version: TaskVersion) -> TaskRevisionResponse:
+    """Serialize a reconstructed task version"""
+    return TaskRevisionResponse(
+        revision=version.revision,
+        changed_fields=version.changed_fields,
+        recorded_at=version.recorded_at,
+        **version.state
+    )
 
 
 class TaskService:
     """
     Service class for task-related business logic
+    
+    Every query is scoped to one tenant, and every write keeps that
+    tenant's counters (TenantCounterService) in step in the same transaction.
     """
     
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, tenant_id: str = DEFAULT_TENANT_ID):
         """
         Initialize TaskService with database session
         
         Args:
-            db: SQLAlchemy database session
+            db: SQLAlchemy database session (on the tenant's database)
+            tenant_id: Tenant whose tasks are read and written
         """
         self.db = db
+        self.tenant_id = tenant_id
+        self.counters = TenantCounterService(db)
+        # Record a TaskRevision per update (see history_service)
+        self.record_history = TASK_HISTORY_ENABLED
+    
+    def _tasks(self, *entities):
+        """Query the tenant's tasks (the Task entity unless columns are given)"""
+        return self.db.query(*(entities or (Task,))).filter(Task.tenant_id == self.tenant_id)
+    
+    def _cache_key(self, task_id: int) -> Tuple[str, int]:
+        """Task cache key; IDs are only unique per tenant database"""
+        return (self.tenant_id, task_id)
+    
+    @staticmethod
+    def _created_between(query, created_after: Optional[datetime], created_before: Optional[datetime]):
+        """
+        Restrict a task query to a created_at range
+        
+        On a partitioned tasks table this lets the database prune every
+        monthly partition outside the range.
+        """
+        if created_after is not None:
+            query = query.filter(Task.created_at >= created_after)
+        if created_before is not None:
+            query = query.filter(Task.created_at < created_before)
+        return query
+    
+    def _title_search_indexed(self, title: str) -> bool:
+        """Whether a title substring search can use the FTS5 index (SQLite mode)"""
+        engine = get_tenant_engine(self.tenant_id) or get_read_engine()
+        return len(title) >= SEARCH_INDEX_MIN_LENGTH and search_index_available(engine)
+    
+    def _apply_filter(self, query, filters: TaskFilter):
+        """
+        Apply TaskFilter criteria (title substring, completion, time and
+        modification ranges) to a query
+        """
+        if filters.title:
+            if self._title_search_indexed(filters.title):
+                # FTS5 trigram index (SQLite mode) instead of a full LIKE scan
+                query = query.filter(Task.id.in_(title_match(filters.title)))
+            else:
+                query = query.filter(Task.title.ilike(f"%{filters.title}%"))
+        if filters.is_completed is not None:
+            query = query.filter(Task.is_completed == filters.is_completed)
+        if filters.updated_after is not None:
+            query = query.filter(Task.updated_at >= filters.updated_after)
+        if filters.updated_before is not None:
+            query = query.filter(Task.updated_at < filters.updated_before)
+        if filters.min_modifications is not None:
+            query = query.filter(Task.modification_count >= filters.min_modifications)
+        if filters.max_modifications is not None:
+            query = query.filter(Task.modification_count <= filters.max_modifications)
+        return self._created_between(query, filters.created_after, filters.created_before)
+    
+    @staticmethod
+    def _ranged_columns(filters: TaskFilter) -> List[str]:
+        """RANGE_COLUMNS names the filter restricts to a range"""
+        bounds = {
+            "created_at": (filters.created_after, filters.created_before),
+            "updated_at": (filters.updated_after, filters.updated_before),
+            "modification_count": (filters.min_modifications, filters.max_modifications),
+        }
+        return [name for name, (low, high) in bounds.items() if low is not None or high is not None]
+    
+    def plan_search(self, search_params: TaskSearchRequest) -> SearchPlan:
+        """
+        Pick the index and order for a search and check it avoids a scan
+        
+        Active tasks of the tenant are found through an index on
+        (tenant_id, is_deleted[, is_completed], column), which applies one
+        range and returns rows in that column's order. The sort column
+        defaults to the range-filtered column. A range on any other column,
+        or a title substring without the FTS5 index, is a residual filter
+        that makes the database read the tenant's whole index range.
+        
+        Args:
+            search_params: TaskSearchRequest with filters and sort
+            
+        Returns:
+            SearchPlan for the search
+            
+        Raises:
+            UnindexedSearchError: The search needs a residual scan and
+                TASK_QUERY_POLICY is "reject"
+        """
+        ranged = self._ranged_columns(search_params)
+        sort_by = search_params.sort_by or (ranged[0] if ranged else "created_at")
+        plan = SearchPlan(
+            sort_by=sort_by,
+            descending=search_params.sort_order == "desc",
+            index=SEARCH_INDEXES[(search_params.is_completed is not None, sort_by)]
+        )
+        plan.residual = [f"{name} range" for name in ranged if name != sort_by]
+        if search_params.title and not self._title_search_indexed(search_params.title):
+            plan.residual.append("title substring")
+        
+        if plan.residual and TASK_QUERY_POLICY != "off":
+            message = (
+                f"Search sorted by {sort_by} can only use {plan.index}; "
+                f"{', '.join(plan.residual)} would scan tenant {self.tenant_id}'s tasks"
+            )
+            if TASK_QUERY_POLICY == "reject":
+                raise UnindexedSearchError(message)
+            logger.warning(message)
+        return plan
     
-    def get_all_tasks(self, skip: int = 0, limit: int = 100) -> List[Task]:
+    def get_all_tasks(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None
+    ) -> List[Task]:
         """
         Retrieve all non-deleted tasks with pagination
         
         Args:
             skip: Number of records to skip for pagination
             limit: Maximum number of records to return
+            created_after: Only tasks created at or after this time (optional)
+            created_before: Only tasks created before this time (optional)
             
         Returns:
             List of Task objects that are not deleted
         """
-        return self.db.query(Task).filter(
-            Task.is_deleted == False
-        ).offset(skip).limit(limit).all()
+        # Cached lambda statement: the SQL is built and compiled once per
+        # combination of date filters, later calls only bind the values
+        tenant_id = self.tenant_id
+        stmt = lambda_stmt(lambda: select(Task).where(Task.tenant_id == tenant_id, Task.is_deleted == False))
+        if created_after is not None:
+            stmt += lambda s: s.where(Task.created_at >= created_after)
+        if created_before is not None:
+            stmt += lambda s: s.where(Task.created_at < created_before)
+        stmt += lambda s: s.options(joinedload(Task.description_row)).offset(skip).limit(limit)
+        return list(self.db.scalars(stmt))
     
     def get_task_by_id(self, task_id: int) -> Optional[Task]:
         """
@@ -46,9 +258,14 @@ class TaskService:
             task_id: The ID of the task to retrieve
             
         Returns:
-            Task object if found, None otherwise
+            Task object if found and owned by the tenant, None otherwise
         """
-        return self.db.query(Task).filter(Task.id == task_id).first()
+        # Session.get() answers from the identity map when the task was
+        # already loaded during this request
+        db_task = self.db.get(Task, task_id)
+        if db_task is None or db_task.tenant_id != self.tenant_id:
+            return None
+        return db_task
     
     def get_active_task_by_id(self, task_id: int) -> Optional[Task]:
         """
@@ -60,9 +277,127 @@ class TaskService:
         Returns:
             Active Task object if found, None otherwise
         """
-        return self.db.query(Task).filter(
-            and_(Task.id == task_id, Task.is_deleted == False)
-        ).first()
+        db_task = self.get_task_by_id(task_id)
+        if db_task is None or db_task.is_deleted:
+            return None
+        return db_task
+    
+    def get_active_task_response(self, task_id: int) -> Optional[TaskResponse]:
+        """
+        Retrieve a serialized active task, reading through the task cache
+        
+        Args:
+            task_id: The ID of the task to retrieve
+            
+        Returns:
+            TaskResponse if found, None otherwise
+        """
+        cached = task_cache.get(self._cache_key(task_id))
+        if cached is not None:
+            return cached
+        # Concurrent misses for the same task share one query
+        return read_flights.do(("task", self.tenant_id, task_id), lambda: self._load_task_response(task_id))
+    
+    def _load_task_response(self, task_id: int) -> Optional[TaskResponse]:
+        token = task_cache.token()
+        db_task = self.get_active_task_by_id(task_id)
+        if not db_task:
+            return None
+        
+        response = TaskResponse.model_validate(db_task)
+        task_cache.put(self._cache_key(task_id), response, token)
+        return response
+    
+    def get_active_task_responses(
+        self,
+        task_ids: List[int],
+        chunk_size: int = BATCH_GET_CHUNK_SIZE
+    ) -> List[Optional[TaskResponse]]:
+        """
+        Retrieve many serialized active tasks, reading through the task cache
+        
+        Cached tasks are answered from memory; the rest are loaded with one
+        ``IN (...)`` query per ``chunk_size`` IDs and added to the cache.
+        
+        Args:
+            task_ids: IDs to fetch (duplicates allowed)
+            chunk_size: Number of IDs per query
+            
+        Returns:
+            One entry per requested ID, in request order; None where the
+            task doesn't exist, is deleted or belongs to another tenant
+        """
+        found = {}
+        missed = []
+        for task_id in dict.fromkeys(task_ids):
+            cached = task_cache.get(self._cache_key(task_id))
+            if cached is not None:
+                found[task_id] = cached
+            else:
+                missed.append(task_id)
+        
+        token = task_cache.token()
+        tenant_id = self.tenant_id
+        for chunk in _chunks(missed, chunk_size):
+            # The ID list is an expanding parameter of one cached statement
+            stmt = lambda_stmt(
+                lambda: select(Task)
+                .where(Task.tenant_id == tenant_id, Task.id.in_(chunk), Task.is_deleted == False)
+                .options(joinedload(Task.description_row))
+            )
+            for db_task in self.db.scalars(stmt):
+                response = TaskResponse.model_validate(db_task)
+                task_cache.put(self._cache_key(db_task.id), response, token)
+                found[db_task.id] = response
+        return [found.get(task_id) for task_id in task_ids]
+    
+    def list_tasks_page(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None
+    ) -> TaskListResponse:
+        """
+        Build one page of active tasks with the total count
+        
+        Args:
+            skip: Number of records to skip for pagination
+            limit: Maximum number of records to return
+            created_after: Only tasks created at or after this time (optional)
+            created_before: Only tasks created before this time (optional)
+            
+        Returns:
+            TaskListResponse for the page
+        """
+        tasks = self.get_all_tasks(
+            skip=skip, limit=limit, created_after=created_after, created_before=created_before
+        )
+        total = self.get_tasks_count(created_after=created_after, created_before=created_before)
+        return TaskListResponse(
+            tasks=tasks,
+            total=total,
+            page=(skip // limit) + 1,
+            size=limit
+        )
+    
+    def search_tasks_page(self, search_params: TaskSearchRequest) -> TaskListResponse:
+        """
+        Build one page of search results with the total count
+        
+        Args:
+            search_params: TaskSearchRequest with search criteria
+            
+        Returns:
+            TaskListResponse for the requested page
+        """
+        tasks, total = self.search_tasks(search_params)
+        return TaskListResponse(
+            tasks=tasks,
+            total=total,
+            page=search_params.page,
+            size=search_params.size
+        )
     
     def create_task(self, task_data: TaskCreate) -> Task:
         """
@@ -74,13 +409,21 @@ class TaskService:
         Returns:
             Created Task object
         """
+        if task_create_batcher.enabled and get_tenant_engine(self.tenant_id) is None:
+            # Group commit: the row is written together with concurrent creates
+            # (the batcher writes to the main database only)
+            return task_create_batcher.create(task_data, self.tenant_id)
+        
         db_task = Task(
+            tenant_id=self.tenant_id,
             title=task_data.title,
             description=task_data.description
         )
         self.db.add(db_task)
+        self.counters.add(self.tenant_id, created_count=1, active_count=1)
         self.db.commit()
-        self.db.refresh(db_task)
+        # No cached task changed: this only tells request coalescing in every worker
+        task_cache.invalidate()
         return db_task
     
     def update_task(self, task_id: int, task_data: TaskUpdate) -> Optional[Task]:
@@ -94,9 +437,11 @@ class TaskService:
         Returns:
             Updated Task object if found, None otherwise
         """
-        db_task = self.get_active_task_by_id(task_id)
-        if not db_task:
+        # Lock the row: concurrent edits must not produce the same revision
+        db_task = self.db.get(Task, task_id, with_for_update=True)
+        if db_task is None or db_task.tenant_id != self.tenant_id or db_task.is_deleted:
             return None
+        previous = {field: getattr(db_task, field) for field in TRACKED_FIELDS}
         
         # Update fields if provided
         update_data = task_data.model_dump(exclude_unset=True)
@@ -104,12 +449,67 @@ class TaskService:
             setattr(db_task, field, value)
         
         # Increment modification count
+        self.counters.add(
+            self.tenant_id, modifications=1, modified_count=1 if db_task.modification_count == 0 else 0
+        )
         db_task.modification_count += 1
+        if self.record_history:
+            TaskHistoryService(self.db).record_update(db_task, previous)
         
         self.db.commit()
-        self.db.refresh(db_task)
+        task_cache.invalidate(self._cache_key(task_id))
         return db_task
     
+    def get_task_history(
+        self,
+        task_id: int,
+        limit: int = 20,
+        before: Optional[int] = None
+    ) -> Optional[TaskHistoryResponse]:
+        """
+        Retrieve a page of an active task's past versions, newest first
+        
+        Args:
+            task_id: The ID of the task
+            limit: Maximum number of versions to return
+            before: Only versions older than this one (from the previous page's next_before)
+            
+        Returns:
+            TaskHistoryResponse if the task was found, None otherwise
+        """
+        db_task = self.get_active_task_by_id(task_id)
+        if not db_task:
+            return None
+        
+        current = db_task.modification_count
+        newest = current if before is None else min(before - 1, current)
+        oldest = max(newest - limit + 1, 0)
+        versions = TaskHistoryService(self.db).get_versions(db_task, newest, oldest)
+        last = versions[-1].revision if versions else 0
+        return TaskHistoryResponse(
+            task_id=task_id,
+            current_revision=current,
+            revisions=[_revision_response(version) for version in versions],
+            next_before=last if last > 0 and last == oldest else None
+        )
+    
+    def get_task_revision(self, task_id: int, revision: int) -> Optional[TaskRevisionResponse]:
+        """
+        Retrieve one past version of an active task
+        
+        Args:
+            task_id: The ID of the task
+            revision: Version number (0 is the task as created)
+            
+        Returns:
+            TaskRevisionResponse if the task and that version were found, None otherwise
+        """
+        db_task = self.get_active_task_by_id(task_id)
+        if not db_task:
+            return None
+        version = TaskHistoryService(self.db).get_version(db_task, revision)
+        return _revision_response(version) if version is not None else None
+    
     def delete_task(self, task_id: int) -> bool:
         """
         Soft delete a task (set is_deleted to True)
@@ -120,36 +520,242 @@ class TaskService:
         Returns:
             True if task was deleted, False if not found
         """
-        db_task = self.get_active_task_by_id(task_id)
-        if not db_task:
-            return False
-        
-        db_task.is_deleted = True
+        # Guarded UPDATE: of two concurrent deletes only one changes the
+        # row, so the counters move once
+        deleted = self._set_deleted([task_id], True)
         self.db.commit()
+        if not deleted:
+            return False
+        loaded = self.db.identity_map.get(self.db.identity_key(Task, task_id))
+        if loaded is not None:
+            self.db.expire(loaded)
+        task_cache.invalidate(self._cache_key(task_id))
         return True
     
-    def bulk_delete_tasks(self, task_ids: List[int]) -> int:
+    def bulk_delete_tasks(
+        self,
+        task_ids: List[int],
+        chunk_size: int = BULK_CHUNK_SIZE,
+        progress: Optional[ProgressCallback] = None
+    ) -> int:
         """
         Soft delete multiple tasks
         
+        IDs are processed in chunks of ``chunk_size``, each in its own short
+        transaction, so large ID lists never build one huge IN clause or hold
+        row locks for the whole operation.
+        
         Args:
             task_ids: List of task IDs to delete
+            chunk_size: Number of IDs per transaction
+            progress: Callback receiving (processed IDs, deleted so far) after each chunk
+            
+        Returns:
+            Number of tasks successfully deleted
+        """
+        deleted_count = 0
+        processed = 0
+        for chunk in _chunks(list(dict.fromkeys(task_ids)), chunk_size):
+            deleted_count += self._soft_delete_ids(chunk)
+            processed += len(chunk)
+            if progress:
+                progress(processed, deleted_count)
+        return deleted_count
+    
+    def bulk_delete_matching(
+        self,
+        filters: TaskFilter,
+        chunk_size: int = BULK_CHUNK_SIZE,
+        progress: Optional[ProgressCallback] = None
+    ) -> int:
+        """
+        Soft delete every active task matching a filter
+        
+        Matching IDs are read in primary-key order one chunk at a time
+        (keyset pagination) and deleted chunk by chunk.
+        
+        Args:
+            filters: TaskFilter with the search criteria
+            chunk_size: Number of tasks per transaction
+            progress: Callback receiving (processed IDs, deleted so far) after each chunk
             
         Returns:
             Number of tasks successfully deleted
         """
-        deleted_count = self.db.query(Task).filter(
-            and_(
-                Task.id.in_(task_ids),
-                Task.is_deleted == False
+        deleted_count = 0
+        processed = 0
+        last_id = 0
+        while True:
+            query = self._apply_filter(
+                self._tasks(Task.id).filter(and_(Task.is_deleted == False, Task.id > last_id)), filters
             )
-        ).update(
-            {Task.is_deleted: True},
-            synchronize_session=False
-        )
+            chunk = [task_id for task_id, in query.order_by(Task.id).limit(chunk_size)]
+            if not chunk:
+                break
+            last_id = chunk[-1]
+            deleted_count += self._soft_delete_ids(chunk)
+            processed += len(chunk)
+            if progress:
+                progress(processed, deleted_count)
+        return deleted_count
+    
+    def bulk_restore_tasks(
+        self,
+        task_ids: List[int],
+        chunk_size: int = BULK_CHUNK_SIZE,
+        progress: Optional[ProgressCallback] = None
+    ) -> int:
+        """
+        Restore multiple soft-deleted (or archived) tasks
+        
+        Args:
+            task_ids: List of task IDs to restore
+            chunk_size: Number of IDs per transaction
+            progress: Callback receiving (processed IDs, restored so far) after each chunk
+            
+        Returns:
+            Number of tasks successfully restored
+        """
+        archive_service = ArchiveService(self.db, self.tenant_id)
+        restored_count = 0
+        processed = 0
+        for chunk in _chunks(list(dict.fromkeys(task_ids)), chunk_size):
+            restored = self._set_deleted(chunk, False)
+            self.db.commit()
+            restored += archive_service.restore_archived_tasks(chunk)
+            task_cache.invalidate(*map(self._cache_key, chunk))
+            restored_count += restored
+            processed += len(chunk)
+            if progress:
+                progress(processed, restored_count)
+        return restored_count
+    
+    def import_tasks(
+        self,
+        tasks: List[TaskCreate],
+        chunk_size: int = BULK_CHUNK_SIZE,
+        progress: Optional[ProgressCallback] = None
+    ) -> int:
+        """
+        Create many tasks with one multi-row INSERT per chunk
+        
+        Tasks with a description get their IDs back from the INSERT (one
+        statement per row where the driver can't return them for a batch)
+        so their task_descriptions rows follow in a second multi-row INSERT.
+        
+        Args:
+            tasks: TaskCreate schemas of the tasks to create
+            chunk_size: Number of tasks per transaction
+            progress: Callback receiving (processed, created so far) after each chunk
+            
+        Returns:
+            Number of tasks created
+        """
+        created_count = 0
+        for start in range(0, len(tasks), max(1, chunk_size)):
+            chunk = tasks[start:start + chunk_size]
+            plain = [task for task in chunk if task.description is None]
+            described = [task for task in chunk if task.description is not None]
+            if plain:
+                self.db.execute(insert(Task), [{"tenant_id": self.tenant_id, "title": task.title} for task in plain])
+            if described:
+                ids = self._insert_returning_ids(
+                    [{"tenant_id": self.tenant_id, "title": task.title} for task in described]
+                )
+                self.db.execute(
+                    insert(TaskDescription),
+                    [description_row(task_id, task.description) for task_id, task in zip(ids, described)]
+                )
+            self.counters.add(self.tenant_id, created_count=len(chunk), active_count=len(chunk))
+            self.db.commit()
+            task_cache.invalidate()
+            created_count += len(chunk)
+            if progress:
+                progress(created_count, created_count)
+        return created_count
+    
+    def _insert_returning_ids(self, rows: List[dict]) -> List[int]:
+        """Insert task rows and return their generated IDs in row order"""
+        if self.db.get_bind().dialect.insert_executemany_returning_sort_by_parameter_order:
+            return list(self.db.scalars(insert(Task).returning(Task.id, sort_by_parameter_order=True), rows))
+        return [self.db.execute(insert(Task).values(**row)).inserted_primary_key[0] for row in rows]
+    
+    def iter_tasks(
+        self,
+        filters: Optional[TaskFilter] = None,
+        include_deleted: bool = False,
+        chunk_size: int = BULK_CHUNK_SIZE
+    ) -> Iterator[List[Task]]:
+        """
+        Iterate over tasks in primary-key ordered chunks (keyset pagination)
+        
+        Args:
+            filters: Only tasks matching this filter (optional)
+            include_deleted: Also yield soft-deleted tasks
+            chunk_size: Number of tasks per chunk
+            
+        Yields:
+            Lists of at most ``chunk_size`` Task objects
+        """
+        last_id = 0
+        while True:
+            query = self._tasks().filter(Task.id > last_id)
+            if not include_deleted:
+                query = query.filter(Task.is_deleted == False)
+            if filters is not None:
+                query = self._apply_filter(query, filters)
+            chunk = query.options(joinedload(Task.description_row)).order_by(Task.id).limit(chunk_size).all()
+            if not chunk:
+                return
+            last_id = chunk[-1].id
+            yield chunk
+            # Keep the identity map from growing with every chunk
+            self.db.expunge_all()
+    
+    def _soft_delete_ids(self, task_ids: List[int]) -> int:
+        """
+        Soft delete one chunk of tasks in its own transaction
+        """
+        deleted_count = self._set_deleted(task_ids, True)
         self.db.commit()
+        task_cache.invalidate(*map(self._cache_key, task_ids))
         return deleted_count
     
+    def _set_deleted(self, task_ids: List[int], deleted: bool) -> int:
+        """
+        Flip is_deleted on the tenant's tasks in ``task_ids`` and update the counters
+        
+        Modified and unmodified tasks are updated separately, so the
+        counters move by the rows each UPDATE actually changed even when a
+        concurrent request flips some of the same tasks.
+        
+        Returns:
+            Number of tasks changed (not committed)
+        """
+        tenant_id = self.tenant_id
+        was_deleted = not deleted
+        changed = {}
+        for modified in (True, False):
+            stmt = lambda_stmt(
+                lambda: update(Task)
+                .where(Task.tenant_id == tenant_id, Task.id.in_(task_ids), Task.is_deleted == was_deleted)
+                .values(is_deleted=deleted)
+                .execution_options(synchronize_session=False)
+            )
+            # Separate lambdas: the SQL differs, so each gets its own cache entry
+            if modified:
+                stmt += lambda s: s.where(Task.modification_count > 0)
+            else:
+                stmt += lambda s: s.where(Task.modification_count == 0)
+            changed[modified] = self.db.execute(stmt).rowcount
+        total = changed[True] + changed[False]
+        sign = -1 if deleted else 1
+        self.counters.add(
+            self.tenant_id, active_count=sign * total, deleted_count=-sign * total,
+            modified_count=sign * changed[True]
+        )
+        return total
+    
     def search_tasks(self, search_params: TaskSearchRequest) -> Tuple[List[Task], int]:
         """
         Search and filter tasks with pagination
@@ -160,39 +766,50 @@ class TaskService:
         Returns:
             Tuple of (filtered tasks list, total count)
         """
-        query = self.db.query(Task).filter(Task.is_deleted == False)
-        
-        # Apply filters
-        if search_params.title:
-            query = query.filter(Task.title.ilike(f"%{search_params.title}%"))
-        
+        plan = self.plan_search(search_params)
+        query = self._apply_filter(self._tasks().filter(Task.is_deleted == False), search_params)
         
         # Get total count before pagination
         total = query.count()
         
-        # Apply pagination
-        tasks = query.offset((search_params.page - 1) * search_params.size).limit(search_params.size).all()
+        # Apply index order (ties by ID, which the index also holds) and pagination
+        column = RANGE_COLUMNS[plan.sort_by]
+        order = (column.desc(), Task.id.desc()) if plan.descending else (column.asc(), Task.id.asc())
+        tasks = query.options(joinedload(Task.description_row)).order_by(*order).offset(
+            (search_params.page - 1) * search_params.size
+        ).limit(search_params.size).all()
         
         return tasks, total
     
-    def get_tasks_count(self) -> int:
+    def get_tasks_count(
+        self,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None
+    ) -> int:
         """
         Get total count of non-deleted tasks
         
+        Args:
+            created_after: Only tasks created at or after this time (optional)
+            created_before: Only tasks created before this time (optional)
+        
         Returns:
             Total number of active tasks
         """
-        return self.db.query(Task).filter(Task.is_deleted == False).count()
+        if created_after is None and created_before is None:
+            return self.counters.get(self.tenant_id)["active_count"]
+        query = self._tasks().filter(Task.is_deleted == False)
+        return self._created_between(query, created_after, created_before).count()
     
     
     def get_deleted_tasks_count(self) -> int:
         """
-        Get count of soft-deleted tasks
+        Get count of soft-deleted tasks (including archived ones)
         
         Returns:
             Number of deleted tasks
         """
-        return self.db.query(Task).filter(Task.is_deleted == True).count()
+        return self.counters.get(self.tenant_id)["deleted_count"]
     
     def get_modified_tasks_count(self) -> int:
         """
@@ -201,11 +818,9 @@ class TaskService:
         Returns:
             Number of modified tasks
         """
-        return self.db.query(Task).filter(
-            and_(Task.is_deleted == False, Task.modification_count > 0)
-        ).count()
+        return self.counters.get(self.tenant_id)["modified_count"]
     
-    def restore_task(self, task_id: int) -> bool:
+    def restore_task(self, task_id: int) -> Optional[Task]:
         """
         Restore a soft-deleted task
         
@@ -213,16 +828,23 @@ class TaskService:
             task_id: The ID of the task to restore
             
         Returns:
-            True if task was restored, False if not found
+            Restored Task object if found, None otherwise
         """
-        db_task = self.db.query(Task).filter(
-            and_(Task.id == task_id, Task.is_deleted == True)
-        ).first()
-        
-        if not db_task:
-            return False
-        
-        db_task.is_deleted = False
+        # Guarded UPDATE, as in delete_task: a concurrent restore of the
+        # same task leaves it unchanged and the counters alone
+        if self._set_deleted([task_id], False):
+            # Reloaded in the writing transaction, replacing any stale copy
+            db_task = self.db.get(Task, task_id, populate_existing=True)
+            self.db.commit()
+            task_cache.invalidate(self._cache_key(task_id))
+            return db_task
         self.db.commit()
-        return True
+        if self.get_task_by_id(task_id) is not None:
+            # Active already, or another tenant's task
+            return None
+        # Old deleted tasks may have been moved out by the archival job
+        db_task = ArchiveService(self.db, self.tenant_id).restore_archived_task(task_id)
+        if db_task is not None:
+            task_cache.invalidate(self._cache_key(task_id))
+        return db_task
     
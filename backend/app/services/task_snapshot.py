@@ -0,0 +1,358 @@
+"""
+Columnar snapshot of tasks for analytics, stored as NumPy arrays on local disk
+
+A snapshot is a directory holding one ``.npy`` file per column plus a
+manifest. Rows are grouped by tenant, and the manifest records each tenant's
+row range, so a tenant's data is a contiguous slice of every column.
+Readers memory-map the files: every worker process shares one copy through
+the page cache, and a query only touches the columns it needs.
+
+``build_snapshot`` reads tasks and archived tasks in primary-key chunks
+through the read engines, all chunks of one database inside a single
+snapshot transaction, so a task archived mid-build is counted exactly
+once. It writes a new directory and then switches the CURRENT pointer
+with an atomic rename, so readers never see a partial snapshot. Analytics (AnalyticsService) read only the snapshot and never
+query the database.
+
+NumPy is an optional dependency, imported on first use (it adds about
+60 ms to import time).
+"""
+
+import json
+import os
+import shutil
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.engine import Connection, Engine
+
+from app.db.database import get_read_engine
+from app.db.tenancy import TENANT_DATABASE_URLS, get_tenant_engine
+from app.models.task import Task
+from app.models.task_archive import TaskArchive
+
+# Directory holding the snapshots (local disk of each API host)
+ANALYTICS_SNAPSHOT_DIR = os.getenv("ANALYTICS_SNAPSHOT_DIR", "./analytics_snapshots")
+# Rows read per query while building a snapshot
+ANALYTICS_SNAPSHOT_CHUNK_SIZE = int(os.getenv("ANALYTICS_SNAPSHOT_CHUNK_SIZE", "50000"))
+
+# Snapshot columns and their dtypes; timestamps are UTC epoch seconds
+SNAPSHOT_COLUMNS = {
+    "created_at": "int64",
+    "updated_at": "int64",
+    "modification_count": "int32",
+    "is_deleted": "bool",
+    "is_completed": "bool",
+}
+
+# File naming the current snapshot directory
+_CURRENT_FILE = "CURRENT"
+_MANIFEST_FILE = "manifest.json"
+# Snapshot directories kept besides the current one (readers may still map them)
+_KEEP_PREVIOUS = 1
+# Unfinished build directories older than this were left by a crashed build
+_STALE_BUILD_SECONDS = 3600
+
+
+class SnapshotUnavailable(RuntimeError):
+    """No analytics snapshot can be read (none built yet, or NumPy missing)"""
+
+
+def numpy():
+    """
+    Import NumPy on first use
+
+    Raises:
+        SnapshotUnavailable: NumPy is not installed
+    """
+    try:
+        import numpy
+    except ImportError:  # optional dependency
+        raise SnapshotUnavailable("Analytics need NumPy: pip install numpy") from None
+    return numpy
+
+
+@dataclass
+class TaskSnapshot:
+    """
+    A loaded (memory-mapped) snapshot
+
+    Attributes:
+        name: Snapshot directory name
+        built_at: When the build started (rows committed later are not included)
+        rows: Number of rows across all tenants
+        tenants: Row range [start, end) of each tenant
+        columns: Memory-mapped column arrays, keyed by SNAPSHOT_COLUMNS name
+    """
+    name: str
+    built_at: datetime
+    rows: int
+    tenants: Dict[str, Tuple[int, int]]
+    columns: Dict[str, Any]
+
+    def tenant_columns(self, tenant_id: str) -> Dict[str, Any]:
+        """
+        Get one tenant's slice of every column (views, nothing is copied)
+
+        Args:
+            tenant_id: Tenant ID
+
+        Returns:
+            Column arrays keyed by name (empty arrays for a tenant without tasks)
+        """
+        start, end = self.tenants.get(tenant_id, (0, 0))
+        return {name: column[start:end] for name, column in self.columns.items()}
+
+
+def _sources() -> List[Tuple[Engine, Any]]:
+    """
+    Engines to read from, each with the tenant criterion of its database
+
+    The main database holds every tenant not routed elsewhere; each routed
+    database is only read for the tenants routed to it.
+    """
+    sources = [(get_read_engine(), lambda model: model.tenant_id.notin_(list(TENANT_DATABASE_URLS)))]
+    by_url: Dict[str, List[str]] = {}
+    for tenant_id, url in TENANT_DATABASE_URLS.items():
+        by_url.setdefault(url, []).append(tenant_id)
+    for tenant_ids in by_url.values():
+        sources.append((
+            get_tenant_engine(tenant_ids[0]),
+            lambda model, tenant_ids=tenant_ids: model.tenant_id.in_(tenant_ids)
+        ))
+    return sources
+
+
+@contextmanager
+def _snapshot_connection(engine: Engine) -> Iterator[Connection]:
+    """
+    Connection whose reads all see the database as of the first one
+
+    REPEATABLE READ is a snapshot on PostgreSQL and InnoDB. pysqlite only
+    opens transactions for writes, so on SQLite the transaction is begun
+    explicitly: its reads then share one WAL snapshot. Closing the
+    connection rolls the transaction back.
+    """
+    if engine.dialect.name == "sqlite":
+        with engine.connect() as conn:
+            conn.exec_driver_sql("BEGIN")
+            yield conn
+    else:
+        with engine.connect().execution_options(isolation_level="REPEATABLE READ") as conn:
+            yield conn
+
+
+def _read_chunks(conn: Connection, model, criterion, chunk_size: int) -> Iterator[list]:
+    """Yield rows of one table in primary-key order, ``chunk_size`` at a time"""
+    last_id = 0
+    while True:
+        rows = conn.execute(
+            select(
+                model.id, model.tenant_id, model.created_at, model.updated_at,
+                model.modification_count, model.is_deleted, model.is_completed
+            ).where(criterion, model.id > last_id).order_by(model.id).limit(chunk_size)
+        ).all()
+        if not rows:
+            return
+        last_id = rows[-1][0]
+        yield rows
+
+
+def _epoch_seconds(values: List[datetime]):
+    """Convert datetimes (naive ones are UTC) to an int64 array of epoch seconds"""
+    np = numpy()
+    naive = [value.astimezone(timezone.utc).replace(tzinfo=None) if value.tzinfo else value for value in values]
+    return np.array(naive, dtype="datetime64[s]").astype(np.int64)
+
+
+def build_snapshot(directory: str = ANALYTICS_SNAPSHOT_DIR,
+                   chunk_size: int = ANALYTICS_SNAPSHOT_CHUNK_SIZE) -> TaskSnapshot:
+    """
+    Build a new snapshot of every tenant's tasks and make it current
+
+    Args:
+        directory: Snapshot directory
+        chunk_size: Rows read per query
+
+    Returns:
+        The new snapshot (loaded)
+    """
+    np = numpy()
+    built_at = datetime.now(timezone.utc)
+    tenant_codes: Dict[str, int] = {}
+    parts: Dict[str, list] = {name: [] for name in ("tenant", *SNAPSHOT_COLUMNS)}
+
+    for engine, criterion in _sources():
+        with _snapshot_connection(engine) as conn:
+            for model in (Task, TaskArchive):
+                for rows in _read_chunks(conn, model, criterion(model), chunk_size):
+                    _, tenants, created, updated, modifications, deleted, completed = zip(*rows)
+                    parts["tenant"].append(np.array(
+                        [tenant_codes.setdefault(tenant, len(tenant_codes)) for tenant in tenants], dtype=np.int32
+                    ))
+                    parts["created_at"].append(_epoch_seconds(created))
+                    parts["updated_at"].append(_epoch_seconds(updated))
+                    parts["modification_count"].append(np.array(modifications, dtype=np.int32))
+                    parts["is_deleted"].append(np.array(deleted, dtype=bool))
+                    parts["is_completed"].append(np.array(completed, dtype=bool))
+
+    columns = {
+        name: np.concatenate(chunks) if chunks else np.zeros(0, dtype=SNAPSHOT_COLUMNS.get(name, "int32"))
+        for name, chunks in parts.items()
+    }
+    # Group rows by tenant so each tenant is one contiguous slice
+    tenant_column = columns.pop("tenant")
+    order = np.argsort(tenant_column, kind="stable")
+    codes = tenant_column[order]
+    tenants = {}
+    for tenant, code in tenant_codes.items():
+        start, end = np.searchsorted(codes, [code, code + 1])
+        tenants[tenant] = (int(start), int(end))
+
+    name = f"snapshot-{built_at.strftime('%Y%m%dT%H%M%S%f')}-{os.getpid()}"
+    os.makedirs(directory, exist_ok=True)
+    _remove_stale_builds(directory)
+    building = os.path.join(directory, f".{name}")
+    os.makedirs(building)
+    try:
+        for column, values in columns.items():
+            np.save(os.path.join(building, f"{column}.npy"), values[order])
+        with open(os.path.join(building, _MANIFEST_FILE), "w") as manifest:
+            json.dump({
+                "built_at": built_at.isoformat(),
+                "rows": int(len(order)),
+                "tenants": tenants,
+                "build_seconds": round((datetime.now(timezone.utc) - built_at).total_seconds(), 3),
+            }, manifest)
+        os.rename(building, os.path.join(directory, name))
+    except BaseException:
+        shutil.rmtree(building, ignore_errors=True)
+        raise
+    current_tmp = os.path.join(directory, f".{_CURRENT_FILE}.{os.getpid()}")
+    with open(current_tmp, "w") as current:
+        current.write(name)
+    os.replace(current_tmp, os.path.join(directory, _CURRENT_FILE))
+    _remove_old_snapshots(directory, name)
+    return load_snapshot(directory, name)
+
+
+def _remove_stale_builds(directory: str) -> None:
+    """
+    Delete what crashed builds left behind (unfinished ``.snapshot-*``
+    directories and ``.CURRENT.*`` pointer files)
+
+    Only entries untouched for _STALE_BUILD_SECONDS go: another process may
+    be building right now (SQLite has no lock to keep it out).
+    """
+    cutoff = time.time() - _STALE_BUILD_SECONDS
+    for entry in os.listdir(directory):
+        if not entry.startswith((".snapshot-", f".{_CURRENT_FILE}.")):
+            continue
+        path = os.path.join(directory, entry)
+        try:
+            if os.path.getmtime(path) >= cutoff:
+                continue
+            if os.path.isdir(path):
+                shutil.rmtree(path, ignore_errors=True)
+            else:
+                os.remove(path)
+        except FileNotFoundError:
+            continue
+
+
+def _remove_old_snapshots(directory: str, current: str) -> None:
+    """Delete snapshot directories older than the last _KEEP_PREVIOUS ones"""
+    names = sorted(
+        (entry for entry in os.listdir(directory) if entry.startswith("snapshot-") and entry != current),
+        key=lambda entry: os.path.getmtime(os.path.join(directory, entry))
+    )
+    for name in names[:max(0, len(names) - _KEEP_PREVIOUS)]:
+        shutil.rmtree(os.path.join(directory, name), ignore_errors=True)
+
+
+def load_snapshot(directory: str, name: str) -> TaskSnapshot:
+    """
+    Memory-map a snapshot directory
+
+    Args:
+        directory: Snapshot directory
+        name: Snapshot directory name
+
+    Returns:
+        TaskSnapshot
+    """
+    np = numpy()
+    path = os.path.join(directory, name)
+    with open(os.path.join(path, _MANIFEST_FILE)) as manifest_file:
+        manifest = json.load(manifest_file)
+    return TaskSnapshot(
+        name=name,
+        built_at=datetime.fromisoformat(manifest["built_at"]),
+        rows=manifest["rows"],
+        tenants={tenant: tuple(bounds) for tenant, bounds in manifest["tenants"].items()},
+        columns={
+            column: np.load(os.path.join(path, f"{column}.npy"), mmap_mode="r") for column in SNAPSHOT_COLUMNS
+        }
+    )
+
+
+class SnapshotStore:
+    """
+    The current snapshot of a directory, reloaded when a new one is built
+
+    Each call checks the CURRENT pointer (one small file read), so a
+    snapshot built by another process is picked up on the next request.
+    """
+
+    def __init__(self, directory: str = ANALYTICS_SNAPSHOT_DIR):
+        self.directory = directory
+        self._snapshot: Optional[TaskSnapshot] = None
+        self._lock = threading.Lock()
+
+    def current_name(self) -> Optional[str]:
+        """Name of the current snapshot directory, or None if none was built"""
+        try:
+            with open(os.path.join(self.directory, _CURRENT_FILE)) as current:
+                return current.read().strip() or None
+        except FileNotFoundError:
+            return None
+
+    def get(self) -> TaskSnapshot:
+        """
+        Get the current snapshot
+
+        Raises:
+            SnapshotUnavailable: No snapshot was built yet, or NumPy is missing
+        """
+        name = self.current_name()
+        if name is None:
+            raise SnapshotUnavailable(
+                "No analytics snapshot yet: set ANALYTICS_SNAPSHOT_INTERVAL_SECONDS or run "
+                "python -m app.jobs.snapshot"
+            )
+        snapshot = self._snapshot
+        if snapshot is None or snapshot.name != name:
+            with self._lock:
+                snapshot = self._snapshot
+                if snapshot is None or snapshot.name != name:
+                    snapshot = self._snapshot = load_snapshot(self.directory, name)
+        return snapshot
+
+    def age_seconds(self) -> Optional[float]:
+        """Seconds since the current snapshot was built, or None if there is none"""
+        name = self.current_name()
+        if name is None:
+            return None
+        try:
+            return time.time() - os.path.getmtime(os.path.join(self.directory, name, _MANIFEST_FILE))
+        except FileNotFoundError:
+            return None
+
+
+# Shared store of ANALYTICS_SNAPSHOT_DIR
+snapshot_store = SnapshotStore()
@@ -0,0 +1,160 @@
+"""
+Per-tenant task counters maintained alongside task writes
+"""
+
+from typing import Dict, Tuple
+
+from sqlalchemy import bindparam, case, func, select
+from sqlalchemy.orm import Session
+
+from app.models.task import Task
+from app.models.task_archive import TaskArchive
+from app.models.tenant_counters import TenantCounters
+
+# Counter columns, in TenantCounters order
+COUNTERS = ("created_count", "active_count", "deleted_count", "modified_count", "modifications")
+
+# Read by every dashboard and count request: built once, only bound per call
+_SELECT_COUNTERS = (
+    select(*(TenantCounters.__table__.c[name] for name in COUNTERS))
+    .where(TenantCounters.tenant_id == bindparam("tenant_id"))
+)
+
+# Upsert statements built so far, keyed by (dialect, counters changed);
+# every task write runs one, so it is built once and only bound afterwards
+_UPSERTS = {}
+
+
+def _upsert(dialect: str, names: Tuple[str, ...]):
+    """Parameterized counter upsert for a dialect and a set of counters"""
+    key = (dialect, names)
+    stmt = _UPSERTS.get(key)
+    if stmt is not None:
+        return stmt
+    table = TenantCounters.__table__
+    values = {"tenant_id": bindparam("tenant_id"), **{name: bindparam(name) for name in names}}
+    # Dialect inserts are imported here: loading every dialect package
+    # at import time slows down app start-up
+    if dialect in ("mysql", "mariadb"):
+        from sqlalchemy.dialects.mysql import insert as upsert
+        stmt = upsert(table).values(values)
+        stmt = stmt.on_duplicate_key_update(
+            {**{name: table.c[name] + stmt.inserted[name] for name in names}, "updated_at": func.now()}
+        )
+    else:
+        if dialect == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert as upsert
+        else:
+            from sqlalchemy.dialects.sqlite import insert as upsert
+        stmt = upsert(table).values(values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.c.tenant_id],
+            set_={**{name: table.c[name] + stmt.excluded[name] for name in names}, "updated_at": func.now()}
+        )
+    _UPSERTS[key] = stmt
+    return stmt
+
+
+class TenantCounterService:
+    """
+    Service class for the running task totals of each tenant
+
+    Writers call ``add`` inside the transaction that changes the tasks, so
+    the counters commit (or roll back) together with the rows they count.
+    The increment is a single atomic upsert, safe under concurrent writers.
+    Each tenant has one counters row, so concurrent writes of one tenant
+    queue on its row lock until they commit; bulk operations add once per
+    chunk rather than once per task.
+    """
+
+    def __init__(self, db: Session):
+        """
+        Initialize TenantCounterService with database session
+
+        Args:
+            db: SQLAlchemy database session
+        """
+        self.db = db
+
+    def add(self, tenant_id: str, **deltas: int) -> None:
+        """
+        Add deltas to a tenant's counters (without committing)
+
+        Args:
+            tenant_id: Tenant ID
+            deltas: Amounts to add, keyed by counter name (see COUNTERS)
+        """
+        deltas = {name: delta for name, delta in deltas.items() if delta}
+        if not deltas:
+            return
+        dialect = self.db.get_bind(TenantCounters).dialect.name
+        stmt = _upsert(dialect, tuple(sorted(deltas)))
+        self.db.execute(stmt, {"tenant_id": tenant_id, **deltas})
+
+    def get(self, tenant_id: str) -> Dict[str, int]:
+        """
+        Get a tenant's counters
+
+        Args:
+            tenant_id: Tenant ID
+
+        Returns:
+            Dictionary of counter name to value (zeros for a tenant without tasks)
+        """
+        row = self.db.execute(_SELECT_COUNTERS, {"tenant_id": tenant_id}).first()
+        return dict(zip(COUNTERS, row)) if row is not None else dict.fromkeys(COUNTERS, 0)
+
+    def count(self, tenant_id: str) -> Dict[str, int]:
+        """
+        Recount a tenant's totals from its tasks and archived tasks
+
+        Reads only the tenant's rows (through the tenant-leading indexes).
+
+        Args:
+            tenant_id: Tenant ID
+
+        Returns:
+            Dictionary of counter name to the actual value
+        """
+        active, deleted, modified, modifications = self.db.execute(
+            select(
+                func.coalesce(func.sum(case((Task.is_deleted == False, 1), else_=0)), 0),
+                func.coalesce(func.sum(case((Task.is_deleted == True, 1), else_=0)), 0),
+                func.coalesce(func.sum(case(((Task.is_deleted == False) & (Task.modification_count > 0), 1),
+                                            else_=0)), 0),
+                func.coalesce(func.sum(Task.modification_count), 0)
+            ).where(Task.tenant_id == tenant_id)
+        ).one()
+        archived, archived_modifications = self.db.execute(
+            select(func.count(TaskArchive.id), func.coalesce(func.sum(TaskArchive.modification_count), 0))
+            .where(TaskArchive.tenant_id == tenant_id)
+        ).one()
+        return {
+            "created_count": active + deleted + archived,
+            "active_count": active,
+            "deleted_count": deleted + archived,
+            "modified_count": modified,
+            "modifications": modifications + archived_modifications
+        }
+
+    def reconcile(self, tenant_id: str) -> Dict[str, int]:
+        """
+        Reset a tenant's counters to a fresh recount and commit
+
+        Counters can drift if rows are changed outside the services (manual
+        SQL, restored backups); this puts them back in line. Writes that
+        commit while the recount runs are not part of it, so run it while
+        the tenant is quiet.
+
+        Args:
+            tenant_id: Tenant ID
+
+        Returns:
+            Dictionary of counter name to the correction applied (0 if it was right)
+        """
+        stored = self.get(tenant_id)
+        actual = self.count(tenant_id)
+        corrections = {name: actual[name] - stored[name] for name in COUNTERS}
+        self.add(tenant_id, **corrections)
+        self.db.commit()
+        return corrections
@@ -0,0 +1,184 @@
+"""
+Process warm-up run once at startup, reported by the readiness endpoint
+
+The first request after a cold start otherwise pays for work that is done
+lazily: opening database connections (plus dialect initialization), compiling
+the hot SQL statements into SQLAlchemy's statement cache, building the
+Pydantic serializers' first-use state and generating the OpenAPI schema.
+``Warmup`` does all of that on a background thread so liveness checks answer
+immediately, and ``/readyz`` reports "ready" only once it has finished.
+With in-memory SQLite every session shares one connection, so only the
+OpenAPI schema is prepared there.
+"""
+
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.pool import StaticPool
+
+from app.db.database import SessionLocal, get_engine, get_read_engine
+from app.schemas.task import TaskListResponse, TaskResponse
+from app.services.task_service import TaskService
+
+logger = logging.getLogger(__name__)
+
+# Run the warm-up at startup (false reports ready immediately)
+WARMUP_ENABLED = os.getenv("WARMUP_ENABLED", "true").lower() in ("1", "true", "yes")
+# Pool connections opened ahead of the first requests
+WARMUP_POOL_CONNECTIONS = int(os.getenv("WARMUP_POOL_CONNECTIONS", "4"))
+# Pause before retrying a failed warm-up (e.g. database not reachable yet)
+WARMUP_RETRY_SECONDS = float(os.getenv("WARMUP_RETRY_SECONDS", "5"))
+
+PENDING = "pending"
+RUNNING = "running"
+READY = "ready"
+FAILED = "failed"
+
+
+def _shares_connection() -> bool:
+    """
+    Whether the engines hand every caller the same connection (in-memory
+    SQLite): warming it from this thread would roll back a request using it
+    """
+    return any(isinstance(engine.pool, StaticPool) for engine in (get_engine(), get_read_engine()))
+
+
+def _warm_pool(connections: int) -> None:
+    engines = [(get_read_engine(), max(1, connections))]
+    if get_engine() is not get_read_engine():
+        # SQLite file mode: the writer pool holds a single connection
+        engines.append((get_engine(), 1))
+    opened = []
+    try:
+        # Held together so the pool really grows to ``connections``
+        for engine, count in engines:
+            for _ in range(count):
+                connection = engine.connect()
+                opened.append(connection)
+                connection.execute(text("SELECT 1"))
+    finally:
+        for connection in opened:
+            connection.close()
+
+
+def _warm_queries() -> None:
+    db = SessionLocal()
+    try:
+        task_service = TaskService(db)
+        # Compiles the hot statements into the statement cache; both are
+        # bounded index lookups, so this stays cheap on large tables
+        tasks = task_service.get_all_tasks(limit=1)
+        task_service.get_active_task_by_id(0)
+        page = TaskListResponse(
+            tasks=[TaskResponse.model_validate(task) for task in tasks], total=len(tasks), page=1, size=1
+        )
+        page.model_dump_json()
+    finally:
+        db.close()
+
+
+class Warmup:
+    """
+    Runs the warm-up steps once on a daemon thread and records their timings
+    """
+
+    def __init__(self, enabled: bool = WARMUP_ENABLED, retry_seconds: float = WARMUP_RETRY_SECONDS):
+        self.enabled = enabled
+        self.retry_seconds = retry_seconds
+        self.status = PENDING if enabled else READY
+        self.attempts = 0
+        self.error: Optional[str] = None
+        self.steps: Dict[str, float] = {}
+        self.duration_ms: Optional[float] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self, app: Any = None) -> None:
+        """
+        Start warming up in the background
+
+        Args:
+            app: FastAPI application whose OpenAPI schema is pre-generated
+        """
+        if not self.enabled or self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, args=(app,), name="warmup", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Abandon a warm-up that is still retrying"""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+    def run(self, app: Any = None) -> bool:
+        """
+        Run every warm-up step once in the calling thread
+
+        Args:
+            app: FastAPI application whose OpenAPI schema is pre-generated
+
+        Returns:
+            True if all steps succeeded
+        """
+        steps: List[Tuple[str, Callable[[], Any]]] = []
+        if not _shares_connection():
+            steps += [
+                ("pool", lambda: _warm_pool(WARMUP_POOL_CONNECTIONS)),
+                ("queries", _warm_queries),
+            ]
+        if app is not None:
+            steps.append(("openapi", app.openapi))
+
+        self.status = RUNNING
+        self.attempts += 1
+        started = time.perf_counter()
+        for name, step in steps:
+            step_started = time.perf_counter()
+            try:
+                step()
+            except Exception as exc:
+                self.status = FAILED
+                self.error = f"{name}: {exc}"
+                logger.warning("Warm-up step %s failed: %s", name, exc)
+                return False
+            self.steps[name] = round((time.perf_counter() - step_started) * 1000, 2)
+        self.duration_ms = round((time.perf_counter() - started) * 1000, 2)
+        self.error = None
+        self.status = READY
+        logger.info("Warm-up finished in %.0f ms %s", self.duration_ms, self.steps)
+        return True
+
+    def is_ready(self) -> bool:
+        """Whether the process has finished warming up"""
+        return self.status == READY
+
+    def state(self) -> Dict[str, Any]:
+        """
+        Get the warm-up state for the readiness endpoint
+
+        Returns:
+            Dictionary with status, attempts, step timings and the last error
+        """
+        return {
+            "status": self.status,
+            "attempts": self.attempts,
+            "duration_ms": self.duration_ms,
+            "steps_ms": dict(self.steps),
+            "error": self.error
+        }
+
+    def _run(self, app: Any) -> None:
+        while not self.run(app) and not self._stop.wait(self.retry_seconds):
+            pass
+
+
+# Shared instance started by the application lifespan
+warmup = Warmup()
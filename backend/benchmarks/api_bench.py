@@ -0,0 +1,244 @@
+"""
+HTTP load test for every endpoint in routes/tasks.py and routes/metrics.py
+
+Runs each endpoint at several concurrency levels and records p50/p95/p99
+latency and throughput. By default the app is driven in-process through
+ASGI (no network, one event loop, like a single uvicorn worker); pass
+--url to load-test a running server instead.
+
+Usage:
+    python -m benchmarks.api_bench --tasks 100000 --concurrency 1,8,32
+    python -m benchmarks.api_bench --url http://localhost:8000 --endpoints list_tasks,get_metrics
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from benchmarks.common import configure_database, environment_info, summarize, write_results
+
+# (method, path, json body) produced for the n-th request of a scenario
+Request = Tuple[str, str, Optional[Dict[str, Any]]]
+
+# IDs per GET /tasks/batch (query string) and POST /tasks/batch (body)
+BATCH_GET_IDS = 50
+BATCH_POST_IDS = 500
+# Share of batch IDs above the seeded range, reported in missing_ids
+BATCH_MISSING_RATIO = 0.1
+# Tasks given a revision history before the history scenarios, and its depth
+HISTORY_TASKS = 20
+HISTORY_DEPTH = 30
+
+
+class Scenarios:
+    """
+    Request generators for each endpoint, keyed by a short scenario name
+
+    Write scenarios work on disjoint ID ranges so they keep succeeding for
+    the whole run (e.g. delete_task consumes IDs that restore_task later
+    brings back).
+    """
+
+    def __init__(self, max_id: int, rng: random.Random):
+        self.max_id = max(1, max_id)
+        self.rng = rng
+        self._delete_cursor = 0
+        self._restore_cursor = 0
+        self._bulk_cursor = 0
+        self.deleted: List[int] = []
+        # Tasks with HISTORY_DEPTH revisions (see prepare_history)
+        self.history_ids: List[int] = []
+
+    def random_id(self) -> int:
+        return self.rng.randint(1, self.max_id)
+
+    def build(self) -> Dict[str, Callable[[], Request]]:
+        return {
+            # routes/tasks.py
+            "list_tasks": lambda: ("GET", "/tasks/?skip=0&limit=100", None),
+            "list_tasks_deep": lambda: ("GET", f"/tasks/?skip={self.rng.randint(0, self.max_id // 2)}&limit=100", None),
+            "search_tasks": lambda: ("GET", f"/tasks/search?title={self.rng.choice(['report', 'deploy', 'fix'])}&page=1&size=20", None),
+            "get_task": lambda: ("GET", f"/tasks/{self.random_id()}", None),
+            "get_tasks_batch": lambda: ("GET", f"/tasks/batch?ids={','.join(map(str, self.batch_ids(BATCH_GET_IDS)))}", None),
+            "post_tasks_batch": lambda: ("POST", "/tasks/batch", {"task_ids": self.batch_ids(BATCH_POST_IDS)}),
+            "get_task_history": lambda: ("GET", f"/tasks/{self.history_id()}/history?limit=20", None),
+            "get_task_revision": lambda: ("GET", f"/tasks/{self.history_id()}/history/0", None),
+            "create_task": lambda: ("POST", "/tasks/", {"title": "Benchmark task", "description": "Created by api_bench"}),
+            "update_task": lambda: ("PUT", f"/tasks/{self.random_id()}", {"title": f"Updated {self.rng.random():.6f}"}),
+            "delete_task": self._delete,
+            "restore_task": self._restore,
+            "bulk_delete_tasks": self._bulk_delete,
+            # routes/metrics.py
+            "get_metrics": lambda: ("GET", "/metrics/", None),
+            "get_task_stats": lambda: ("GET", "/metrics/stats", None),
+            "get_completion_trends": lambda: ("GET", "/metrics/trends?days=30", None),
+            "get_most_modified_tasks": lambda: ("GET", "/metrics/most-modified?limit=10", None),
+            "get_productivity_metrics": lambda: ("GET", "/metrics/productivity", None),
+            "get_category_breakdown": lambda: ("GET", "/metrics/categories", None),
+            "get_metrics_health": lambda: ("GET", "/metrics/health", None),
+        }
+
+    def batch_ids(self, count: int) -> List[int]:
+        """Random IDs for a batch lookup, some of them beyond the seeded range"""
+        return [
+            self.max_id + self.rng.randint(1, self.max_id) if self.rng.random() < BATCH_MISSING_RATIO
+            else self.random_id()
+            for _ in range(count)
+        ]
+
+    def history_id(self) -> int:
+        # Oldest revision of a prepared task is rebuilt through every delta
+        return self.rng.choice(self.history_ids) if self.history_ids else self.random_id()
+
+    def _delete(self) -> Request:
+        # Walk the top of the ID space downwards so deletes rarely collide
+        self._delete_cursor += 1
+        task_id = self.max_id - self._delete_cursor + 1
+        self.deleted.append(task_id)
+        return ("DELETE", f"/tasks/{task_id}", None)
+
+    def _restore(self) -> Request:
+        if self._restore_cursor < len(self.deleted):
+            task_id = self.deleted[self._restore_cursor]
+            self._restore_cursor += 1
+        else:
+            task_id = self.random_id()
+        return ("POST", f"/tasks/{task_id}/restore", None)
+
+    def _bulk_delete(self) -> Request:
+        start = self.max_id // 2 + self._bulk_cursor * 50
+        self._bulk_cursor += 1
+        return ("POST", "/tasks/bulk", {"task_ids": list(range(start, start + 50))})
+
+
+async def run_level(client, make_request: Callable[[], Request], concurrency: int,
+                    total_requests: int) -> Dict[str, Any]:
+    """
+    Fire ``total_requests`` requests with ``concurrency`` concurrent workers
+    """
+    latencies: List[float] = []
+    errors = 0
+    remaining = total_requests
+
+    async def worker() -> None:
+        nonlocal remaining, errors
+        while remaining > 0:
+            remaining -= 1
+            method, path, body = make_request()
+            start = time.perf_counter()
+            try:
+                response = await client.request(method, path, json=body)
+                failed = response.status_code >= 500
+            except Exception:
+                failed = True
+            latencies.append(time.perf_counter() - start)
+            if failed:
+                errors += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return summarize(latencies, time.perf_counter() - start, errors)
+
+
+async def prepare_history(client, scenarios: Scenarios) -> None:
+    """
+    Give HISTORY_TASKS active tasks HISTORY_DEPTH revisions each (seeded
+    tasks have none), so the history scenarios read real delta chains
+    """
+    task_id = 0
+    while len(scenarios.history_ids) < HISTORY_TASKS and task_id < scenarios.max_id:
+        task_id += 1
+        for revision in range(HISTORY_DEPTH):
+            response = await client.put(
+                f"/tasks/{task_id}", json={"description": f"History revision {revision} " + "lorem ipsum " * 20}
+            )
+            if response.status_code != 200:
+                break
+        else:
+            scenarios.history_ids.append(task_id)
+
+
+async def run(args, database_url: str) -> Dict[str, Any]:
+    import httpx
+
+    if args.url:
+        client = httpx.AsyncClient(base_url=args.url, timeout=60.0)
+        max_id = args.max_id or args.tasks
+    else:
+        from benchmarks.seed import seed
+        seed(args.tasks, reset=args.reset, quiet=False)
+        from sqlalchemy import func, select
+        from app.db.database import SessionLocal
+        from app.models.task import Task
+        from main import app
+
+        db = SessionLocal()
+        try:
+            max_id = db.scalar(select(func.max(Task.id))) or 1
+        finally:
+            db.close()
+        client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench", timeout=60.0)
+
+    scenario_set = Scenarios(max_id, random.Random(args.seed))
+    scenarios = scenario_set.build()
+    selected = args.endpoints.split(",") if args.endpoints else list(scenarios)
+    levels = [int(level) for level in args.concurrency.split(",")]
+
+    results: Dict[str, Any] = {}
+    async with client:
+        if {"get_task_history", "get_task_revision"} & set(selected):
+            await prepare_history(client, scenario_set)
+        for name in selected:
+            make_request = scenarios[name]
+            # Warm-up round so connection setup and first-call costs are excluded
+            await run_level(client, make_request, 1, min(args.warmup, args.requests))
+            results[name] = {}
+            for level in levels:
+                stats = await run_level(client, make_request, level, args.requests)
+                results[name][str(level)] = stats
+                print(f"{name:28s} c={level:<4d} p50={stats['p50_ms']:8.2f}ms p95={stats['p95_ms']:8.2f}ms "
+                      f"p99={stats['p99_ms']:8.2f}ms {stats['throughput_ops']:9.1f} req/s errors={stats['errors']}")
+
+    return {
+        "benchmark": "api",
+        "environment": environment_info("remote" if args.url else database_url),
+        "config": {
+            "tasks": args.tasks,
+            "requests_per_level": args.requests,
+            "concurrency": levels,
+            "target": args.url or "in-process"
+        },
+        "results": results
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Load-test the TODO API endpoints")
+    parser.add_argument("--database-url", help="Database URL for in-process runs (default: local SQLite file)")
+    parser.add_argument("--url", help="Base URL of a running server (skips seeding)")
+    parser.add_argument("--max-id", type=int, help="Highest task ID on the remote server")
+    parser.add_argument("--tasks", type=int, default=10000, help="Number of seeded tasks")
+    parser.add_argument("--reset", action="store_true", help="Re-seed from scratch")
+    parser.add_argument("--concurrency", default="1,8,32", help="Comma-separated concurrency levels")
+    parser.add_argument("--requests", type=int, default=200, help="Requests per endpoint and concurrency level")
+    parser.add_argument("--warmup", type=int, default=20, help="Warm-up requests per endpoint")
+    parser.add_argument("--endpoints", help="Comma-separated scenario names (default: all)")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--rate-limit", action="store_true",
+                        help="Keep rate limiting/admission control on for in-process runs")
+    parser.add_argument("--output", help="Result file (default: benchmarks/results/api-<timestamp>.json)")
+    args = parser.parse_args()
+
+    database_url = configure_database(args.database_url)
+    if not args.rate_limit:
+        # All in-process requests come from one client address
+        os.environ["RATE_LIMIT_ENABLED"] = "false"
+    payload = asyncio.run(run(args, database_url))
+    print(f"Results written to {write_results('api', payload, args.output)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""
+Shared helpers for the benchmark suite: database selection, timing
+statistics and JSON result files
+"""
+
+import json
+import math
+import os
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESULTS_DIR = os.path.join(BACKEND_DIR, "benchmarks", "results")
+DEFAULT_DATABASE_URL = "sqlite:///" + os.path.join(BACKEND_DIR, "benchmarks", "bench.db")
+
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+
+def configure_database(database_url: Optional[str]) -> str:
+    """
+    Point the application at the benchmark database
+
+    Must be called before anything under ``app`` is imported, because the
+    engine is configured from DATABASE_URL.
+
+    Args:
+        database_url: Database URL (defaults to a local SQLite file)
+
+    Returns:
+        The database URL in use
+    """
+    url = database_url or os.getenv("BENCH_DATABASE_URL") or DEFAULT_DATABASE_URL
+    os.environ["DATABASE_URL"] = url
+    return url
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """
+    Nearest-rank percentile of an already sorted list
+
+    Args:
+        sorted_values: Sorted samples
+        pct: Percentile between 0 and 100
+
+    Returns:
+        The percentile value (0.0 for an empty list)
+    """
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100.0 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def summarize(latencies: List[float], elapsed: float, errors: int = 0) -> Dict[str, Any]:
+    """
+    Summarize latency samples (in seconds) into milliseconds and throughput
+
+    Args:
+        latencies: Per-operation latencies in seconds
+        elapsed: Wall clock time for the whole run in seconds
+        errors: Number of failed operations
+
+    Returns:
+        Dictionary with count, errors, p50/p95/p99/max/mean and ops per second
+    """
+    ordered = sorted(latencies)
+    count = len(ordered)
+    return {
+        "count": count,
+        "errors": errors,
+        "p50_ms": round(percentile(ordered, 50) * 1000, 3),
+        "p95_ms": round(percentile(ordered, 95) * 1000, 3),
+        "p99_ms": round(percentile(ordered, 99) * 1000, 3),
+        "max_ms": round(ordered[-1] * 1000, 3) if ordered else 0.0,
+        "mean_ms": round(sum(ordered) / count * 1000, 3) if count else 0.0,
+        "throughput_ops": round(count / elapsed, 2) if elapsed > 0 else 0.0
+    }
+
+
+def environment_info(database_url: str) -> Dict[str, Any]:
+    """
+    Describe the machine and code version a run was taken on
+
+    Args:
+        database_url: Database URL used for the run
+
+    Returns:
+        Dictionary with timestamp, python, platform, git revision and database dialect
+    """
+    try:
+        revision = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=BACKEND_DIR, capture_output=True, text=True, check=False
+        ).stdout.strip() or None
+    except OSError:
+        revision = None
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "git_revision": revision,
+        "database": database_url.split(":", 1)[0]
+    }
+
+
+def write_results(kind: str, payload: Dict[str, Any], output: Optional[str] = None) -> str:
+    """
+    Store benchmark results as JSON
+
+    Args:
+        kind: Benchmark name used in the default file name
+        payload: Results to store
+        output: Explicit output path (optional)
+
+    Returns:
+        Path of the written file
+    """
+    if output is None:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        output = os.path.join(RESULTS_DIR, f"{kind}-{stamp}.json")
+    with open(output, "w", encoding="utf-8") as handle:
+        json.dump(payload, handle, indent=2, sort_keys=True, default=str)
+    return output
+
+
+class Timer:
+    """Context manager measuring wall clock time with perf_counter"""
+
+    def __enter__(self) -> "Timer":
+        self.start = time.perf_counter()
+        self.elapsed = 0.0
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.elapsed = time.perf_counter() - self.start
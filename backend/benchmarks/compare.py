@@ -0,0 +1,71 @@
+"""
+Compare two benchmark result files and flag regressions
+
+Usage:
+    python -m benchmarks.compare benchmarks/results/api-old.json benchmarks/results/api-new.json
+    python -m benchmarks.compare old.json new.json --threshold 15
+
+Exits with status 1 when any latency metric got slower (or throughput got
+lower) by more than the threshold percentage.
+"""
+
+import argparse
+import json
+import sys
+from typing import Any, Dict, Iterator, Tuple
+
+# Metrics where a higher value is worse
+LATENCY_KEYS = ("p50_ms", "p95_ms", "p99_ms", "median_us", "p95_us", "total_ms", "import_ms")
+# Metrics where a lower value is worse
+THROUGHPUT_KEYS = ("throughput_ops",)
+
+
+def flatten(results: Dict[str, Any], prefix: str = "") -> Iterator[Tuple[str, str, float]]:
+    """
+    Yield (case, metric, value) for every comparable number in a result tree
+    """
+    for key, value in results.items():
+        if isinstance(value, dict):
+            yield from flatten(value, f"{prefix}{key}/")
+        elif key in LATENCY_KEYS + THROUGHPUT_KEYS and isinstance(value, (int, float)):
+            yield prefix.rstrip("/"), key, float(value)
+
+
+def compare(old: Dict[str, Any], new: Dict[str, Any], threshold: float) -> int:
+    """
+    Print a comparison table and return the number of regressions
+    """
+    old_values = {(case, metric): value for case, metric, value in flatten(old.get("results", {}))}
+    regressions = 0
+    print(f"{'case':44s} {'metric':14s} {'old':>12s} {'new':>12s} {'change':>9s}")
+    for case, metric, value in flatten(new.get("results", {})):
+        previous = old_values.get((case, metric))
+        if previous is None:
+            continue
+        change = ((value - previous) / previous * 100.0) if previous else 0.0
+        worse = change > threshold if metric not in THROUGHPUT_KEYS else change < -threshold
+        regressions += worse
+        marker = "  REGRESSION" if worse else ""
+        print(f"{case:44s} {metric:14s} {previous:12.3f} {value:12.3f} {change:+8.1f}%{marker}")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare two benchmark result files")
+    parser.add_argument("baseline", help="Older result file")
+    parser.add_argument("candidate", help="Newer result file")
+    parser.add_argument("--threshold", type=float, default=10.0, help="Allowed change in percent")
+    args = parser.parse_args()
+
+    with open(args.baseline, encoding="utf-8") as handle:
+        old = json.load(handle)
+    with open(args.candidate, encoding="utf-8") as handle:
+        new = json.load(handle)
+
+    regressions = compare(old, new, args.threshold)
+    print(f"\n{regressions} regression(s) above {args.threshold:.1f}%")
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+"""
+Bandwidth / latency tradeoff of response compression for task list payloads
+
+Builds GET /tasks style payloads (TaskListResponse JSON) from synthetic
+rows, compresses them with every available encoding and level, and
+estimates end-to-end time per response at several link speeds:
+
+    compress + transfer (bytes / bandwidth) + decompress
+
+Usage:
+    python -m benchmarks.compression_bench
+    python -m benchmarks.compression_bench --sizes 100,1000 --description-bytes 50,2000 --bandwidths 10,100,1000
+"""
+
+import argparse
+import random
+import time
+import zlib
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Tuple
+
+from benchmarks.common import environment_info, percentile, write_results
+from benchmarks.seed import build_rows
+
+# (encoding, level) combinations compared against the uncompressed payload
+LEVELS = {
+    "gzip": (1, 6, 9),
+    "br": (1, 4, 11),
+    "zstd": (1, 3, 10),
+}
+
+
+def build_payload(tasks: int, description_bytes: int, rng: random.Random) -> bytes:
+    """
+    Render a task list response as the API would send it
+
+    Args:
+        tasks: Number of tasks in the page
+        description_bytes: Description length per task
+        rng: Random generator for the synthetic rows
+
+    Returns:
+        JSON body bytes
+    """
+    from app.schemas.task import TaskListResponse, TaskResponse
+
+    rows = build_rows(1, tasks, rng, description_bytes, 0.0, 0.3, datetime.now(timezone.utc))
+    page = TaskListResponse(
+        tasks=[TaskResponse(**row) for row in rows], total=tasks, page=1, size=tasks
+    )
+    return page.model_dump_json().encode()
+
+
+def codecs() -> Dict[str, Tuple[Callable[[bytes, int], bytes], Callable[[bytes], bytes]]]:
+    """
+    Compress/decompress functions per installed encoding
+    """
+    available = {
+        "gzip": (
+            lambda data, level: zlib.compress(data, level, wbits=16 + zlib.MAX_WBITS),
+            lambda data: zlib.decompress(data, wbits=16 + zlib.MAX_WBITS)
+        )
+    }
+    try:
+        import brotli
+        available["br"] = (lambda data, level: brotli.compress(data, quality=level), brotli.decompress)
+    except ImportError:
+        pass
+    try:
+        import zstandard
+        available["zstd"] = (
+            lambda data, level: zstandard.ZstdCompressor(level=level).compress(data),
+            lambda data: zstandard.ZstdDecompressor().decompress(data)
+        )
+    except ImportError:
+        pass
+    return available
+
+
+def median_time(func: Callable[[], Any], iterations: int) -> float:
+    """Median wall time of ``func`` in seconds"""
+    samples: List[float] = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    samples.sort()
+    return percentile(samples, 50)
+
+
+def measure(payload: bytes, bandwidths: List[float], iterations: int) -> List[Dict[str, Any]]:
+    """
+    Measure every encoding/level on one payload
+
+    Returns:
+        One row per (encoding, level), starting with the identity baseline
+    """
+    def estimate(size: int, overhead_s: float) -> Dict[str, float]:
+        return {
+            f"total_ms_at_{bandwidth:g}mbit": round((overhead_s + size * 8 / (bandwidth * 1e6)) * 1000, 3)
+            for bandwidth in bandwidths
+        }
+
+    rows = [{
+        "encoding": "identity", "level": None, "bytes": len(payload), "ratio": 1.0,
+        "compress_ms": 0.0, "decompress_ms": 0.0, **estimate(len(payload), 0.0)
+    }]
+    for encoding, (compress, decompress) in codecs().items():
+        for level in LEVELS[encoding]:
+            compressed = compress(payload, level)
+            compress_s = median_time(lambda: compress(payload, level), iterations)
+            decompress_s = median_time(lambda: decompress(compressed), iterations)
+            rows.append({
+                "encoding": encoding,
+                "level": level,
+                "bytes": len(compressed),
+                "ratio": round(len(payload) / len(compressed), 2),
+                "compress_ms": round(compress_s * 1000, 3),
+                "decompress_ms": round(decompress_s * 1000, 3),
+                **estimate(len(compressed), compress_s + decompress_s)
+            })
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare response compression encodings on task list payloads")
+    parser.add_argument("--sizes", default="10,100,1000", help="Comma-separated page sizes (tasks per response)")
+    parser.add_argument("--description-bytes", default="50,200,2000", help="Comma-separated description lengths")
+    parser.add_argument("--bandwidths", default="10,100,1000", help="Comma-separated link speeds in Mbit/s")
+    parser.add_argument("--iterations", type=int, default=20, help="Timed runs per encoding and level")
+    parser.add_argument("--output", help="Result file (default: benchmarks/results/compression-<timestamp>.json)")
+    args = parser.parse_args()
+
+    sizes = [int(value) for value in args.sizes.split(",")]
+    description_lengths = [int(value) for value in args.description_bytes.split(",")]
+    bandwidths = [float(value) for value in args.bandwidths.split(",")]
+    rng = random.Random(7)
+
+    results = {}
+    for tasks in sizes:
+        for description_bytes in description_lengths:
+            name = f"tasks={tasks},description={description_bytes}"
+            rows = measure(build_payload(tasks, description_bytes, rng), bandwidths, args.iterations)
+            results[name] = rows
+            print(f"\n{name} ({rows[0]['bytes']} bytes uncompressed)")
+            print(f"  {'encoding':10s} {'level':>5s} {'bytes':>9s} {'ratio':>6s} {'comp ms':>8s} {'decomp ms':>9s}  "
+                  + "  ".join(f"{f'@{bandwidth:g}Mbit ms':>14s}" for bandwidth in bandwidths))
+            for row in rows:
+                print(f"  {row['encoding']:10s} {str(row['level'] or '-'):>5s} {row['bytes']:9d} {row['ratio']:6.2f} "
+                      f"{row['compress_ms']:8.3f} {row['decompress_ms']:9.3f}  "
+                      + "  ".join(f"{row[f'total_ms_at_{bandwidth:g}mbit']:14.3f}" for bandwidth in bandwidths))
+
+    payload = {
+        "benchmark": "compression",
+        "environment": environment_info("none"),
+        "config": {
+            "sizes": sizes, "description_bytes": description_lengths,
+            "bandwidths_mbit": bandwidths, "iterations": args.iterations
+        },
+        "results": results
+    }
+    print(f"\nResults written to {write_results('compression', payload, args.output)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""
+Cold-start import time of the API process
+
+Imports ``main`` in fresh interpreters (``python -X importtime``) and reports
+the median wall time plus the modules with the largest cumulative import
+time. It also checks that importing the app does not create the database
+engine: connecting belongs to startup, not to import.
+
+Usage:
+    python -m benchmarks.import_time
+    python -m benchmarks.import_time --runs 20 --top 15 --budget-ms 1500
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from collections import defaultdict
+from typing import Any, Dict, List
+
+from benchmarks.common import BACKEND_DIR, configure_database, environment_info, percentile, write_results
+
+# Runs in the child interpreter; the last stdout line is a JSON summary
+_PROBE = """
+import json, sys, time
+started = time.perf_counter()
+import main
+elapsed = time.perf_counter() - started
+import app.db.database as database
+print(json.dumps({
+    "import_ms": elapsed * 1000,
+    "engine_created": database._engine is not None,
+    "modules": len(sys.modules)
+}))
+"""
+
+
+def parse_importtime(stderr: str) -> Dict[str, float]:
+    """
+    Cumulative import time per module from ``-X importtime`` output
+
+    Args:
+        stderr: Child interpreter stderr
+
+    Returns:
+        Mapping of module name to cumulative milliseconds
+    """
+    cumulative: Dict[str, float] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        try:
+            cumulative[name.strip()] = int(cumulative_us) / 1000.0
+        except ValueError:
+            continue  # header line
+    return cumulative
+
+
+def run_once() -> Dict[str, Any]:
+    """
+    Import the app in a fresh interpreter
+
+    Returns:
+        Probe summary with per-module cumulative times under "cumulative_ms"
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _PROBE],
+        cwd=BACKEND_DIR, capture_output=True, text=True, env=os.environ.copy()
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(f"Importing main failed:\n{completed.stderr[-2000:]}")
+    summary = json.loads(completed.stdout.strip().splitlines()[-1])
+    summary["cumulative_ms"] = parse_importtime(completed.stderr)
+    return summary
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure cold-start import time of the API")
+    parser.add_argument("--runs", type=int, default=10, help="Fresh interpreters to time")
+    parser.add_argument("--top", type=int, default=20, help="Modules listed by cumulative import time")
+    parser.add_argument("--budget-ms", type=float, help="Exit with status 1 if the median import exceeds this")
+    parser.add_argument("--database-url", help="Database URL (defaults to a local SQLite file)")
+    parser.add_argument("--output", help="Result file (default: benchmarks/results/import-<timestamp>.json)")
+    args = parser.parse_args()
+
+    database_url = configure_database(args.database_url)
+    runs = [run_once() for _ in range(args.runs)]
+
+    import_ms = sorted(run["import_ms"] for run in runs)
+    per_module: Dict[str, List[float]] = defaultdict(list)
+    for run in runs:
+        for name, value in run["cumulative_ms"].items():
+            per_module[name].append(value)
+    modules = sorted(
+        ((name, percentile(sorted(values), 50)) for name, values in per_module.items()),
+        key=lambda item: item[1], reverse=True
+    )
+    app_ms = {name: value for name, value in modules if name == "main" or name.startswith("app")}
+    engine_created = any(run["engine_created"] for run in runs)
+
+    median = percentile(import_ms, 50)
+    print(f"import main: median {median:.1f} ms, min {import_ms[0]:.1f} ms, "
+          f"max {import_ms[-1]:.1f} ms over {len(runs)} runs ({runs[0]['modules']} modules loaded)")
+    print(f"engine created at import: {'YES' if engine_created else 'no'}")
+    print(f"\n  {'cumulative ms':>13s}  module")
+    for name, value in modules[:args.top]:
+        print(f"  {value:13.1f}  {name}")
+
+    failures = []
+    if engine_created:
+        failures.append("importing main created the database engine")
+    if args.budget_ms is not None and median > args.budget_ms:
+        failures.append(f"median import time {median:.1f} ms exceeds the {args.budget_ms:g} ms budget")
+
+    payload = {
+        "benchmark": "import_time",
+        "environment": environment_info(database_url),
+        "config": {"runs": args.runs, "budget_ms": args.budget_ms},
+        "results": {
+            "import_ms": {
+                "median": round(median, 2),
+                "p95": round(percentile(import_ms, 95), 2),
+                "min": round(import_ms[0], 2),
+                "max": round(import_ms[-1], 2)
+            },
+            "engine_created_at_import": engine_created,
+            "modules_loaded": runs[0]["modules"],
+            "top_modules_ms": {name: round(value, 2) for name, value in modules[:args.top]},
+            "app_modules_ms": {name: round(value, 2) for name, value in app_ms.items()}
+        }
+    }
+    print(f"\nResults written to {write_results('import', payload, args.output)}")
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
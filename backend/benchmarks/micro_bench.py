@@ -0,0 +1,154 @@
+"""
+Micro-benchmarks for service methods and response serialization
+
+Each case is timed per call (median, p95 and min over many calls) so
+Python-side overhead shows up even when the database is fast.
+
+Usage:
+    python -m benchmarks.micro_bench --tasks 10000
+    python -m benchmarks.micro_bench --cases get_all_tasks,serialize_task_list --iterations 2000
+"""
+
+import argparse
+import os
+import random
+import time
+from typing import Any, Callable, Dict, List
+
+from benchmarks.common import RESULTS_DIR, configure_database, environment_info, percentile, write_results
+
+
+def time_calls(func: Callable[[], Any], iterations: int, warmup: int = 20) -> Dict[str, Any]:
+    """
+    Time ``iterations`` calls of ``func`` individually
+
+    Returns:
+        Dictionary with per-call statistics in microseconds
+    """
+    for _ in range(warmup):
+        func()
+    samples: List[float] = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    samples.sort()
+    return {
+        "iterations": iterations,
+        "min_us": round(samples[0] * 1e6, 2),
+        "median_us": round(percentile(samples, 50) * 1e6, 2),
+        "p95_us": round(percentile(samples, 95) * 1e6, 2),
+        "total_s": round(sum(samples), 4)
+    }
+
+
+def build_cases(db, max_id: int, rng: random.Random) -> Dict[str, Callable[[], Any]]:
+    """
+    Benchmark cases keyed by name; each one runs against an open session
+    """
+    from sqlalchemy.orm import joinedload
+    from app.models.task import Task
+    from app.schemas.task import TaskListResponse, TaskResponse, TaskSearchRequest, TaskUpdate
+    from app.services.history_service import encode_payload, reverse_delta
+    from app.services.metrics_service import MetricsService
+    from app.services.task_service import TaskService
+
+    task_service = TaskService(db)
+    plain_task_service = TaskService(db)
+    plain_task_service.record_history = False
+    metrics_service = MetricsService(db)
+    # Loaded with their descriptions: the fresh() cases detach them
+    page = db.query(Task).options(joinedload(Task.description_row)).limit(100).all()
+    search = TaskSearchRequest(title="report", page=1, size=20)
+
+    def edit() -> TaskUpdate:
+        return TaskUpdate(description=f"Benchmark edit {rng.random():.6f} " + "lorem ipsum " * 40)
+
+    def fresh(func: Callable[[], Any]) -> Callable[[], Any]:
+        # Empty the identity map so every call pays for loading rows
+        def wrapper():
+            db.expunge_all()
+            return func()
+        return wrapper
+
+    cases = {
+        "get_all_tasks": fresh(lambda: task_service.get_all_tasks(skip=0, limit=100)),
+        "get_tasks_count": lambda: task_service.get_tasks_count(),
+        "get_active_task_by_id": fresh(lambda: task_service.get_active_task_by_id(rng.randint(1, max_id))),
+        "get_active_task_response": fresh(lambda: task_service.get_active_task_response(rng.randint(1, max_id))),
+        "search_tasks": fresh(lambda: task_service.search_tasks(search)),
+        "get_metrics": lambda: metrics_service.get_metrics(),
+        "get_task_stats": lambda: metrics_service.get_task_stats(),
+        "update_task": fresh(lambda: task_service.update_task(rng.randint(1, max_id), edit())),
+        "update_task_without_history": fresh(
+            lambda: plain_task_service.update_task(rng.randint(1, max_id), edit())
+        ),
+        "encode_revision": lambda: encode_payload(
+            {"d": {"description": reverse_delta(page[0].description or "", edit().description)}}
+        ),
+        "serialize_task": lambda: TaskResponse.model_validate(page[0]).model_dump_json(),
+        "serialize_task_list": lambda: TaskListResponse(
+            tasks=[TaskResponse.model_validate(task) for task in page], total=len(page), page=1, size=100
+        ).model_dump_json(),
+        "get_completion_trends": lambda: metrics_service.get_completion_trends(365),
+        "get_most_modified_tasks": fresh(lambda: metrics_service.get_most_modified_tasks(10)),
+        "iter_tasks": lambda: sum(len(chunk) for chunk in task_service.iter_tasks(chunk_size=1000)),
+    }
+
+    # Same kind of questions answered from the columnar snapshot (needs NumPy)
+    from app.services.analytics_service import AnalyticsService
+    from app.services.task_snapshot import SnapshotUnavailable, build_snapshot
+    try:
+        snapshot = build_snapshot(os.path.join(RESULTS_DIR, "snapshot"))
+    except SnapshotUnavailable:
+        return cases
+    analytics = AnalyticsService(snapshot, task_service.tenant_id)
+    cases.update({
+        "analytics_modifications": lambda: analytics.get_modification_histogram(),
+        "analytics_lifetimes": lambda: analytics.get_lifetime_percentiles(),
+        "analytics_rollup": lambda: analytics.get_rollup("week", 52),
+    })
+    return cases
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Micro-benchmark TaskService, MetricsService and serialization")
+    parser.add_argument("--database-url", help="Database URL (default: local SQLite file)")
+    parser.add_argument("--tasks", type=int, default=10000, help="Number of seeded tasks")
+    parser.add_argument("--iterations", type=int, default=500, help="Timed calls per case")
+    parser.add_argument("--cases", help="Comma-separated case names (default: all)")
+    parser.add_argument("--output", help="Result file (default: benchmarks/results/micro-<timestamp>.json)")
+    args = parser.parse_args()
+
+    database_url = configure_database(args.database_url)
+    from benchmarks.seed import seed
+    seed(args.tasks)
+
+    from sqlalchemy import func, select
+    from app.db.database import SessionLocal
+    from app.models.task import Task
+
+    db = SessionLocal()
+    try:
+        max_id = db.scalar(select(func.max(Task.id))) or 1
+        cases = build_cases(db, max_id, random.Random(3))
+        selected = args.cases.split(",") if args.cases else list(cases)
+        results = {}
+        for name in selected:
+            results[name] = time_calls(cases[name], args.iterations)
+            stats = results[name]
+            print(f"{name:28s} median={stats['median_us']:10.1f}us p95={stats['p95_us']:10.1f}us min={stats['min_us']:10.1f}us")
+    finally:
+        db.close()
+
+    payload = {
+        "benchmark": "micro",
+        "environment": environment_info(database_url),
+        "config": {"tasks": args.tasks, "iterations": args.iterations},
+        "results": results
+    }
+    print(f"Results written to {write_results('micro', payload, args.output)}")
+
+
+if __name__ == "__main__":
+    main()
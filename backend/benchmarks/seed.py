@@ -0,0 +1,151 @@
+"""
+Seed a benchmark database with synthetic tasks
+
+Usage:
+    python -m benchmarks.seed --tasks 100000
+    python -m benchmarks.seed --tasks 100000 --tenants 50
+    python -m benchmarks.seed --database-url mysql+pymysql://root:pw@localhost/todo_bench --tasks 10000000
+"""
+
+import argparse
+import random
+from datetime import datetime, timedelta, timezone
+
+from benchmarks.common import Timer, configure_database
+
+WORDS = (
+    "report review deploy invoice meeting design refactor backup release plan "
+    "budget customer email draft update migrate audit onboard research fix"
+).split()
+
+
+def tenant_ids(tenants: int):
+    """Tenant IDs used by the seed: the default tenant alone, or tenant-0 .. tenant-N"""
+    from app.db.tenancy import DEFAULT_TENANT_ID
+    return [DEFAULT_TENANT_ID] if tenants <= 1 else [f"tenant-{index}" for index in range(tenants)]
+
+
+def build_rows(start_id: int, count: int, rng: random.Random, description_bytes: int,
+               deleted_ratio: float, modified_ratio: float, now: datetime, tenants=None):
+    """
+    Generate ``count`` task rows with a realistic mix of states
+
+    Rows are spread round-robin over ``tenants`` (default tenant if omitted).
+    """
+    tenants = tenants or tenant_ids(1)
+    rows = []
+    for offset in range(count):
+        created_at = now - timedelta(seconds=rng.randint(0, 365 * 24 * 3600))
+        modified = rng.random() < modified_ratio
+        words = rng.sample(WORDS, 3)
+        rows.append({
+            "id": start_id + offset,
+            "tenant_id": tenants[(start_id + offset) % len(tenants)],
+            "title": f"{' '.join(words).capitalize()} #{start_id + offset}",
+            "description": (" ".join(rng.choices(WORDS, k=max(1, description_bytes // 7))))[:description_bytes]
+            if description_bytes else None,
+            "is_deleted": rng.random() < deleted_ratio,
+            "is_completed": rng.random() < 0.3,
+            "modification_count": rng.randint(1, 20) if modified else 0,
+            "created_at": created_at,
+            "updated_at": created_at + timedelta(seconds=rng.randint(0, 30 * 24 * 3600)) if modified else created_at
+        })
+    return rows
+
+
+def seed(tasks: int, chunk_size: int = 10000, description_bytes: int = 200,
+         deleted_ratio: float = 0.1, modified_ratio: float = 0.3, reset: bool = False,
+         seed_value: int = 42, quiet: bool = False, tenants: int = 1) -> int:
+    """
+    Make sure the configured database holds ``tasks`` rows
+
+    Args:
+        tasks: Number of tasks the table should contain
+        chunk_size: Rows inserted per transaction
+        description_bytes: Approximate description length (0 for no description)
+        deleted_ratio: Fraction of soft-deleted tasks
+        modified_ratio: Fraction of tasks with modification_count > 0
+        reset: Drop and recreate the tables first
+        seed_value: Random seed so runs are reproducible
+        quiet: Suppress progress output
+        tenants: Number of tenants the rows are spread over (1: default tenant)
+
+    Returns:
+        Number of rows inserted
+    """
+    from sqlalchemy import func, insert, select
+    from app.db.database import SessionLocal, create_tables, drop_tables
+    from app.models.task import Task
+    from app.models.task_description import TaskDescription, description_row
+    from app.services.tenant_counter_service import TenantCounterService
+
+    if reset:
+        drop_tables()
+    create_tables()
+
+    db = SessionLocal()
+    try:
+        existing = db.scalar(select(func.count()).select_from(Task))
+        max_id = db.scalar(select(func.max(Task.id))) or 0
+        if existing >= tasks:
+            if not quiet:
+                print(f"Database already holds {existing} tasks, nothing to seed")
+            return 0
+
+        rng = random.Random(seed_value + existing)
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        remaining = tasks - existing
+        inserted = 0
+        with Timer() as timer:
+            while inserted < remaining:
+                count = min(chunk_size, remaining - inserted)
+                rows = build_rows(max_id + inserted + 1, count, rng, description_bytes,
+                                  deleted_ratio, modified_ratio, now, tenant_ids(tenants))
+                # Descriptions live in their own table (see TaskDescription)
+                texts = [(row["id"], row.pop("description")) for row in rows]
+                descriptions = [description_row(task_id, text) for task_id, text in texts if text is not None]
+                db.execute(insert(Task.__table__), rows)
+                if descriptions:
+                    db.execute(insert(TaskDescription.__table__), descriptions)
+                db.commit()
+                inserted += count
+                if not quiet:
+                    print(f"\rSeeded {existing + inserted}/{tasks} tasks", end="", flush=True)
+        # Raw inserts bypass the services: rebuild the per-tenant counters
+        counters = TenantCounterService(db)
+        for tenant_id in tenant_ids(tenants):
+            counters.reconcile(tenant_id)
+        if not quiet:
+            print(f"\nInserted {inserted} tasks in {timer.elapsed:.1f}s "
+                  f"({inserted / timer.elapsed:,.0f} rows/s)")
+        return inserted
+    finally:
+        db.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Seed the benchmark database")
+    parser.add_argument("--database-url", help="Database URL (default: local SQLite file)")
+    parser.add_argument("--tasks", type=int, default=10000, help="Total number of tasks (10k to 10M)")
+    parser.add_argument("--chunk-size", type=int, default=10000, help="Rows per insert transaction")
+    parser.add_argument("--description-bytes", type=int, default=200, help="Approximate description size")
+    parser.add_argument("--deleted-ratio", type=float, default=0.1)
+    parser.add_argument("--modified-ratio", type=float, default=0.3)
+    parser.add_argument("--tenants", type=int, default=1, help="Spread tasks over this many tenants")
+    parser.add_argument("--reset", action="store_true", help="Drop and recreate tables first")
+    args = parser.parse_args()
+
+    configure_database(args.database_url)
+    seed(
+        args.tasks,
+        chunk_size=args.chunk_size,
+        description_bytes=args.description_bytes,
+        deleted_ratio=args.deleted_ratio,
+        modified_ratio=args.modified_ratio,
+        reset=args.reset,
+        tenants=args.tenants
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+"""
+Per-call overhead of cached statements versus rebuilding queries
+
+The hot TaskService, MetricsService and TenantCounterService queries run
+as cached lambda statements or prebuilt parameterized statements, so a
+call skips building the query and looks up its compiled SQL by a cheap
+cache key. Each case times the current service method ("cached") against
+the query-builder code it replaced ("legacy") on the same data, with
+small result sets so the Python-side overhead dominates.
+
+Usage:
+    python -m benchmarks.statement_bench --tasks 10000
+    python -m benchmarks.statement_bench --cases get_counters,add_counters --iterations 5000
+"""
+
+import argparse
+import random
+from typing import Any, Callable, Dict, Tuple
+
+from benchmarks.common import configure_database, environment_info, write_results
+from benchmarks.micro_bench import time_calls
+
+
+def build_cases(db, max_id: int, rng: random.Random) -> Dict[str, Tuple[Callable[[], Any], Callable[[], Any]]]:
+    """
+    Benchmark cases keyed by name, as (legacy, cached) callables on an open session
+    """
+    from datetime import datetime, timedelta, timezone
+    from sqlalchemy import and_, case, func, select
+    from sqlalchemy.orm import joinedload
+    from app.models.task import Task
+    from app.models.tenant_counters import TenantCounters
+    from app.services.metrics_service import MetricsService
+    from app.services.task_service import TaskService
+    from app.services.tenant_counter_service import COUNTERS
+
+    task_service = TaskService(db)
+    metrics_service = MetricsService(db)
+    counters = task_service.counters
+    tenant_id = task_service.tenant_id
+
+    def tasks(*entities):
+        return db.query(*(entities or (Task,))).filter(Task.tenant_id == tenant_id)
+
+    def legacy_get_all_tasks():
+        return tasks().filter(Task.is_deleted == False).options(
+            joinedload(Task.description_row)
+        ).offset(rng.randint(0, 100)).limit(20).all()
+
+    def legacy_get_by_ids(ids):
+        return tasks().filter(and_(Task.id.in_(ids), Task.is_deleted == False)).options(
+            joinedload(Task.description_row)
+        ).all()
+
+    def cached_get_by_ids(ids):
+        # The query get_active_task_responses runs per chunk of cache misses
+        from sqlalchemy import lambda_stmt
+        return list(db.scalars(lambda_stmt(
+            lambda: select(Task)
+            .where(Task.tenant_id == tenant_id, Task.id.in_(ids), Task.is_deleted == False)
+            .options(joinedload(Task.description_row))
+        )))
+
+    def legacy_get_counters():
+        row = db.execute(
+            select(*(TenantCounters.__table__.c[name] for name in COUNTERS))
+            .where(TenantCounters.tenant_id == tenant_id)
+        ).first()
+        return dict(zip(COUNTERS, row))
+
+    def legacy_add_counters():
+        from sqlalchemy.dialects.sqlite import insert as upsert
+        table = TenantCounters.__table__
+        deltas = {"active_count": 1, "deleted_count": -1}
+        stmt = upsert(table).values({"tenant_id": tenant_id, **deltas})
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.c.tenant_id],
+            set_={**{name: table.c[name] + stmt.excluded[name] for name in deltas}, "updated_at": func.now()}
+        )
+        db.execute(stmt)
+
+    def legacy_set_deleted(ids):
+        for modified in (True, False):
+            tasks().filter(
+                and_(
+                    Task.id.in_(ids),
+                    Task.is_deleted == False,
+                    Task.modification_count > 0 if modified else Task.modification_count == 0
+                )
+            ).update({Task.is_deleted: True}, synchronize_session=False)
+
+    def legacy_completion_trends():
+        cutoff = datetime.now(timezone.utc) - timedelta(days=30)
+        return tasks(
+            func.count(Task.id),
+            func.coalesce(func.sum(case((Task.is_deleted == True, 1), else_=0)), 0),
+            func.coalesce(func.sum(case(((Task.is_deleted == False) & (Task.is_completed == True), 1), else_=0)), 0)
+        ).filter(Task.created_at >= cutoff).one()
+
+    def legacy_most_modified():
+        return tasks().filter(
+            and_(Task.is_deleted == False, Task.modification_count > 0)
+        ).order_by(Task.modification_count.desc()).limit(10).all()
+
+    def legacy_productivity():
+        today = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+        return tasks(func.count(Task.id)).filter(Task.created_at >= today).scalar()
+
+    def ids():
+        return [rng.randint(1, max_id) for _ in range(5)]
+
+    def fresh(func: Callable[[], Any]) -> Callable[[], Any]:
+        # Empty the identity map so every call pays for loading rows
+        def wrapper():
+            db.expunge_all()
+            return func()
+        return wrapper
+
+    def rolled_back(func: Callable[[], Any]) -> Callable[[], Any]:
+        # Writes are undone so every call changes the same rows
+        def wrapper():
+            func()
+            db.rollback()
+        return wrapper
+
+    # Only the SQLite upsert is reproduced for the legacy counter write
+    sqlite = db.get_bind(TenantCounters).dialect.name == "sqlite"
+    cases = {
+        "get_all_tasks": (
+            fresh(legacy_get_all_tasks),
+            fresh(lambda: task_service.get_all_tasks(skip=rng.randint(0, 100), limit=20))
+        ),
+        "get_tasks_by_ids": (fresh(lambda: legacy_get_by_ids(ids())), fresh(lambda: cached_get_by_ids(ids()))),
+        "get_counters": (legacy_get_counters, lambda: counters.get(tenant_id)),
+        "set_deleted": (
+            rolled_back(lambda: legacy_set_deleted(ids())),
+            rolled_back(lambda: task_service._set_deleted(ids(), True))
+        ),
+        "get_completion_trends": (legacy_completion_trends, lambda: metrics_service.get_completion_trends(30)),
+        "get_most_modified_tasks": (fresh(legacy_most_modified), lambda: metrics_service.get_most_modified_tasks(10)),
+        "get_productivity_metrics": (legacy_productivity, lambda: metrics_service.get_productivity_metrics()),
+    }
+    if sqlite:
+        cases["add_counters"] = (
+            rolled_back(legacy_add_counters),
+            rolled_back(lambda: counters.add(tenant_id, active_count=1, deleted_count=-1))
+        )
+    return cases
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare cached statements with rebuilt queries per call")
+    parser.add_argument("--database-url", help="Database URL (default: local SQLite file)")
+    parser.add_argument("--tasks", type=int, default=10000, help="Number of seeded tasks")
+    parser.add_argument("--iterations", type=int, default=2000, help="Timed calls per case and variant")
+    parser.add_argument("--cases", help="Comma-separated case names (default: all)")
+    parser.add_argument("--output", help="Result file (default: benchmarks/results/statements-<timestamp>.json)")
+    args = parser.parse_args()
+
+    database_url = configure_database(args.database_url)
+    from benchmarks.seed import seed
+    seed(args.tasks)
+
+    from sqlalchemy import func, select
+    from app.db.database import SessionLocal
+    from app.models.task import Task
+
+    db = SessionLocal()
+    try:
+        max_id = db.scalar(select(func.max(Task.id))) or 1
+        cases = build_cases(db, max_id, random.Random(5))
+        selected = args.cases.split(",") if args.cases else list(cases)
+        results = {}
+        for name in selected:
+            legacy, cached = cases[name]
+            results[name] = {"legacy": time_calls(legacy, args.iterations), "cached": time_calls(cached, args.iterations)}
+            before, after = results[name]["legacy"]["median_us"], results[name]["cached"]["median_us"]
+            results[name]["speedup"] = round(before / after, 2) if after else None
+            print(f"{name:26s} legacy={before:9.1f}us cached={after:9.1f}us speedup={results[name]['speedup']}x")
+    finally:
+        db.close()
+
+    payload = {
+        "benchmark": "statements",
+        "environment": environment_info(database_url),
+        "config": {"tasks": args.tasks, "iterations": args.iterations},
+        "results": results
+    }
+    print(f"Results written to {write_results('statements', payload, args.output)}")
+
+
+if __name__ == "__main__":
+    main()
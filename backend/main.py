@@ -3,9 +3,41 @@ TODO App - FastAPI Backend
 Main application entry point
 """
 
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from app.routes import tasks, metrics
+from app.routes import tasks, metrics, internal, jobs, health
+from app.middleware import (
+    ProfilingMiddleware, InstrumentedJSONResponse, CompressionMiddleware, RateLimitMiddleware
+)
+from app.services.task_batcher import task_create_batcher
+from app.jobs import analytics_snapshot_worker, archival_worker, job_runner
+from app.services.invalidation_bus import invalidation_bus, worker_count
+from app.services.warmup import warmup
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application startup and shutdown hooks"""
+    # Cache invalidations from the other worker processes (CACHE_BUS)
+    invalidation_bus.start()
+    # Periodic archival of old soft-deleted tasks (ARCHIVE_INTERVAL_SECONDS)
+    archival_worker.start()
+    # Columnar snapshot for /metrics/analytics (ANALYTICS_SNAPSHOT_INTERVAL_SECONDS)
+    analytics_snapshot_worker.start()
+    # Resume queued background jobs (POST /jobs)
+    job_runner.start()
+    # Connections, statement cache and OpenAPI schema, in the background (/readyz)
+    warmup.start(app)
+    yield
+    warmup.stop()
+    job_runner.stop()
+    analytics_snapshot_worker.stop()
+    archival_worker.stop()
+    # Flush creates still waiting for a group commit
+    task_create_batcher.close()
+    invalidation_bus.stop()
+
 
 # Create FastAPI application instance
 app = FastAPI(
@@ -13,9 +45,16 @@ app = FastAPI(
     description="A comprehensive TODO list management API",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=InstrumentedJSONResponse,
+    lifespan=lifespan
 )
 
+# Per-client token bucket and per-endpoint-class concurrency limits; shed
+# requests never reach the handlers or the database. Added before CORS so
+# 429/503 responses still carry CORS headers
+app.add_middleware(RateLimitMiddleware)
+
 # Configure CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -23,11 +62,23 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["Server-Timing", "Retry-After"],
 )
 
+# Per-request query counts and timings (Server-Timing, /internal/metrics)
+app.add_middleware(ProfilingMiddleware)
+
+# gzip/brotli/zstd response compression (COMPRESSION_*); outermost so the
+# timings above measure the handler, not the compressor
+app.add_middleware(CompressionMiddleware)
+
 # Include routers
 app.include_router(tasks.router)
 app.include_router(metrics.router)
+app.include_router(jobs.router)
+app.include_router(internal.router)
+# /livez and /readyz probes
+app.include_router(health.router)
 
 @app.get("/")
 async def root():
@@ -36,9 +87,12 @@ async def root():
 
 @app.get("/health")
 async def health_check():
-    """Health check endpoint"""
+    """Health check endpoint (see /livez and /readyz for probes)"""
     return {"status": "healthy", "message": "API is operational"}
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # WEB_CONCURRENCY=auto runs one worker process per CPU core
+    workers = worker_count()
+    # Worker processes import the app themselves, so they need the import string
+    uvicorn.run("main:app" if workers > 1 else app, host="0.0.0.0", port=8000, workers=workers)
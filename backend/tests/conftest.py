@@ -0,0 +1,67 @@
+"""
+Shared fixtures: every test runs against a fresh embedded SQLite database
+
+Settings are module constants read at import time, so the environment is
+set here before anything from ``app`` is imported.
+"""
+
+import os
+import tempfile
+
+_DATA_DIR = tempfile.mkdtemp(prefix="todo-tests-")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_DATA_DIR, 'test.db')}"
+os.environ["JOB_EXPORT_DIR"] = os.path.join(_DATA_DIR, "exports")
+os.environ["ANALYTICS_SNAPSHOT_DIR"] = os.path.join(_DATA_DIR, "analytics_snapshots")
+os.environ["RATE_LIMIT_ENABLED"] = "false"
+os.environ["WARMUP_ENABLED"] = "false"
+os.environ["TASK_CREATE_BATCHING"] = "false"
+
+from typing import List, Optional
+
+import pytest
+from fastapi.testclient import TestClient
+
+import app.models  # noqa: F401  (registers every table)
+from app.db.database import SessionLocal, create_tables, drop_tables
+from app.db.tenancy import DEFAULT_TENANT_ID
+from app.models.task import Task
+from app.schemas.task import TaskCreate
+from app.services.single_flight import read_flights
+from app.services.task_cache import task_cache
+from app.services.task_service import TaskService
+
+
+@pytest.fixture(autouse=True)
+def database():
+    """Create the schema for one test and drop it afterwards"""
+    create_tables()
+    # IDs restart in every test: nothing cached may survive from the last one
+    task_cache.clear()
+    read_flights.forget()
+    yield
+    drop_tables()
+
+
+@pytest.fixture
+def db():
+    """Database session closed after the test"""
+    session = SessionLocal()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def client():
+    """API client (the lifespan's background workers are not started)"""
+    from main import app
+    return TestClient(app)
+
+
+def create_tasks(db, count: int, tenant_id: str = DEFAULT_TENANT_ID,
+                 description: Optional[str] = None) -> List[Task]:
+    """Create ``count`` tasks titled task-0, task-1, ... through TaskService"""
+    task_service = TaskService(db, tenant_id)
+    return [
+        task_service.create_task(TaskCreate(title=f"task-{index}", description=description))
+        for index in range(count)
+    ]
@@ -0,0 +1,116 @@
+"""
+Analytics snapshot builds and the /metrics/analytics endpoints
+"""
+
+import os
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import update
+
+from app.models.task import Task
+from app.schemas.task import TaskUpdate
+from app.services import task_snapshot as task_snapshot_module
+from app.services.archive_service import ArchiveService
+from app.services.task_service import TaskService
+from app.services.task_snapshot import build_snapshot, snapshot_store
+
+from conftest import create_tasks
+
+pytest.importorskip("numpy")
+
+
+def _archive(db, task_id: int) -> None:
+    TaskService(db).delete_task(task_id)
+    db.execute(
+        update(Task).where(Task.id == task_id)
+        .values(updated_at=datetime.now(timezone.utc) - timedelta(days=60))
+    )
+    db.commit()
+    assert ArchiveService(db).archive_deleted_tasks(older_than_days=30, pause_ms=0) == 1
+
+
+@pytest.fixture
+def snapshot_dir(tmp_path, monkeypatch):
+    """Snapshot directory of the API, empty for each test"""
+    monkeypatch.setattr(snapshot_store, "directory", str(tmp_path))
+    return str(tmp_path)
+
+
+def test_build_counts_live_and_archived_tasks(db, snapshot_dir):
+    ids = [task.id for task in create_tasks(db, 4)]
+    create_tasks(db, 2, tenant_id="other")
+    _archive(db, ids[0])
+    # Left behind by a crashed build: removed once old enough
+    stale = os.path.join(snapshot_dir, ".snapshot-crashed")
+    recent = os.path.join(snapshot_dir, ".snapshot-building")
+    os.makedirs(stale)
+    os.makedirs(recent)
+    long_ago = time.time() - task_snapshot_module._STALE_BUILD_SECONDS - 60
+    os.utime(stale, (long_ago, long_ago))
+
+    snapshot = build_snapshot(snapshot_dir, chunk_size=2)
+    assert snapshot.rows == 6
+    assert {tenant: end - start for tenant, (start, end) in snapshot.tenants.items()} == {"default": 4, "other": 2}
+    assert int(snapshot.tenant_columns("default")["is_deleted"].sum()) == 1
+    assert not os.path.exists(stale)
+    assert os.path.exists(recent)
+    assert snapshot_store.current_name() == snapshot.name
+
+
+def test_build_reads_one_consistent_state(db, snapshot_dir, monkeypatch):
+    ids = [task.id for task in create_tasks(db, 4)]
+    read_chunks = task_snapshot_module._read_chunks
+
+    def archive_midway(conn, model, criterion, chunk_size):
+        for index, rows in enumerate(read_chunks(conn, model, criterion, chunk_size)):
+            yield rows
+            if model is Task and index == 0:
+                # Moved to tasks_archive after its live row was read
+                _archive(db, ids[0])
+
+    monkeypatch.setattr(task_snapshot_module, "_read_chunks", archive_midway)
+    snapshot = build_snapshot(snapshot_dir, chunk_size=2)
+    assert snapshot.rows == 4
+
+
+def test_failed_build_leaves_nothing_behind(db, snapshot_dir, monkeypatch):
+    create_tasks(db, 2)
+
+    def fail(*args, **kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(task_snapshot_module.json, "dump", fail)
+    with pytest.raises(OSError):
+        build_snapshot(snapshot_dir)
+    assert os.listdir(snapshot_dir) == []
+
+
+def test_analytics_endpoints_read_the_snapshot(db, client, snapshot_dir):
+    assert client.get("/metrics/analytics/snapshot").status_code == 503
+
+    ids = [task.id for task in create_tasks(db, 5)]
+    task_service = TaskService(db)
+    for task_id in ids[:3]:
+        task_service.update_task(task_id, TaskUpdate(description="edited"))
+    task_service.delete_task(ids[4])
+    create_tasks(db, 3, tenant_id="other")
+    build_snapshot(snapshot_dir)
+
+    info = client.get("/metrics/analytics/snapshot").json()
+    assert (info["rows"], info["tenant_rows"]) == (8, 5)
+    assert client.get("/metrics/analytics/snapshot", headers={"X-Tenant-ID": "other"}).json()["tenant_rows"] == 3
+
+    histogram = client.get("/metrics/analytics/modifications").json()
+    assert histogram["tasks"] == 4
+    assert [bucket["count"] for bucket in histogram["buckets"][:2]] == [1, 3]
+    assert client.get("/metrics/analytics/modifications", params={"include_deleted": True}).json()["tasks"] == 5
+
+    lifetimes = client.get("/metrics/analytics/lifetimes").json()
+    assert (lifetimes["of"], lifetimes["tasks"]) == ("deleted", 1)
+
+    rollup = client.get("/metrics/analytics/rollup", params={"bucket": "day", "periods": 2}).json()
+    assert rollup["periods"][-1]["created"] == 5
+    assert rollup["periods"][-1]["deleted"] == 1
+    assert client.get("/metrics/analytics/rollup", params={"bucket": "year"}).status_code == 422
@@ -0,0 +1,114 @@
+"""
+Archival of old soft-deleted tasks and restoring them
+"""
+
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import inspect, select, text, update
+
+from app.db.partitions import PARTITIONED_TABLE
+from app.models.task import Task
+from app.models.task_archive import TaskArchive
+from app.schemas.task import TaskUpdate
+from app.services.archive_service import ARCHIVED_COLUMNS, ArchiveService
+from app.services.task_service import TaskService
+
+from conftest import create_tasks
+
+
+def _delete_long_ago(db, task_service: TaskService, task_ids, days: int = 60) -> None:
+    for task_id in task_ids:
+        assert task_service.delete_task(task_id)
+    db.execute(
+        update(Task).where(Task.id.in_(task_ids))
+        .values(updated_at=datetime.now(timezone.utc) - timedelta(days=days))
+    )
+    db.commit()
+
+
+def test_archive_and_restore_round_trip(db):
+    task_service = TaskService(db)
+    first, second, _ = (task.id for task in create_tasks(db, 3, description="kept while archived"))
+    task_service.update_task(first, TaskUpdate(title="edited"))
+    _delete_long_ago(db, task_service, [first, second])
+    counters_before = task_service.counters.get(task_service.tenant_id)
+
+    assert ArchiveService(db).archive_deleted_tasks(older_than_days=30, pause_ms=0) == 2
+    db.expunge_all()
+    assert db.get(Task, first) is None
+    assert db.get(TaskArchive, first).title == "edited"
+    # Archived tasks still count as deleted
+    assert task_service.counters.get(task_service.tenant_id) == counters_before
+    assert task_service.counters.count(task_service.tenant_id) == counters_before
+
+    restored = task_service.restore_task(first)
+    assert restored is not None
+    assert (restored.title, restored.description) == ("edited", "kept while archived")
+    assert (restored.is_deleted, restored.modification_count) == (False, 1)
+    assert db.get(TaskArchive, first) is None
+
+    assert task_service.bulk_restore_tasks([second]) == 1
+    counters = task_service.counters.get(task_service.tenant_id)
+    assert counters == task_service.counters.count(task_service.tenant_id)
+    assert (counters["active_count"], counters["deleted_count"], counters["modified_count"]) == (3, 0, 1)
+
+
+def test_recent_deletes_are_not_archived(db):
+    task_service = TaskService(db)
+    task_id = create_tasks(db, 1)[0].id
+    task_service.delete_task(task_id)
+    assert ArchiveService(db).archive_deleted_tasks(older_than_days=30, pause_ms=0) == 0
+    assert db.get(TaskArchive, task_id) is None
+
+
+def test_archived_task_is_restored_only_by_its_tenant(db):
+    task_service = TaskService(db, "acme")
+    task_id = create_tasks(db, 1, tenant_id="acme")[0].id
+    _delete_long_ago(db, task_service, [task_id])
+    ArchiveService(db).archive_deleted_tasks(older_than_days=30, pause_ms=0)
+
+    assert TaskService(db, "other").restore_task(task_id) is None
+    assert db.get(TaskArchive, task_id) is not None
+    assert task_service.restore_task(task_id) is not None
+
+
+def test_archived_ids_are_never_reissued(db, client):
+    task_service = TaskService(db, "acme")
+    newest = create_tasks(db, 2, tenant_id="acme", description="acme only")[-1].id
+    task_service.update_task(newest, TaskUpdate(title="edited"))
+    _delete_long_ago(db, task_service, [newest])
+    assert ArchiveService(db).archive_deleted_tasks(older_than_days=30, pause_ms=0) == 1
+
+    response = client.post("/tasks/", json={"title": "fresh"})
+    assert response.status_code == 201
+    fresh = response.json()
+    assert fresh["id"] > newest
+    assert fresh["description"] is None
+    # Its history starts from scratch
+    assert client.put(f"/tasks/{fresh['id']}", json={"title": "fresh, edited"}).status_code == 200
+    assert client.get(f"/tasks/{fresh['id']}/history").json()["current_revision"] == 1
+
+    restored = task_service.restore_task(newest)
+    assert (restored.id, restored.title, restored.description) == (newest, "edited", "acme only")
+    assert task_service.get_task_revision(newest, 0).title == "task-1"
+
+
+def test_leftover_swap_table_is_drained_not_dropped(db):
+    """Rows of a partition swap interrupted before the copy end up archived"""
+    task_service = TaskService(db)
+    ids = [task.id for task in create_tasks(db, 3)]
+    task_service.delete_task(ids[0])
+    task_service.delete_task(ids[1])
+    swap_table = f"{PARTITIONED_TABLE}_partition_swap"
+    columns = ", ".join(ARCHIVED_COLUMNS)
+    # State after EXCHANGE/DROP PARTITION: the rows only exist in the swap
+    # table, and an earlier interrupted drain already archived the first one
+    db.execute(text(f"CREATE TABLE {swap_table} AS SELECT * FROM tasks"))
+    db.execute(text(f"DELETE FROM tasks WHERE id IN ({ids[0]}, {ids[1]})"))
+    db.execute(text(f"INSERT INTO tasks_archive ({columns}) SELECT {columns} FROM {swap_table} WHERE id = {ids[0]}"))
+    db.commit()
+
+    assert ArchiveService(db)._drain_swap_table(swap_table) == 1
+    assert sorted(db.scalars(select(TaskArchive.id))) == ids[:2]
+    assert db.get(Task, ids[2]) is not None
+    assert not inspect(db.connection()).has_table(swap_table)
@@ -0,0 +1,57 @@
+"""
+GET/POST /tasks/batch: request order, null entries and missing_ids
+"""
+
+from app.schemas.task import BATCH_GET_MAX_IDS
+from app.services.task_service import TaskService
+
+from conftest import create_tasks
+
+
+def _titles(body: dict) -> list:
+    return [task and task["title"] for task in body["tasks"]]
+
+
+def test_results_follow_request_order_with_missing_ids(db, client):
+    first, second, third = (task.id for task in create_tasks(db, 3))
+    TaskService(db).delete_task(second)
+    foreign = create_tasks(db, 1, tenant_id="other")[0].id
+    ids = [third, first, second, 999, first, foreign]
+
+    response = client.get(f"/tasks/batch?ids={','.join(map(str, ids))}")
+    assert response.status_code == 200
+    body = response.json()
+    assert _titles(body) == ["task-2", "task-0", None, None, "task-0", None]
+    assert body["missing_ids"] == [second, 999, foreign]
+
+    # Same answer with the IDs in the body, and served again from the cache
+    for _ in range(2):
+        assert client.post("/tasks/batch", json={"task_ids": ids}).json() == body
+
+
+def test_repeated_ids_parameters_are_combined(db, client):
+    first, second = (task.id for task in create_tasks(db, 2))
+    response = client.get(f"/tasks/batch?ids={second}&ids={first}")
+    assert _titles(response.json()) == ["task-1", "task-0"]
+
+
+def test_batch_reflects_updates(db, client):
+    task_id = create_tasks(db, 1)[0].id
+    assert _titles(client.get(f"/tasks/batch?ids={task_id}").json()) == ["task-0"]
+    client.put(f"/tasks/{task_id}", json={"title": "renamed"})
+    assert _titles(client.get(f"/tasks/batch?ids={task_id}").json()) == ["renamed"]
+
+
+def test_invalid_id_lists_are_rejected(client):
+    assert client.get("/tasks/batch").status_code == 422
+    assert client.get("/tasks/batch?ids=1,x").status_code == 422
+    too_many = ",".join(["1"] * (BATCH_GET_MAX_IDS + 1))
+    assert client.get(f"/tasks/batch?ids={too_many}").status_code == 422
+    assert client.post("/tasks/batch", json={"task_ids": []}).status_code == 422
+
+
+def test_chunked_lookup_keeps_order(db):
+    ids = [task.id for task in create_tasks(db, 7)]
+    requested = list(reversed(ids)) + [0]
+    responses = TaskService(db).get_active_task_responses(requested, chunk_size=2)
+    assert [response and response.id for response in responses] == list(reversed(ids)) + [None]
@@ -0,0 +1,54 @@
+"""
+Response compression: every streamed chunk is decodable on arrival
+"""
+
+import asyncio
+import zlib
+
+import pytest
+
+from app.middleware.compression import CompressionMiddleware, StreamCompressor, brotli, zstandard
+
+# brotli and zstandard are optional dependencies
+ENCODINGS = ["gzip"] + (["br"] if brotli else []) + (["zstd"] if zstandard else [])
+CHUNKS = [b'{"row": %d, "title": "task"}\n' % index for index in range(3)]
+
+
+def _decompressor(encoding: str):
+    if encoding == "gzip":
+        return zlib.decompressobj(16 + zlib.MAX_WBITS).decompress
+    if encoding == "br":
+        return brotli.Decompressor().process
+    return zstandard.ZstdDecompressor().decompressobj().decompress
+
+
+@pytest.mark.parametrize("encoding", ENCODINGS)
+def test_flushed_chunks_decode_one_by_one(encoding):
+    compressor = StreamCompressor(encoding)
+    decompress = _decompressor(encoding)
+    for chunk in CHUNKS:
+        assert decompress(compressor.compress(chunk) + compressor.flush()) == chunk
+    assert decompress(compressor.finish()) == b""
+
+
+@pytest.mark.parametrize("encoding", ENCODINGS)
+def test_streaming_response_sends_every_chunk_at_once(encoding):
+    async def app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200,
+                    "headers": [(b"content-type", b"application/x-ndjson")]})
+        for chunk in CHUNKS:
+            await send({"type": "http.response.body", "body": chunk, "more_body": True})
+        await send({"type": "http.response.body", "body": b""})
+
+    sent = []
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {"type": "http", "headers": [(b"accept-encoding", encoding.encode())]}
+    asyncio.run(CompressionMiddleware(app, encodings=[encoding])(scope, None, send))
+
+    assert dict(sent[0]["headers"])[b"content-encoding"] == encoding.encode()
+    decompress = _decompressor(encoding)
+    bodies = [message["body"] for message in sent[1:]]
+    assert [decompress(body) for body in bodies[:len(CHUNKS)]] == CHUNKS
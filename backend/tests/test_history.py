@@ -0,0 +1,91 @@
+"""
+Task revision history: every past version is rebuilt exactly
+"""
+
+from app.schemas.task import TaskUpdate
+from app.services.history_service import TASK_HISTORY_SNAPSHOT_INTERVAL
+from app.services.task_service import TaskService
+
+from conftest import create_tasks
+
+
+def _edit_repeatedly(db, edits: int):
+    """Apply ``edits`` updates and return the task ID and every state, oldest first"""
+    task_service = TaskService(db)
+    task_id = create_tasks(db, 1, description="first draft " * 30)[0].id
+    states = [{"title": "task-0", "description": "first draft " * 30}]
+    for revision in range(1, edits + 1):
+        state = dict(states[-1])
+        if revision == edits - 1:
+            state["description"] = None
+        elif state["description"] is None:
+            state["description"] = "rewritten"
+        elif revision % 3:
+            state["description"] = state["description"].replace("draft", f"draft {revision}", 1)
+        else:
+            state["title"] = f"title {revision}"
+        task_service.update_task(task_id, TaskUpdate(**state))
+        states.append(state)
+    return task_id, states
+
+
+def test_every_revision_is_reconstructed(db):
+    # Crosses several full snapshots
+    edits = TASK_HISTORY_SNAPSHOT_INTERVAL * 2 + 5
+    task_id, states = _edit_repeatedly(db, edits)
+    task_service = TaskService(db)
+
+    for revision, state in enumerate(states):
+        version = task_service.get_task_revision(task_id, revision)
+        assert (version.title, version.description) == (state["title"], state["description"]), revision
+    assert task_service.get_task_revision(task_id, edits + 1) is None
+
+
+def test_history_pages_walk_back_to_creation(db):
+    task_id, states = _edit_repeatedly(db, 12)
+    task_service = TaskService(db)
+
+    seen = []
+    before = None
+    while True:
+        page = task_service.get_task_history(task_id, limit=5, before=before)
+        assert page.current_revision == 12
+        seen.extend(page.revisions)
+        if page.next_before is None:
+            break
+        before = page.next_before
+
+    assert [version.revision for version in seen] == list(range(12, -1, -1))
+    assert [(version.title, version.description) for version in seen] == [
+        (state["title"], state["description"]) for state in reversed(states)
+    ]
+    assert seen[0].changed_fields == ["description"]
+    assert seen[1].changed_fields == ["description"]
+
+
+def test_changed_fields_name_only_what_changed(db):
+    task_service = TaskService(db)
+    task_id = create_tasks(db, 1, description="same")[0].id
+    task_service.update_task(task_id, TaskUpdate(title="renamed"))
+    assert task_service.get_task_revision(task_id, 1).changed_fields == ["title"]
+
+
+def test_history_of_deleted_or_foreign_task_is_hidden(db, client):
+    task_id = create_tasks(db, 1)[0].id
+    assert client.get(f"/tasks/{task_id}/history").status_code == 200
+    assert client.get(f"/tasks/{task_id}/history", headers={"X-Tenant-ID": "other"}).status_code == 404
+    TaskService(db).delete_task(task_id)
+    assert client.get(f"/tasks/{task_id}/history").status_code == 404
+    assert client.get(f"/tasks/{task_id}/history/0").status_code == 404
+
+
+def test_completion_only_edits_are_recorded(db):
+    task_service = TaskService(db)
+    task_id = create_tasks(db, 1, description="same")[0].id
+    task_service.update_task(task_id, TaskUpdate(is_completed=True))
+    task_service.update_task(task_id, TaskUpdate(title="renamed"))
+
+    first = task_service.get_task_revision(task_id, 1)
+    assert (first.title, first.is_completed, first.changed_fields) == ("task-0", True, ["is_completed"])
+    assert task_service.get_task_revision(task_id, 0).is_completed is False
+    assert task_service.get_task_revision(task_id, 2).is_completed is True
@@ -0,0 +1,50 @@
+"""
+Cache invalidation across workers through the database bus
+"""
+
+import time
+
+from app.services.invalidation_bus import CACHE_BUS_POLL_MS, DatabaseBus, invalidation_bus
+from app.services.task_cache import TaskCache
+
+from conftest import create_tasks
+from test_task_cache import _response
+
+# Documented bound: another worker stops serving a stale task within this
+STALENESS_BOUND = 3 * CACHE_BUS_POLL_MS / 1000.0
+
+
+def _worker(origin: str):
+    """Bus and task cache of one simulated worker process"""
+    bus = DatabaseBus()
+    cache = TaskCache(max_size=10)
+    cache.attach(bus, "tasks")
+    bus.start()
+    bus.origin = origin
+    return bus, cache
+
+
+def test_write_in_one_worker_reaches_another_within_the_bound():
+    writer_bus, writer = _worker("worker-a")
+    reader_bus, reader = _worker("worker-b")
+    try:
+        reader.put(1, _response(1), reader.token())
+        assert reader.get(1) is not None
+
+        published = time.monotonic()
+        writer.invalidate(1)
+        while reader.get(1) is not None:
+            assert time.monotonic() - published < STALENESS_BOUND, "stale entry served past the bound"
+            time.sleep(0.005)
+        assert writer.get(1) is None
+    finally:
+        writer_bus.stop()
+        reader_bus.stop()
+
+
+def test_creating_a_task_is_published_on_the_bus(db, monkeypatch):
+    published = []
+    subscribers = invalidation_bus._subscribers["tasks"]
+    monkeypatch.setitem(invalidation_bus._subscribers, "tasks", [*subscribers, published.append])
+    create_tasks(db, 1)
+    assert published == [[]]
@@ -0,0 +1,60 @@
+"""
+Request profiling: stack sampling scope and the /internal/metrics endpoint
+"""
+
+import asyncio
+import threading
+
+from sqlalchemy import text
+
+from app.db.database import get_engine
+from app.db.instrumentation import RequestStats, current_request_stats
+from app.middleware.profiling import StackSampler
+from app.routes import internal
+
+
+def test_sampler_keeps_to_the_request_threads():
+    stats = RequestStats()
+
+    async def request():
+        sampler = StackSampler(0.001, stats)
+        loop_thread = threading.get_ident()
+        assert sampler._is_request_thread(loop_thread)
+
+        async def other_request():
+            return sampler._is_request_thread(loop_thread)
+
+        # The loop thread running another request's task is not sampled
+        assert not await asyncio.create_task(other_request())
+
+        worker = threading.Thread(target=lambda: None)
+        worker.start()
+        worker.join()
+        assert not sampler._is_request_thread(worker.ident)
+        stats.thread_ids.add(worker.ident)
+        assert sampler._is_request_thread(worker.ident)
+
+    asyncio.run(request())
+
+
+def test_statements_register_their_thread():
+    stats = RequestStats()
+    token = current_request_stats.set(stats)
+    try:
+        with get_engine().connect() as conn:
+            conn.execute(text("SELECT 1"))
+    finally:
+        current_request_stats.reset(token)
+    assert stats.thread_ids == {threading.get_ident()}
+
+
+def test_metrics_need_the_configured_token(client, monkeypatch):
+    monkeypatch.setattr(internal, "INTERNAL_METRICS_TOKEN", "")
+    assert client.get("/internal/metrics").status_code == 404
+
+    monkeypatch.setattr(internal, "INTERNAL_METRICS_TOKEN", "s3cret")
+    assert client.get("/internal/metrics").status_code == 401
+    assert client.get("/internal/metrics", headers={"Authorization": "Bearer wrong"}).status_code == 401
+    response = client.get("/internal/metrics", headers={"Authorization": "Bearer s3cret"})
+    assert response.status_code == 200
+    assert "http_request_duration_seconds" in response.text
@@ -0,0 +1,116 @@
+"""
+Task search: index planning, TASK_QUERY_POLICY and filtered results
+"""
+
+import logging
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import text
+
+from app.db import sqlite as sqlite_module
+from app.db.database import get_engine, get_read_engine
+from app.db.sqlite import SEARCH_INDEX_TABLE, create_search_index, drop_search_index, search_index_available
+from app.schemas.task import TaskSearchRequest, TaskUpdate
+from app.services import task_service as task_service_module
+from app.services.task_service import TaskService, UnindexedSearchError
+
+from conftest import create_tasks
+
+YESTERDAY = datetime.now(timezone.utc) - timedelta(days=1)
+
+
+def test_single_range_uses_its_index_without_residual(db):
+    plan = TaskService(db).plan_search(TaskSearchRequest(updated_after=YESTERDAY))
+    assert (plan.sort_by, plan.index, plan.residual) == ("updated_at", "ix_tasks_tenant_deleted_updated", [])
+
+    plan = TaskService(db).plan_search(TaskSearchRequest(is_completed=True, min_modifications=2))
+    assert plan.index == "ix_tasks_tenant_deleted_completed_modifications"
+    assert plan.residual == []
+
+
+def test_range_on_another_column_is_residual(db):
+    plan = TaskService(db).plan_search(
+        TaskSearchRequest(created_after=YESTERDAY, sort_by="modification_count", sort_order="asc")
+    )
+    assert plan.index == "ix_tasks_tenant_deleted_modifications"
+    assert not plan.descending
+    assert plan.residual == ["created_at range"]
+
+
+def test_short_title_is_residual_but_indexed_title_is_not(db):
+    task_service = TaskService(db)
+    assert task_service.plan_search(TaskSearchRequest(title="report")).residual == []
+    assert task_service.plan_search(TaskSearchRequest(title="re")).residual == ["title substring"]
+
+
+def test_policy_warn_logs_residual_searches(db, monkeypatch, caplog):
+    monkeypatch.setattr(task_service_module, "TASK_QUERY_POLICY", "warn")
+    with caplog.at_level(logging.WARNING, logger=task_service_module.__name__):
+        TaskService(db).plan_search(TaskSearchRequest(created_after=YESTERDAY, sort_by="updated_at"))
+    assert "created_at range" in caplog.text
+
+
+def test_policy_off_is_silent(db, monkeypatch, caplog):
+    monkeypatch.setattr(task_service_module, "TASK_QUERY_POLICY", "off")
+    with caplog.at_level(logging.WARNING, logger=task_service_module.__name__):
+        TaskService(db).plan_search(TaskSearchRequest(created_after=YESTERDAY, sort_by="updated_at"))
+    assert caplog.text == ""
+
+
+def test_policy_reject_refuses_residual_searches(db, client, monkeypatch):
+    monkeypatch.setattr(task_service_module, "TASK_QUERY_POLICY", "reject")
+    with pytest.raises(UnindexedSearchError):
+        TaskService(db).plan_search(TaskSearchRequest(created_after=YESTERDAY, sort_by="updated_at"))
+
+    response = client.get("/tasks/search", params={"created_after": YESTERDAY.isoformat(), "sort_by": "updated_at"})
+    assert response.status_code == 400
+    assert client.get("/tasks/search", params={"created_after": YESTERDAY.isoformat()}).status_code == 200
+
+
+def test_filters_sort_and_pagination(db, client):
+    task_service = TaskService(db)
+    ids = [task.id for task in create_tasks(db, 6)]
+    for index, task_id in enumerate(ids):
+        for _ in range(index):
+            task_service.update_task(task_id, TaskUpdate(description=f"edit {index}"))
+    task_service.update_task(ids[5], TaskUpdate(is_completed=True))
+    task_service.delete_task(ids[4])
+
+    body = client.get("/tasks/search", params={
+        "min_modifications": 2, "is_completed": False, "sort_by": "modification_count", "size": 2
+    }).json()
+    assert body["total"] == 2
+    assert [task["id"] for task in body["tasks"]] == [ids[3], ids[2]]
+
+    body = client.get("/tasks/search", params={"min_modifications": 1, "sort_order": "asc", "size": 2, "page": 2}).json()
+    assert body["total"] == 4
+    assert [task["modification_count"] for task in body["tasks"]] == [3, 6]
+
+
+def test_update_rejects_null_for_required_fields(db, client):
+    task_id = create_tasks(db, 1, description="text")[0].id
+    assert client.put(f"/tasks/{task_id}", json={"is_completed": None}).status_code == 422
+    assert client.put(f"/tasks/{task_id}", json={"title": None}).status_code == 422
+
+    response = client.put(f"/tasks/{task_id}", json={"description": None, "is_completed": True})
+    assert response.status_code == 200
+    assert (response.json()["description"], response.json()["is_completed"]) == (None, True)
+
+
+def test_search_index_check_follows_index_changes(monkeypatch):
+    engine = get_read_engine()
+    assert search_index_available(engine)
+    with get_engine().begin() as conn:
+        drop_search_index(conn)
+    assert not search_index_available(engine)
+    with get_engine().begin() as conn:
+        create_search_index(conn)
+    assert search_index_available(engine)
+
+    # Dropped by another process: noticed once the cached answer expires
+    with get_engine().begin() as conn:
+        conn.execute(text(f"DROP TABLE {SEARCH_INDEX_TABLE}"))
+    assert search_index_available(engine)
+    monkeypatch.setattr(sqlite_module, "SQLITE_FTS_RECHECK_SECONDS", 0)
+    assert not search_index_available(engine)
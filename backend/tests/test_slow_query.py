@@ -0,0 +1,40 @@
+"""
+Slow-query EXPLAIN capture never disturbs the caller's transaction
+"""
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+
+from app.db import slow_query
+
+
+def _engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'explain.db'}")
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)"))
+    return engine
+
+
+def test_plan_is_captured(tmp_path):
+    with _engine(tmp_path).connect() as conn:
+        plan = slow_query.explain(conn, "SELECT * FROM items WHERE id = ?", (1,))
+    assert plan and "EXPLAIN failed" not in str(plan)
+
+
+def test_failed_explain_rolls_back_to_its_savepoint(tmp_path, monkeypatch):
+    # Same code path as PostgreSQL, where the failure would abort the transaction
+    monkeypatch.setattr(slow_query, "_SAVEPOINT_DIALECTS", ("sqlite",))
+    engine = _engine(tmp_path)
+    with engine.connect() as conn:
+        conn.execute(text("INSERT INTO items (name) VALUES ('kept')"))
+        plan = slow_query.explain(conn, "SELECT * FROM missing", ())
+        assert plan[0][0].startswith("EXPLAIN failed")
+        assert "EXPLAIN failed" not in str(slow_query.explain(conn, "SELECT * FROM items", ()))
+        # Both savepoints are gone again
+        with pytest.raises(OperationalError):
+            conn.exec_driver_sql(f"RELEASE SAVEPOINT {slow_query._EXPLAIN_SAVEPOINT}")
+        conn.execute(text("INSERT INTO items (name) VALUES ('after')"))
+        conn.commit()
+    with engine.connect() as conn:
+        assert conn.execute(text("SELECT name FROM items ORDER BY id")).scalars().all() == ["kept", "after"]
@@ -0,0 +1,44 @@
+"""
+Group-commit batcher: every caller gets back the row inserted for it
+"""
+
+from app.db.database import SessionLocal
+from app.models.task import Task
+from app.schemas.task import TaskCreate
+from app.services.task_batcher import TaskCreateBatcher
+from app.services.tenant_counter_service import TenantCounterService
+
+
+def test_insert_maps_ids_by_position_with_duplicate_titles(db):
+    batcher = TaskCreateBatcher(SessionLocal, enabled=True)
+    items = [(TaskCreate(title="same", description=f"description {index}"), "default") for index in range(20)]
+    tasks = batcher._insert(items)
+
+    assert [task.description for task in tasks] == [item.description for item, _ in items]
+    assert len({task.id for task in tasks}) == len(items)
+    for task in tasks:
+        assert db.get(Task, task.id).description == task.description
+
+
+def test_concurrent_creates_each_get_their_own_task(db):
+    batcher = TaskCreateBatcher(SessionLocal, batch_size=50, max_latency_ms=50, enabled=True)
+    requests = [
+        (TaskCreate(title=f"title {index % 3}", description=f"request {index}"), f"tenant-{index % 2}")
+        for index in range(60)
+    ]
+    try:
+        futures = [batcher.submit(task_data, tenant_id) for task_data, tenant_id in requests]
+        tasks = [future.result(timeout=10) for future in futures]
+    finally:
+        batcher.close()
+
+    for (task_data, tenant_id), task in zip(requests, tasks):
+        stored = db.get(Task, task.id)
+        assert (task.title, task.description, task.tenant_id) == (task_data.title, task_data.description, tenant_id)
+        assert (stored.title, stored.description, stored.tenant_id) == (task_data.title, task_data.description, tenant_id)
+    assert len({task.id for task in tasks}) == len(requests)
+
+    counters = TenantCounterService(db)
+    for tenant_id in ("tenant-0", "tenant-1"):
+        assert counters.get(tenant_id)["created_count"] == 30
+        assert counters.get(tenant_id) == counters.count(tenant_id)
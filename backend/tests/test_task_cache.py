@@ -0,0 +1,96 @@
+"""
+Read-through task cache: invalidation and stale-put protection
+"""
+
+from datetime import datetime, timezone
+
+from app.schemas.task import TaskResponse
+from app.services.task_cache import TaskCache
+
+from conftest import create_tasks
+
+
+def _response(task_id: int, title: str = "task") -> TaskResponse:
+    now = datetime.now(timezone.utc)
+    return TaskResponse(
+        id=task_id, tenant_id="default", title=title, description=None, is_deleted=False,
+        is_completed=False, modification_count=0, created_at=now, updated_at=now
+    )
+
+
+def test_put_then_get_hits():
+    cache = TaskCache(max_size=10)
+    assert cache.get(1) is None
+    assert cache.put(1, _response(1), cache.token())
+    assert cache.get(1).id == 1
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_invalidate_drops_entry():
+    cache = TaskCache(max_size=10)
+    cache.put(1, _response(1), cache.token())
+    cache.put(2, _response(2), cache.token())
+    cache.invalidate(1)
+    assert cache.get(1) is None
+    assert cache.get(2) is not None
+
+
+def test_put_with_token_from_before_invalidation_is_rejected():
+    cache = TaskCache(max_size=10)
+    token = cache.token()
+    # A write lands while the reader is still querying
+    cache.invalidate(1)
+    assert not cache.put(1, _response(1, "stale"), token)
+    assert cache.get(1) is None
+    assert cache.put(1, _response(1, "fresh"), cache.token())
+    assert cache.get(1).title == "fresh"
+
+
+def test_invalidating_other_keys_keeps_put_valid():
+    cache = TaskCache(max_size=10)
+    token = cache.token()
+    cache.invalidate(2)
+    assert cache.put(1, _response(1), token)
+
+
+def test_clear_rejects_every_older_token():
+    cache = TaskCache(max_size=10)
+    cache.put(1, _response(1), cache.token())
+    token = cache.token()
+    cache.clear()
+    assert cache.get(1) is None
+    assert not cache.put(1, _response(1), token)
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = TaskCache(max_size=2)
+    cache.put(1, _response(1), cache.token())
+    cache.put(2, _response(2), cache.token())
+    cache.get(1)
+    cache.put(3, _response(3), cache.token())
+    assert cache.get(2) is None
+    assert cache.get(1) is not None
+    assert cache.get(3) is not None
+
+
+def test_disabled_cache_stores_nothing():
+    cache = TaskCache(max_size=0)
+    assert not cache.put(1, _response(1), cache.token())
+    assert cache.get(1) is None
+
+
+def test_api_reads_see_updates_and_deletes(db, client):
+    task_id = create_tasks(db, 1)[0].id
+    assert client.get(f"/tasks/{task_id}").json()["title"] == "task-0"
+    # Second read is served from the cache
+    assert client.get(f"/tasks/{task_id}").json()["title"] == "task-0"
+
+    assert client.put(f"/tasks/{task_id}", json={"title": "renamed"}).status_code == 200
+    assert client.get(f"/tasks/{task_id}").json()["title"] == "renamed"
+
+    assert client.delete(f"/tasks/{task_id}").status_code == 204
+    assert client.get(f"/tasks/{task_id}").status_code == 404
+
+    assert client.post(f"/tasks/{task_id}/restore").status_code == 200
+    assert client.get(f"/tasks/{task_id}").json()["title"] == "renamed"
@@ -0,0 +1,83 @@
+"""
+Tenant counters stay equal to a recount through deletes and restores
+"""
+
+import threading
+
+from app.db.database import SessionLocal
+from app.schemas.task import TaskUpdate
+from app.services.task_service import TaskService
+
+from conftest import create_tasks
+
+
+def _assert_consistent(task_service: TaskService) -> dict:
+    counters = task_service.counters.get(task_service.tenant_id)
+    assert counters == task_service.counters.count(task_service.tenant_id)
+    return counters
+
+
+def test_repeated_delete_and_restore_count_once(db):
+    task_service = TaskService(db)
+    first, second = (task.id for task in create_tasks(db, 2))
+    task_service.update_task(first, TaskUpdate(title="edited"))
+
+    assert task_service.delete_task(first)
+    assert not task_service.delete_task(first)
+    counters = _assert_consistent(task_service)
+    assert (counters["active_count"], counters["deleted_count"], counters["modified_count"]) == (1, 1, 0)
+
+    assert task_service.restore_task(first).is_deleted is False
+    assert task_service.restore_task(first) is None
+    assert task_service.restore_task(second) is None
+    counters = _assert_consistent(task_service)
+    assert (counters["active_count"], counters["deleted_count"], counters["modified_count"]) == (2, 0, 1)
+
+
+def test_concurrent_deletes_of_one_task_count_once(db):
+    task_service = TaskService(db)
+    task_id = create_tasks(db, 3)[0].id
+    results = []
+
+    def delete() -> None:
+        session = SessionLocal()
+        try:
+            results.append(TaskService(session).delete_task(task_id))
+        finally:
+            session.close()
+
+    threads = [threading.Thread(target=delete) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results.count(True) == 1
+    counters = _assert_consistent(task_service)
+    assert (counters["active_count"], counters["deleted_count"]) == (2, 1)
+
+
+def test_other_tenants_cannot_delete_or_restore(db):
+    owner = TaskService(db, "acme")
+    task_id = create_tasks(db, 1, tenant_id="acme")[0].id
+    intruder = TaskService(db, "other")
+
+    assert not intruder.delete_task(task_id)
+    assert owner.delete_task(task_id)
+    assert intruder.restore_task(task_id) is None
+    _assert_consistent(owner)
+    _assert_consistent(intruder)
+    assert owner.counters.get("acme")["deleted_count"] == 1
+    assert intruder.counters.get("other")["deleted_count"] == 0
+
+
+def test_bulk_delete_and_restore_keep_counters_consistent(db):
+    task_service = TaskService(db)
+    ids = [task.id for task in create_tasks(db, 10)]
+    task_service.update_task(ids[0], TaskUpdate(title="edited"))
+
+    assert task_service.bulk_delete_tasks(ids[:6] + ids[:3], chunk_size=4) == 6
+    _assert_consistent(task_service)
+    assert task_service.bulk_restore_tasks(ids, chunk_size=4) == 6
+    counters = _assert_consistent(task_service)
+    assert (counters["active_count"], counters["deleted_count"], counters["modified_count"]) == (10, 0, 1)
@@ -0,0 +1,29 @@
+"""
+Startup warm-up steps
+"""
+
+from sqlalchemy import create_engine
+from sqlalchemy.pool import StaticPool
+
+from app.services import warmup as warmup_module
+from app.services.warmup import READY, Warmup
+
+
+def test_warmup_runs_every_step_on_a_pooled_database():
+    warmup = Warmup(enabled=True)
+    assert warmup.run()
+    assert warmup.status == READY
+    assert set(warmup.steps) == {"pool", "queries"}
+
+
+def test_warmup_leaves_a_shared_in_memory_connection_alone(monkeypatch):
+    # In-memory SQLite: every session uses the same connection
+    shared = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    monkeypatch.setattr(warmup_module, "get_engine", lambda: shared)
+    monkeypatch.setattr(warmup_module, "get_read_engine", lambda: shared)
+
+    warmup = Warmup(enabled=True)
+    assert warmup.run()
+    assert warmup.status == READY
+    assert "pool" not in warmup.steps
+    assert "queries" not in warmup.steps